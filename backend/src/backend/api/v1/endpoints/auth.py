@@ -1,3 +1,4 @@
+import asyncio
 from datetime import timedelta
 from typing import Annotated, Any
 
@@ -5,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 
 from backend.core.config import get_settings
-from backend.core.security import create_access_token, get_password_hash, verify_password
+from backend.core.security import create_access_token, get_password_hash, verify_password, DUMMY_PASSWORD_HASH
 from backend.dependencies.auth import get_current_user
 from backend.dependencies.services import get_firestore_client
 from backend.models.user import Token, User, UserCreate
@@ -56,10 +57,10 @@ async def login(
     OAuth2 compatible token login, get an access token for future requests.
     """
     user_data = await firestore.get_user_by_email(form_data.username)
-    if not user_data:
-        raise HTTPException(status_code=400, detail="Incorrect email or password")
-    
-    if not verify_password(form_data.password, user_data.get("hashed_password")):
+    # Always run the password check (off the event loop) so unknown emails take as long as wrong passwords
+    hashed_password = user_data.get("hashed_password") if user_data else DUMMY_PASSWORD_HASH
+    password_ok = await asyncio.to_thread(verify_password, form_data.password, hashed_password)
+    if not user_data or not password_ok:
         raise HTTPException(status_code=400, detail="Incorrect email or password")
         
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -226,7 +226,8 @@ Feel free to ask me any questions about this document!"""
                 # 1. Check if session already exists for this doc
                 existing_sessions = await chat_service.list_sessions(
                     user_id=current_user.id, 
-                    limit=20
+                    limit=20,
+                    include_documents=True
                 )
                 
                 # Check if any session is for THIS document
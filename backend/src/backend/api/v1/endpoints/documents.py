@@ -13,8 +13,10 @@ from PyPDF2 import PdfReader
 
 from backend.core.config import Settings, get_settings
 from backend.core.logging import get_logger
+from backend.core.orjson_response import ORJSONResponse
 from backend.models.document import (
     DocumentUploadResponse,
+    DocumentListItem,
     BatchUploadResponse,
     DocumentStatus,
     ClauseSummary,
@@ -133,20 +135,21 @@ async def list_documents(
             documents = await orchestrator.firestore_client.list_documents(limit=limit)
         
         # Format for frontend
-        formatted_docs = []
-        for doc in documents:
-            formatted_docs.append({
-                "doc_id": doc.get("doc_id", ""),
-                "filename": doc.get("filename", "Unknown"),
-                "status": doc.get("status", "unknown"),
-                "created_at": doc.get("created_at").isoformat() if doc.get("created_at") else None,
-                "page_count": doc.get("page_count", 0),
-                "clause_count": doc.get("clause_count", 0),
-                "language": doc.get("language", "en"),
-                "user_id": doc.get("user_id"),
-            })
+        formatted_docs = [
+            DocumentListItem(
+                doc_id=doc.get("doc_id", ""),
+                filename=doc.get("filename", "Unknown"),
+                status=doc.get("status", "unknown"),
+                created_at=doc.get("created_at").isoformat() if doc.get("created_at") else None,
+                page_count=doc.get("page_count", 0),
+                clause_count=doc.get("clause_count", 0),
+                language=doc.get("language", "en"),
+                user_id=doc.get("user_id"),
+            )
+            for doc in documents
+        ]
         
-        return {"documents": formatted_docs}
+        return ORJSONResponse({"documents": formatted_docs})
     except Exception as e:
         logger.error(f"Failed to list documents: {e}")
         raise HTTPException(
@@ -299,7 +302,9 @@ async def ingest_documents_batch(
     if max_concurrent:
         await queue_manager.update_concurrency(max_concurrent)
     
-    responses = []
+    responses: List[Optional[DocumentUploadResponse]] = []
+    # Accepted files wait here so their records can be written in one batch
+    pending = []
     
     for file in files:
         try:
@@ -353,56 +358,10 @@ async def ingest_documents_batch(
                     ))
                     continue
             
-            # Generate document ID
+            # Generate document ID; the response slot is filled once the record exists
             doc_id = str(uuid4())
-            
-            try:
-                # Create document record immediately to avoid race conditions
-                await orchestrator.firestore_client.create_document(
-                    doc_id, file.filename, len(file_content), page_count, session_id, language
-                )
-                
-                # Add to queue for processing
-                await queue_manager.add_to_queue(
-                    doc_id=doc_id,
-                    filename=file.filename,
-                    file_size=len(file_content),
-                    mime_type=file.content_type,
-                    session_id=session_id
-                )
-                
-                # Start background processing with queue management
-                await queue_manager.start_processing(
-                    doc_id,
-                    process_document_background,
-                    doc_id,
-                    file_content,
-                    file.filename,
-                    file.content_type,
-                    orchestrator,
-                    language,
-                    session_id
-                )
-                
-                responses.append(DocumentUploadResponse(
-                    doc_id=doc_id,
-                    filename=file.filename,
-                    status=DocumentStatus.PROCESSING,
-                    language=language,
-                    message="Document uploaded and queued for processing"
-                ))
-                
-                logger.info(f"Document queued for batch processing: {doc_id} ({file.filename})")
-                
-            except Exception as e:
-                logger.error(f"Failed to create document record for {file.filename}: {e}")
-                responses.append(DocumentUploadResponse(
-                    doc_id="",
-                    filename=file.filename,
-                    status=DocumentStatus.FAILED,
-                    language=language,
-                    message=f"Failed to create document record: {str(e)}"
-                ))
+            pending.append((len(responses), doc_id, file, file_content, page_count))
+            responses.append(None)
                 
         except Exception as e:
             logger.error(f"Unexpected error processing file {file.filename}: {e}")
@@ -414,6 +373,76 @@ async def ingest_documents_batch(
                 message=f"Unexpected error: {str(e)}"
             ))
     
+    if pending:
+        try:
+            # Create all document records in one batched write to avoid race conditions
+            await orchestrator.firestore_client.create_documents_batch([
+                {
+                    "doc_id": doc_id,
+                    "filename": file.filename,
+                    "file_size": len(file_content),
+                    "page_count": page_count,
+                    "session_id": session_id,
+                    "language": language
+                }
+                for _, doc_id, file, file_content, page_count in pending
+            ])
+        except Exception as e:
+            logger.error(f"Failed to create document records for batch: {e}")
+            for index, _, file, _, _ in pending:
+                responses[index] = DocumentUploadResponse(
+                    doc_id="",
+                    filename=file.filename,
+                    status=DocumentStatus.FAILED,
+                    language=language,
+                    message=f"Failed to create document record: {str(e)}"
+                )
+            pending = []
+    
+    for index, doc_id, file, file_content, page_count in pending:
+        try:
+            # Add to queue for processing
+            await queue_manager.add_to_queue(
+                doc_id=doc_id,
+                filename=file.filename,
+                file_size=len(file_content),
+                mime_type=file.content_type,
+                session_id=session_id
+            )
+            
+            # Start background processing with queue management
+            await queue_manager.start_processing(
+                doc_id,
+                process_document_background,
+                doc_id,
+                file_content,
+                file.filename,
+                file.content_type,
+                orchestrator,
+                language,
+                session_id
+            )
+            
+            responses[index] = DocumentUploadResponse(
+                doc_id=doc_id,
+                filename=file.filename,
+                status=DocumentStatus.PROCESSING,
+                language=language,
+                message="Document uploaded and queued for processing"
+            )
+            
+            logger.info(f"Document queued for batch processing: {doc_id} ({file.filename})")
+            
+        except Exception as e:
+            logger.error(f"Failed to queue {file.filename}: {e}")
+            responses[index] = DocumentUploadResponse(
+                doc_id="",
+                filename=file.filename,
+                status=DocumentStatus.FAILED,
+                language=language,
+                message=f"Failed to queue document: {str(e)}"
+            )
+    
     successful_uploads = sum(1 for r in responses if r.status == DocumentStatus.PROCESSING)
     failed_uploads = sum(1 for r in responses if r.status == DocumentStatus.FAILED)
     
@@ -684,7 +713,7 @@ async def get_document_clauses_by_path(
                 "negotiation_tip": clause_data.get("negotiation_tip")
             })
         
-        return {"clauses": clauses}
+        return ORJSONResponse({"clauses": clauses})
         
     except HTTPException:
         raise
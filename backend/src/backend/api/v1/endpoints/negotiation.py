@@ -2,15 +2,19 @@
 Negotiation API endpoints for AI-powered clause alternative generation
 """
 import logging
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from datetime import datetime
 from uuid import uuid4
 
+import orjson
+
 from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
 
 from backend.core.config import Settings, get_settings
 from backend.core.logging import get_logger, LogContext
+from backend.core.orjson_response import ORJSONResponse
 from backend.models.negotiation import (
     NegotiationRequest,
     NegotiationResponse,
@@ -20,13 +24,15 @@ from backend.models.negotiation import (
     NegotiationHistoryResponse,
     NegotiationHistory,
     QuickAlternativeRequest,
-    QuickAlternativeResponse
+    QuickAlternativeResponse,
+    NEGOTIATION_HISTORY_LIST_ADAPTER
 )
-from backend.models.document import ClauseDetail, RiskLevel, SupportedLanguage
+from backend.models.document import ClauseDetail, RiskLevel, SupportedLanguage, LANGUAGE_BY_VALUE
 from backend.services.negotiation_service import NegotiationService
 from backend.services.firestore_client import FirestoreClient, FirestoreError
 from backend.services.gemini_client import GeminiClient
 from backend.services.risk_analyzer import RiskAnalyzer
+from backend.dependencies.body import json_body, json_body_openapi
 from backend.dependencies.services import (
     get_firestore_client,
     get_gemini_client,
@@ -37,9 +43,13 @@ router = APIRouter()
 logger = get_logger(__name__)
 
 
-@router.post("/generate", response_model=NegotiationResponse)
+@router.post(
+    "/generate",
+    response_model=NegotiationResponse,
+    openapi_extra=json_body_openapi(NegotiationRequest)
+)
 async def generate_negotiation_alternatives(
-    request: NegotiationRequest,
+    request: NegotiationRequest = Depends(json_body(NegotiationRequest)),
     negotiation_service: NegotiationService = Depends(get_negotiation_service),
     firestore_client: FirestoreClient = Depends(get_firestore_client),
     settings: Settings = Depends(get_settings)
@@ -77,7 +87,7 @@ async def generate_negotiation_alternatives(
 
                     if clause_data and clause_data.get("language"):
                         try:
-                            language_to_use = SupportedLanguage(clause_data.get("language"))
+                            language_to_use = LANGUAGE_BY_VALUE[clause_data.get("language")]
                             logger.info(f"Overriding language from stored clause: {language_to_use.value}")
                         except Exception:
                             logger.warning(f"Stored clause language value is invalid: {clause_data.get('language')}")
@@ -95,11 +105,14 @@ async def generate_negotiation_alternatives(
                 user_preferences=request.user_preferences
             )
             
-            # Add IDs from request if provided
+            # Add IDs from request if provided (copy: responses are frozen and may be cached)
+            id_updates = {}
             if request.clause_id:
-                response.clause_id = request.clause_id
+                id_updates["clause_id"] = request.clause_id
             if request.doc_id:
-                response.doc_id = request.doc_id
+                id_updates["doc_id"] = request.doc_id
+            if id_updates:
+                response = response.model_copy(update=id_updates)
             
             # Auto-save complete negotiation data to Firestore for history
             if response.negotiation_id and request.doc_id and request.clause_id:
@@ -146,9 +159,13 @@ async def generate_negotiation_alternatives(
             )
 
 
-@router.post("/quick", response_model=QuickAlternativeResponse)
+@router.post(
+    "/quick",
+    response_model=QuickAlternativeResponse,
+    openapi_extra=json_body_openapi(QuickAlternativeRequest)
+)
 async def generate_quick_alternatives(
-    request: QuickAlternativeRequest,
+    request: QuickAlternativeRequest = Depends(json_body(QuickAlternativeRequest)),
     negotiation_service: NegotiationService = Depends(get_negotiation_service)
 ):
     """
@@ -176,7 +193,7 @@ async def generate_quick_alternatives(
             simplified_alternatives.append({
                 "text": alt.alternative_text,
                 "benefit": alt.strategic_benefit,
-                "type": alt.alternative_type.value,
+                "type": alt.alternative_type,
                 "risk_reduction": alt.risk_reduction
             })
         
@@ -194,10 +211,14 @@ async def generate_quick_alternatives(
         )
 
 
-@router.post("/batch", response_model=BatchNegotiationResponse)
+@router.post(
+    "/batch",
+    response_model=BatchNegotiationResponse,
+    openapi_extra=json_body_openapi(BatchNegotiationRequest)
+)
 async def batch_generate_alternatives(
-    request: BatchNegotiationRequest,
     background_tasks: BackgroundTasks,
+    request: BatchNegotiationRequest = Depends(json_body(BatchNegotiationRequest)),
     negotiation_service: NegotiationService = Depends(get_negotiation_service),
     firestore_client: FirestoreClient = Depends(get_firestore_client),
     settings: Settings = Depends(get_settings)
@@ -215,23 +236,9 @@ async def batch_generate_alternatives(
             start_time = datetime.utcnow()
             
             # Fetch clauses from Firestore
-            clauses_to_process: List[ClauseDetail] = []
-            for clause_id in request.clause_ids:
-                try:
-                    clause_data = await firestore_client.get_clause(
-                        doc_id=request.doc_id,
-                        clause_id=clause_id
-                    )
-                    
-                    if clause_data:
-                        clause = ClauseDetail(**clause_data)
-                        # Only process clauses with moderate or attention risk
-                        if clause.risk_level in [RiskLevel.MODERATE, RiskLevel.ATTENTION]:
-                            clauses_to_process.append(clause)
-                            
-                except Exception as e:
-                    logger.warning(f"Failed to fetch clause {clause_id}: {e}")
-                    continue
+            clauses_to_process = await _fetch_risky_clauses(
+                firestore_client, request.doc_id, request.clause_ids
+            )
             
             if not clauses_to_process:
                 return BatchNegotiationResponse(
@@ -270,7 +277,7 @@ async def batch_generate_alternatives(
                 }
             )
             
-            return BatchNegotiationResponse(
+            response = BatchNegotiationResponse(
                 doc_id=request.doc_id,
                 total_clauses=len(request.clause_ids),
                 successful=len(negotiations),
@@ -278,6 +285,7 @@ async def batch_generate_alternatives(
                 negotiations=negotiations,
                 generation_time=generation_time
             )
+            return ORJSONResponse(response.model_dump(mode="python"))
             
         except Exception as e:
             logger.error(f"Failed to batch generate alternatives: {e}", exc_info=True)
@@ -287,9 +295,61 @@ async def batch_generate_alternatives(
             )
 
 
-@router.post("/save")
+@router.post(
+    "/batch/stream",
+    openapi_extra=json_body_openapi(BatchNegotiationRequest)
+)
+async def stream_batch_alternatives(
+    background_tasks: BackgroundTasks,
+    request: BatchNegotiationRequest = Depends(json_body(BatchNegotiationRequest)),
+    negotiation_service: NegotiationService = Depends(get_negotiation_service),
+    firestore_client: FirestoreClient = Depends(get_firestore_client)
+):
+    """
+    Stream negotiation alternatives for multiple clauses as NDJSON.
+    
+    Each line is one NegotiationResponse, sent as soon as its generation
+    finishes, so large batches start arriving before the slowest clause is done.
+    """
+    with LogContext(logger, doc_id=request.doc_id, clause_count=len(request.clause_ids)):
+        logger.info("API request: Stream batch negotiation alternatives")
+        
+        clauses_to_process = await _fetch_risky_clauses(
+            firestore_client, request.doc_id, request.clause_ids
+        )
+        negotiations: List[NegotiationResponse] = []
+        
+        async def ndjson_lines() -> AsyncIterator[bytes]:
+            async for negotiation in negotiation_service.stream_batch_alternatives(
+                clauses=clauses_to_process,
+                document_context=request.document_context,
+                user_preferences=request.user_preferences,
+                max_concurrent=request.max_concurrent
+            ):
+                negotiations.append(negotiation)
+                yield orjson.dumps(negotiation.model_dump(mode="json")) + b"\n"
+        
+        # Runs after the stream has been fully sent
+        background_tasks.add_task(
+            save_negotiations_background,
+            firestore_client,
+            request.doc_id,
+            negotiations
+        )
+        
+        return StreamingResponse(
+            ndjson_lines(),
+            media_type="application/x-ndjson",
+            background=background_tasks
+        )
+
+
+@router.post(
+    "/save",
+    openapi_extra=json_body_openapi(SaveNegotiationRequest)
+)
 async def save_negotiation(
-    request: SaveNegotiationRequest,
+    request: SaveNegotiationRequest = Depends(json_body(SaveNegotiationRequest)),
     firestore_client: FirestoreClient = Depends(get_firestore_client),
     settings: Settings = Depends(get_settings)
 ):
@@ -381,15 +441,19 @@ async def get_negotiation_history(
                 clause_id=clause_id
             )
             
-            # Convert to NegotiationHistory objects
-            negotiations = []
-            for neg_data in negotiations_data:
-                try:
-                    negotiation = NegotiationHistory(**neg_data)
-                    negotiations.append(negotiation)
-                except Exception as e:
-                    logger.warning(f"Failed to parse negotiation history: {e}")
-                    continue
+            # Convert to NegotiationHistory objects in one pass; fall back to
+            # per-entry parsing so a single bad record doesn't drop the rest
+            try:
+                negotiations = NEGOTIATION_HISTORY_LIST_ADAPTER.validate_python(negotiations_data)
+            except ValidationError:
+                negotiations = []
+                for neg_data in negotiations_data:
+                    try:
+                        negotiation = NegotiationHistory(**neg_data)
+                        negotiations.append(negotiation)
+                    except Exception as e:
+                        logger.warning(f"Failed to parse negotiation history: {e}")
+                        continue
             
             query_time = (datetime.utcnow() - start_time).total_seconds()
             
@@ -398,12 +462,13 @@ async def get_negotiation_history(
                 extra={"count": len(negotiations), "query_time": query_time}
             )
             
-            return NegotiationHistoryResponse(
+            response = NegotiationHistoryResponse(
                 doc_id=doc_id,
                 total_negotiations=len(negotiations),
                 negotiations=negotiations,
                 query_time=query_time
             )
+            return ORJSONResponse(response.model_dump(mode="python"))
             
         except FirestoreError as e:
             logger.error(f"Firestore error retrieving history: {e}", exc_info=True)
@@ -498,6 +563,33 @@ async def get_negotiation_stats(
             )
 
 
+async def _fetch_risky_clauses(
+    firestore_client: FirestoreClient,
+    doc_id: str,
+    clause_ids: List[str]
+) -> List[ClauseDetail]:
+    """Fetch clauses from Firestore, keeping only moderate and attention risk ones."""
+    clauses: List[ClauseDetail] = []
+    for clause_id in clause_ids:
+        try:
+            clause_data = await firestore_client.get_clause(
+                doc_id=doc_id,
+                clause_id=clause_id
+            )
+            
+            if clause_data:
+                clause = ClauseDetail(**clause_data)
+                # Only process clauses with moderate or attention risk
+                if clause.risk_level in [RiskLevel.MODERATE, RiskLevel.ATTENTION]:
+                    clauses.append(clause)
+                    
+        except Exception as e:
+            logger.warning(f"Failed to fetch clause {clause_id}: {e}")
+            continue
+    
+    return clauses
+
+
 # Background task helper
 async def save_negotiations_background(
     firestore_client: FirestoreClient,
@@ -11,15 +11,20 @@ from backend.core.config import Settings, get_settings
 from backend.models.qa import QuestionRequest, AnswerResponse
 from backend.models.document import SupportedLanguage
 from backend.services.qa_service import QAService
+from backend.dependencies.body import json_body, json_body_openapi
 from backend.dependencies.services import get_qa_service
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-@router.post("/ask", response_model=AnswerResponse)
+@router.post(
+    "/ask",
+    response_model=AnswerResponse,
+    openapi_extra=json_body_openapi(QuestionRequest)
+)
 async def ask_question(
-    request: QuestionRequest,
+    request: QuestionRequest = Depends(json_body(QuestionRequest)),
     language: SupportedLanguage = SupportedLanguage.ENGLISH,
     background_tasks: BackgroundTasks = BackgroundTasks(),
     qa_service: QAService = Depends(get_qa_service)
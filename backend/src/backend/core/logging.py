@@ -1,37 +1,49 @@
 import logging
+import re
 import sys
+from contextvars import ContextVar
 from typing import Dict, Any
 
 
-def setup_logging(log_level: str = "INFO") -> None:
+# Task-local structured context; read by a single record factory installed at import
+_log_context: ContextVar[Dict[str, Any]] = ContextVar("_log_context", default={})
+_base_record_factory = logging.getLogRecordFactory()
 
-    class StructuredFormatter(logging.Formatter):
-        """Custom formatter for structured logging."""
-        
-        def format(self, record: logging.LogRecord) -> str:
-            # Add common fields
-            record.service = "brainwave-insightgpt-api"
-            record.version = "0.1.0"
-            
-            # Format the message
-            formatted = super().format(record)
-            return formatted
-    
+
+def _context_record_factory(*args: Any, **kwargs: Any) -> logging.LogRecord:
+    record = _base_record_factory(*args, **kwargs)
+    for key, value in _log_context.get().items():
+        setattr(record, key, value)
+    return record
+
+
+logging.setLogRecordFactory(_context_record_factory)
+
+
+SERVICE_NAME = "brainwave-insightgpt-api"
+
+
+def setup_logging(log_level: str = "INFO") -> None:
 
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level.upper()))
     
 
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    for handler in root_logger.handlers:
+        try:
+            handler.close()
+        except Exception:
+            pass
+    root_logger.handlers.clear()
     
 
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, log_level.upper()))
     
 
-    formatter = StructuredFormatter(
-        fmt="%(asctime)s - %(service)s - %(name)s - %(levelname)s - %(message)s",
+    # Service name is constant, so bake it into the template instead of per-record attributes
+    formatter = logging.Formatter(
+        fmt=f"%(asctime)s - {SERVICE_NAME} - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S"
     )
     console_handler.setFormatter(formatter)
@@ -56,30 +68,27 @@ class LogContext:
     def __init__(self, logger: logging.Logger, **context: Any):
         self.logger = logger
         self.context = context
-        self.old_factory = None
+        self._token = None
     
     def __enter__(self):
-        self.old_factory = logging.getLogRecordFactory()
-        
-        def record_factory(*args, **kwargs):
-            record = self.old_factory(*args, **kwargs)
-            for key, value in self.context.items():
-                setattr(record, key, value)
-            return record
-        
-        logging.setLogRecordFactory(record_factory)
+        self._token = _log_context.set({**_log_context.get(), **self.context})
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        logging.setLogRecordFactory(self.old_factory)
+        _log_context.reset(self._token)
+
+
+SENSITIVE_KEYS = ("password", "token", "key", "secret", "credential")
+
+# One alternation scans each key once, however many sensitive keywords are listed
+_SENSITIVE_KEY_PATTERN = re.compile("|".join(map(re.escape, SENSITIVE_KEYS)), re.IGNORECASE)
 
 
 def log_function_call(logger: logging.Logger, func_name: str, **kwargs: Any) -> None:
 
-    sensitive_keys = {"password", "token", "key", "secret", "credential"}
     safe_kwargs = {
         k: v for k, v in kwargs.items()
-        if not any(sensitive in k.lower() for sensitive in sensitive_keys)
+        if not _SENSITIVE_KEY_PATTERN.search(k)
     }
     
     logger.debug(f"Calling {func_name}", extra={"params": safe_kwargs})
@@ -2,6 +2,8 @@ import bcrypt
 from datetime import datetime, timedelta
 from typing import Optional
 
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from jose import jwt
 
 from backend.core.config import get_settings
@@ -18,15 +20,31 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm="HS256")
     return encoded_jwt
 
+# Calibrated so a verify costs roughly what bcrypt at cost 12 did (~50 ms);
+# argon2id hashes start with "$argon2", anything else is a legacy bcrypt hash
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1, hash_len=32)
+ARGON2_PREFIX = "$argon2"
+
 def verify_password(plain_password, hashed_password):
+    if isinstance(hashed_password, bytes):
+        hashed_password = hashed_password.decode('utf-8')
+    if hashed_password.startswith(ARGON2_PREFIX):
+        if isinstance(plain_password, bytes):
+            plain_password = plain_password.decode('utf-8')
+        try:
+            return _password_hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
     # Ensure bytes
     if isinstance(plain_password, str):
         plain_password = plain_password.encode('utf-8')
-    if isinstance(hashed_password, str):
-        hashed_password = hashed_password.encode('utf-8')
-    return bcrypt.checkpw(plain_password, hashed_password)
+    return bcrypt.checkpw(plain_password, hashed_password.encode('utf-8'))
 
 def get_password_hash(password):
-    if isinstance(password, str):
-        password = password.encode('utf-8')
-    return bcrypt.hashpw(password, bcrypt.gensalt()).decode('utf-8')
+    if isinstance(password, bytes):
+        password = password.decode('utf-8')
+    return _password_hasher.hash(password)
+
+
+# Verified against when the user doesn't exist, so unknown emails cost the same hashing work
+DUMMY_PASSWORD_HASH = get_password_hash("x" * 12)
@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Annotated, Optional
 
 from fastapi import Depends, HTTPException, status, Request
@@ -11,6 +12,19 @@ from backend.services.firestore_client import FirestoreClient
 
 settings = get_settings()
 
+# Using HS256 as hardcoded in security.py; bind key/algorithms once at import
+_decode_token = partial(jwt.decode, key=settings.SECRET_KEY, algorithms=["HS256"])
+
+
+def _credentials_exception() -> HTTPException:
+    """Build a fresh 401 per raise; a shared instance would share traceback and context across requests."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
 # Required OAuth2 scheme - will fail if no token provided
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
 
@@ -23,24 +37,18 @@ async def get_current_user(
     firestore: FirestoreClient = Depends(get_firestore_client)
 ) -> User:
     """Get current authenticated user. Raises 401 if not authenticated."""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
     try:
-        # Using HS256 as hardcoded in security.py
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+        payload = _decode_token(token)
         email: str = payload.get("sub")
         if email is None:
-            raise credentials_exception
+            raise _credentials_exception()
         token_data = TokenData(email=email)
     except JWTError:
-        raise credentials_exception
+        raise _credentials_exception()
     
     user_data = await firestore.get_user_by_email(email=token_data.email)
     if user_data is None:
-        raise credentials_exception
+        raise _credentials_exception()
         
     return User(**user_data)
 
@@ -57,7 +65,7 @@ async def get_current_user_optional(
         return None
     
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+        payload = _decode_token(token)
         email: str = payload.get("sub")
         if email is None:
             return None
@@ -9,11 +9,10 @@ from backend.services.firestore_client import FirestoreClient
 from backend.services.embeddings_service import EmbeddingsService  # Phase 3
 from backend.services.gemini_client import GeminiClient            # Phase 2
 from backend.services.chat_session_service import ChatSessionService # Phase 4
-from backend.services.cache_service import InMemoryCache, get_cache
+from backend.services.cache_service import ShardedCache, get_cache
 from backend.services.document_orchestrator import DocumentOrchestrator # Phase 4
 from backend.services.document_queue_manager import DocumentQueueManager # Phase 4
 from backend.services.language_detection_service import LanguageDetectionService # Phase 2
-from backend.services.language_detection_service import LanguageDetectionService # Phase 2
 from backend.services.qa_service import QAService # Phase 3
 from backend.services.privacy_service import PrivacyService # Phase 4
 from backend.services.risk_analyzer import RiskAnalyzer # Phase 4
@@ -36,7 +35,7 @@ _negotiation_service: Optional[NegotiationService] = None
 
 
 @lru_cache()
-def get_cache_service() -> InMemoryCache:
+def get_cache_service() -> ShardedCache:
     """
     Get singleton Cache service instance.
     Uses lru_cache to ensure only one instance is created.
@@ -210,13 +209,19 @@ def reset_services():
     get_language_detection_service.cache_clear()
     get_qa_service.cache_clear()
     get_privacy_service.cache_clear()
-    get_qa_service.cache_clear()
-    get_privacy_service.cache_clear()
     get_risk_analyzer.cache_clear()
     get_negotiation_service.cache_clear()
     get_cache_service.cache_clear()
 
 
+async def shutdown_services():
+    """
+    Release network resources held by singleton services at shutdown.
+    """
+    if _document_orchestrator is not None:
+        await _document_orchestrator.close()
+
+
 async def initialize_services():
     """
     Initialize all services at startup for faster subsequent access.
@@ -241,8 +246,4 @@ async def initialize_services():
     except Exception as e:
         logger.warning(f"Gemini client initialization failed (continuing startup): {e}")
     
-    # Start cache cleanup task
-    from backend.services.cache_service import start_cache_cleanup_task
-    await start_cache_cleanup_task()
-    
     logger.info("All services pre-initialized successfully")
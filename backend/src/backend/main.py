@@ -5,12 +5,15 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from backend.api.v1.api import api_router
-from backend.dependencies.services import initialize_services
+from backend.core.config import get_settings
+from backend.core.logging import setup_logging
+from backend.core.orjson_response import ORJSONResponse
+from backend.dependencies.body import add_json_body_schemas
+from backend.dependencies.services import initialize_services, shutdown_services
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+settings = get_settings()
+
+setup_logging(settings.LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
 @asynccontextmanager
@@ -18,28 +21,42 @@ async def lifespan(app: FastAPI):
     logger.info("InsightGPT Backend Server has started!")
     # Initialize all singleton services
     await initialize_services()
+    # Build the OpenAPI schema now; FastAPI caches it on the app for later /docs hits
+    app.openapi()
     yield
     logger.info("InsightGPT Backend Server is shutting down...")
+    await shutdown_services()
 
 
 app = FastAPI(
     title="InsightGPT API",
     description="AI-powered document analysis and insights platform",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-Requested-With"],
 )
 
 app.include_router(api_router, prefix="/api/v1")
 
 
+def custom_openapi():
+    # Bodies parsed by json_body are not declared parameters; document their models too
+    if app.openapi_schema is None:
+        add_json_body_schemas(FastAPI.openapi(app))
+    return app.openapi_schema
+
+
+app.openapi = custom_openapi
+
+
 @app.get("/")
 async def root():
     return {"message": "InsightGPT Backend is active", "version": "0.1.0"}
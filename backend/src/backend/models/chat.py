@@ -5,9 +5,12 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from backend.core.config import get_settings
 from backend.models.document import SupportedLanguage
 
+_utcnow = datetime.utcnow
+
 
 class MessageRole(str, Enum):
     """Enumeration for message roles"""
@@ -16,12 +19,16 @@ class MessageRole(str, Enum):
     SYSTEM = "system"
 
 
+# Value -> member lookup used when rehydrating stored messages
+ROLE_BY_VALUE: Dict[str, MessageRole] = {role.value: role for role in MessageRole}
+
+
 class ChatMessage(BaseModel):
     """Model for individual chat messages within a session."""
     message_id: str = Field(description="Unique message identifier")
     role: MessageRole = Field(description="Message role (user, assistant, system)")
     content: str = Field(description="Message content")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     sources: Optional[List[Dict[str, Any]]] = Field(
         description="Source citations for assistant messages", 
         default_factory=list
@@ -31,21 +38,38 @@ class ChatMessage(BaseModel):
         default_factory=dict
     )
 
+    @classmethod
+    def from_firestore(cls, data: Dict[str, Any]) -> "ChatMessage":
+        """Rehydrate a stored message, skipping validation when the role is known."""
+        role = ROLE_BY_VALUE.get(data.get("role"))
+        if role is None:
+            return cls(**data)
+        return cls.model_construct(**{**data, "role": role})
+
 
 class DocumentContext(BaseModel):
     """Model for document context within a chat session."""
     doc_id: str = Field(description="Document identifier")
     doc_name: str = Field(description="Human-readable document name")
-    added_at: datetime = Field(default_factory=datetime.utcnow)
+    added_at: datetime = Field(default_factory=_utcnow)
     status: Optional[str] = Field(description="Document processing status", default=None)
 
+    def to_firestore(self) -> Dict[str, Any]:
+        """Plain dict for storage, equivalent to model_dump() without the serializer."""
+        return {
+            "doc_id": self.doc_id,
+            "doc_name": self.doc_name,
+            "added_at": self.added_at,
+            "status": self.status,
+        }
+
 
 class ChatSession(BaseModel):
     """Model for chat sessions with conversation memory."""
     session_id: str = Field(description="Unique session identifier")
     title: Optional[str] = Field(description="Session title", default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
     user_id: Optional[str] = Field(description="User identifier", default=None)
     
     # Document context
@@ -63,7 +87,7 @@ class ChatSession(BaseModel):
     # Session metadata
     total_messages: int = Field(description="Total number of messages", default=0)
     total_questions: int = Field(description="Total number of user questions", default=0)
-    last_activity: datetime = Field(default_factory=datetime.utcnow)
+    last_activity: datetime = Field(default_factory=_utcnow)
     
     # Memory management
     context_summary: Optional[str] = Field(
@@ -85,6 +109,8 @@ class CreateChatSessionRequest(BaseModel):
 
 class CreateChatSessionResponse(BaseModel):
     """Response model for chat session creation."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     session_id: str = Field(description="Created session identifier")
     title: Optional[str] = Field(description="Session title")
     created_at: datetime = Field(description="Creation timestamp")
@@ -100,6 +126,8 @@ class UpdateSessionDocumentsRequest(BaseModel):
 
 class UpdateSessionDocumentsResponse(BaseModel):
     """Response model for updating session documents."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     session_id: str = Field(description="Session identifier")
     selected_documents: List[DocumentContext] = Field(description="Updated document context")
     updated_at: datetime = Field(description="Update timestamp")
@@ -107,12 +135,16 @@ class UpdateSessionDocumentsResponse(BaseModel):
 
 class ChatSessionListResponse(BaseModel):
     """Response model for listing chat sessions."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     sessions: List[ChatSession] = Field(description="List of chat sessions")
     total_count: int = Field(description="Total number of sessions")
     
     
 class ChatSessionResponse(BaseModel):
     """Response model for retrieving a single chat session."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     session: ChatSession = Field(description="Chat session with full conversation history")
 
 
@@ -132,6 +164,8 @@ class AddMessageRequest(BaseModel):
 
 class AddMessageResponse(BaseModel):
     """Response model for adding a message."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     message_id: str = Field(description="Created message identifier")
     session_id: str = Field(description="Session identifier")
     timestamp: datetime = Field(description="Message timestamp")
@@ -159,6 +193,8 @@ class ChatQuestionRequest(BaseModel):
 
 class ChatAnswerResponse(BaseModel):
     """Enhanced answer response with session context."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     session_id: str = Field(description="Chat session identifier")
     message_id: str = Field(description="Created message identifier")
     answer: str = Field(description="Generated answer")
@@ -173,7 +209,7 @@ class ChatAnswerResponse(BaseModel):
         description="Proactive insights and recommendations",
         default=None
     )
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
     # Language Detection Information
     detected_language: Optional[SupportedLanguage] = Field(description="Automatically detected language", default=None)
@@ -195,7 +231,32 @@ class SessionSummaryRequest(BaseModel):
 
 class SessionSummaryResponse(BaseModel):
     """Response model for session summary."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     session_id: str = Field(description="Session identifier")
     summary: str = Field(description="Generated conversation summary")
     summarized_message_count: int = Field(description="Number of messages summarized")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+
+
+# Field descriptions only feed /docs; drop them in production to slim FieldInfo and schema builds
+_strip_descriptions = get_settings().ENVIRONMENT == "production"
+
+# Resolve any deferred schemas at import so the first request doesn't pay for it
+for _model in (
+    ChatMessage,
+    DocumentContext,
+    ChatSession,
+    CreateChatSessionResponse,
+    UpdateSessionDocumentsResponse,
+    ChatSessionListResponse,
+    ChatSessionResponse,
+    AddMessageResponse,
+    ChatAnswerResponse,
+    SessionSummaryResponse,
+):
+    if _strip_descriptions:
+        for _field in _model.model_fields.values():
+            _field.description = None
+    _model.model_rebuild(force=_strip_descriptions)
+del _model
@@ -1,11 +1,21 @@
 """
 Document-related Pydantic models
 """
-from typing import Dict, Optional, Any, List
+import sys
+from typing import Annotated, Dict, Optional, Any, List
 from enum import Enum
+from dataclasses import dataclass
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+
+# Bound once so default factories skip the attribute lookup per instance
+_utcnow = datetime.utcnow
+
+
+# Low-cardinality strings (categories, model names) repeat across thousands of
+# parsed objects; interning shares one str instance per distinct value
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
 
 
 class SupportedLanguage(str, Enum):
@@ -23,6 +33,10 @@ class SupportedLanguage(str, Enum):
     URDU = "ur"
 
 
+# Value -> member lookup; a dict hit instead of Enum.__call__ on rehydration paths
+LANGUAGE_BY_VALUE: Dict[str, SupportedLanguage] = {language.value: language for language in SupportedLanguage}
+
+
 class DocumentStatus(str, Enum):
     """Document processing status enumeration."""
     UPLOADED = "uploaded"
@@ -40,40 +54,42 @@ class RiskLevel(str, Enum):
 
 class DocumentUploadResponse(BaseModel):
     """Response model for document upload."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     doc_id: str = Field(description="Unique document identifier")
     status: DocumentStatus = Field(description="Processing status")
     filename: str = Field(description="Original filename")
     message: str = Field(description="Status message")
     language: SupportedLanguage = Field(default=SupportedLanguage.ENGLISH, description="Document language")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+
+
+class ReadabilityMetrics(BaseModel):
+    """Readability metrics for clauses."""
+    original_grade: float = Field(description="Original grade level")
+    summary_grade: float = Field(description="Summary grade level") 
+    delta: float = Field(description="Grade level improvement")
+    flesch_score: float = Field(description="Flesch Reading Ease score")
 
 
 class ClauseSummary(BaseModel):
     """Summary model for individual clauses."""
     clause_id: str = Field(description="Unique clause identifier")
     order: int = Field(description="Clause order in document", ge=1)
-    category: str = Field(description="Clause category/type")
+    category: InternedStr = Field(description="Clause category/type")
     risk_level: RiskLevel = Field(description="Risk assessment level")
     summary: str = Field(description="Plain-language summary")
     language: SupportedLanguage = Field(default=SupportedLanguage.ENGLISH, description="Summary language")
-    readability_metrics: 'ReadabilityMetrics' = Field(description="Readability analysis metrics")
+    readability_metrics: ReadabilityMetrics = Field(description="Readability analysis metrics")
     needs_review: bool = Field(description="Flagged for manual review")
 
 
-class ReadabilityMetrics(BaseModel):
-    """Readability metrics for clauses."""
-    original_grade: float = Field(description="Original grade level")
-    summary_grade: float = Field(description="Summary grade level") 
-    delta: float = Field(description="Grade level improvement")
-    flesch_score: float = Field(description="Flesch Reading Ease score")
-
-
 class ClauseDetail(BaseModel):
     """Detailed model for individual clauses."""
     clause_id: str = Field(description="Unique clause identifier")
     doc_id: str = Field(description="Parent document identifier")
     order: int = Field(description="Clause order in document", ge=1)
-    category: str = Field(description="Clause category/type")
+    category: InternedStr = Field(description="Clause category/type")
     risk_level: RiskLevel = Field(description="Risk assessment level")
     original_text: str = Field(description="Original clause text (potentially masked)")
     summary: str = Field(description="Plain-language summary")
@@ -97,6 +113,19 @@ class DocumentMetadata(BaseModel):
     session_id: Optional[str] = Field(description="Session identifier")
 
 
+@dataclass(slots=True, frozen=True)
+class DocumentListItem:
+    """Read-only projection of a stored document for list views (no validation; orjson-serializable)."""
+    doc_id: str
+    filename: str
+    status: str
+    created_at: Optional[str]
+    page_count: int
+    clause_count: int
+    language: str
+    user_id: Optional[str]
+
+
 class ProcessingProgress(BaseModel):
     """Model for tracking document processing progress."""
     doc_id: str = Field(description="Document identifier")
@@ -109,6 +138,8 @@ class ProcessingProgress(BaseModel):
 
 class BatchUploadResponse(BaseModel):
     """Response model for batch document upload."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     uploads: List[DocumentUploadResponse] = Field(description="List of upload responses")
     successful_count: int = Field(description="Number of successful uploads")
     failed_count: int = Field(description="Number of failed uploads")
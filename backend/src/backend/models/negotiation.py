@@ -1,13 +1,15 @@
 """
 Negotiation-related Pydantic models for AI-powered clause alternatives
 """
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Literal
 from enum import Enum
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
-from backend.models.document import RiskLevel, SupportedLanguage
+from backend.models.document import InternedStr, RiskLevel, SupportedLanguage
+
+_utcnow = datetime.utcnow
 
 
 class AlternativeType(str, Enum):
@@ -17,6 +19,10 @@ class AlternativeType(str, Enum):
     SIMPLIFIED = "simplified"
 
 
+# Literal form of AlternativeType for bulk-returned models; validates by set lookup instead of Enum coercion
+AlternativeTypeLiteral = Literal["balanced", "protective", "simplified"]
+
+
 class NegotiationAlternative(BaseModel):
     """Model for a single negotiation alternative."""
     alternative_id: Optional[str] = Field(default=None, description="Unique identifier for this alternative")
@@ -25,8 +31,8 @@ class NegotiationAlternative(BaseModel):
     risk_reduction: str = Field(description="Specific risks this alternative mitigates")
     implementation_notes: str = Field(description="Practical advice for proposing this change")
     confidence: float = Field(ge=0.0, le=1.0, description="AI confidence in this alternative")
-    alternative_type: AlternativeType = Field(description="Type of alternative approach")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    alternative_type: AlternativeTypeLiteral = Field(description="Type of alternative approach")
+    created_at: datetime = Field(default_factory=_utcnow)
 
 
 class NegotiationRequest(BaseModel):
@@ -70,6 +76,8 @@ class RiskAnalysisSummary(BaseModel):
 
 class NegotiationResponse(BaseModel):
     """Response model for negotiation alternatives."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     negotiation_id: Optional[str] = Field(default=None, description="Unique identifier for this negotiation")
     original_clause: str = Field(description="The original clause text")
     original_risk_level: RiskLevel = Field(description="Risk level of original clause")
@@ -81,15 +89,17 @@ class NegotiationResponse(BaseModel):
         description="Risk analysis summary"
     )
     generation_time: float = Field(description="Time taken to generate alternatives (seconds)")
-    model_used: str = Field(description="AI model used for generation")
-    context: Dict[str, Any] = Field(default_factory=dict, description="Additional context")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    model_used: InternedStr = Field(description="AI model used for generation")
+    context: Any = Field(default_factory=dict, description="Additional context")
+    created_at: datetime = Field(default_factory=_utcnow)
     clause_id: Optional[str] = Field(default=None, description="ID of the clause in the system")
     doc_id: Optional[str] = Field(default=None, description="ID of the document")
 
 
 class BatchNegotiationResponse(BaseModel):
     """Response model for batch negotiation generation."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     doc_id: str = Field(description="Document ID")
     total_clauses: int = Field(description="Total number of clauses requested")
     successful: int = Field(description="Number of successful generations")
@@ -98,7 +108,7 @@ class BatchNegotiationResponse(BaseModel):
         description="List of successful negotiation responses"
     )
     generation_time: float = Field(description="Total time for batch generation (seconds)")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
 
 
 class SaveNegotiationRequest(BaseModel):
@@ -134,25 +144,37 @@ class NegotiationHistory(BaseModel):
     selected_alternative_id: Optional[str] = Field(default=None)
     user_feedback: Optional[str] = Field(default=None)
     was_helpful: Optional[bool] = Field(default=None)
-    metadata: Dict[str, Any] = Field(default_factory=dict)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    metadata: Any = Field(default_factory=dict)
+    created_at: datetime = Field(default_factory=_utcnow)
     updated_at: Optional[datetime] = Field(default=None)
 
 
 class NegotiationHistoryResponse(BaseModel):
     """Response model for negotiation history query."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     doc_id: str = Field(description="Document ID")
     total_negotiations: int = Field(description="Total number of negotiations")
     negotiations: List[NegotiationHistory] = Field(description="List of negotiation history entries")
     query_time: float = Field(description="Time taken to query (seconds)")
 
 
+# Built once; validating a whole list runs in a single pydantic-core loop
+NEGOTIATION_HISTORY_LIST_ADAPTER = TypeAdapter(List[NegotiationHistory])
+
+
+class CategoryCount(BaseModel):
+    """Clause category with its negotiation count."""
+    category: InternedStr = Field(description="Clause category")
+    count: int = Field(description="Number of negotiations in this category")
+
+
 class NegotiationStats(BaseModel):
     """Statistics about negotiation usage."""
     total_negotiations: int = Field(description="Total negotiations generated")
     total_alternatives: int = Field(description="Total alternatives generated")
     average_generation_time: float = Field(description="Average generation time (seconds)")
-    most_common_categories: List[Dict[str, Any]] = Field(
+    most_common_categories: List[CategoryCount] = Field(
         description="Most common clause categories with counts"
     )
     alternative_selection_rate: float = Field(
@@ -182,17 +204,20 @@ class QuickAlternativeRequest(BaseModel):
         }
 
 
+class QuickAlternative(BaseModel):
+    """Simplified alternative for quick display."""
+    text: str = Field(description="Alternative clause text")
+    benefit: str = Field(description="Strategic benefit")
+    type: AlternativeType = Field(description="Type of alternative approach")
+    risk_reduction: Optional[str] = Field(default=None, description="Risks this alternative mitigates")
+
+
 class QuickAlternativeResponse(BaseModel):
     """Simplified response for quick alternative display."""
-    original_clause: str = Field(description="Original clause")
-    alternatives: List[Dict[str, str]] = Field(
-        description="Simplified alternatives with text, benefit, and type"
-    )
-    generation_time: float = Field(description="Generation time in seconds")
-    
-    class Config:
-        """Pydantic config."""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        json_schema_extra={
             "example": {
                 "original_clause": "The Company shall be indemnified...",
                 "alternatives": [
@@ -205,3 +230,10 @@ class QuickAlternativeResponse(BaseModel):
                 "generation_time": 1.2
             }
         }
+    )
+
+    original_clause: str = Field(description="Original clause")
+    alternatives: List[QuickAlternative] = Field(
+        description="Simplified alternatives with text, benefit, and type"
+    )
+    generation_time: float = Field(description="Generation time in seconds")
@@ -4,9 +4,11 @@ Question and Answer Pydantic models
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from backend.models.document import SupportedLanguage
 
+_utcnow = datetime.utcnow
+
 
 class QuestionRequest(BaseModel):
     """Request model for asking questions about documents."""
@@ -31,14 +33,19 @@ class SourceCitation(BaseModel):
     relevance_score: float = Field(description="Relevance score", ge=0, le=1)
 
 
+SOURCE_CITATION_LIST_ADAPTER = TypeAdapter(List[SourceCitation])
+
+
 class AnswerResponse(BaseModel):
     """Response model for question answers."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     answer: str = Field(description="Generated answer")
     used_clause_ids: List[str] = Field(description="List of clause IDs used for answer")
     confidence: float = Field(description="Answer confidence score", ge=0, le=1)
     sources: List[SourceCitation] = Field(description="Source citations with snippets")
     additional_insights: Optional[str] = Field(description="Proactive insights and recommendations", default=None)
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     chat_session_id: Optional[str] = Field(description="Associated chat session", default=None)
     conversation_context_used: bool = Field(description="Whether conversation history was used", default=False)
 
@@ -61,10 +68,16 @@ class QAHistory(BaseModel):
     session_id: Optional[str] = Field(description="Session identifier")
 
 
+class QuestionTypeCount(BaseModel):
+    """Question pattern with its occurrence count."""
+    question_type: str = Field(description="Question pattern or type")
+    count: int = Field(description="Number of questions matching this pattern")
+
+
 class QAMetrics(BaseModel):
     """Model for Q&A performance metrics."""
     total_questions: int = Field(description="Total number of questions")
     avg_confidence: float = Field(description="Average confidence score")
     citation_coverage: float = Field(description="Percentage of answers with citations")
     avg_response_time_ms: int = Field(description="Average response time in milliseconds")
-    common_question_types: List[Dict[str, Any]] = Field(description="Most common question patterns")
+    common_question_types: List[QuestionTypeCount] = Field(description="Most common question patterns")
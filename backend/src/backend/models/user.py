@@ -1,18 +1,33 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional
+import unicodedata
+from pydantic import AfterValidator, BaseModel, EmailStr, StringConstraints
+from typing import Annotated, Optional
 from datetime import datetime
 
+# Format-only email check run by pydantic-core; full EmailStr validation is kept for registration
+FastEmail = Annotated[str, StringConstraints(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$", max_length=254)]
+
+
+def _normalize_email(email: str) -> str:
+    """Match EmailStr's stored form: NFC-normalized with a lowercased domain."""
+    local, _, domain = unicodedata.normalize("NFC", email).rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+# Login emails are looked up by exact match against the form UserCreate stored
+LoginEmail = Annotated[FastEmail, AfterValidator(_normalize_email)]
+
 class UserBase(BaseModel):
-    email: EmailStr
+    email: FastEmail
     full_name: Optional[str] = None
     is_active: bool = True
     is_superuser: bool = False
 
 class UserCreate(UserBase):
+    email: EmailStr
     password: str
 
 class UserLogin(BaseModel):
-    email: EmailStr
+    email: LoginEmail
     password: str
 
 class UserInDB(UserBase):
@@ -1,10 +1,29 @@
+import asyncio
 import logging
 from fastapi import HTTPException, status
-from backend.core.security import get_password_hash, verify_password, create_access_token
+from backend.core.security import get_password_hash, verify_password, create_access_token, DUMMY_PASSWORD_HASH
 from backend.services.firestore_client import FirestoreClient
 
 logger = logging.getLogger(__name__)
 
+
+def _email_exists_exception() -> HTTPException:
+    """Build a fresh 400 per raise; a shared instance would share traceback and context across requests."""
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Email already registered"
+    )
+
+
+def _bad_credentials_exception() -> HTTPException:
+    """Build a fresh 401 per raise; a shared instance would share traceback and context across requests."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Incorrect email or password",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
 class AuthService:
     def __init__(self):
         self.firestore = FirestoreClient()
@@ -13,10 +32,7 @@ class AuthService:
         # 1. Check if user exists
         user = await self.firestore.get_user_by_email(email)
         if user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
+            raise _email_exists_exception()
         
         # 2. Hash password
         hashed_password = get_password_hash(password)
@@ -35,12 +51,11 @@ class AuthService:
 
     async def login_user(self, email: str, password: str):
         user = await self.firestore.get_user_by_email(email)
-        if not user or not verify_password(password, user["hashed_password"]):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Incorrect email or password",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        # Always run the password check (off the event loop) so missing users aren't distinguishable by timing
+        hashed_password = user["hashed_password"] if user else DUMMY_PASSWORD_HASH
+        password_ok = await asyncio.to_thread(verify_password, password, hashed_password)
+        if not user or not password_ok:
+            raise _bad_credentials_exception()
         
         access_token = create_access_token(data={"sub": user["email"]})
         return {"access_token": access_token, "token_type": "bearer"}
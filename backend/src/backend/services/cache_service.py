@@ -5,25 +5,98 @@ import logging
 import time
 from typing import Any, Dict, List, Optional, Union
 from functools import lru_cache
-import asyncio
+import threading
+from collections import OrderedDict
+from itertools import islice
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+NS_PER_SECOND = 1_000_000_000
 
-@dataclass
+# Entries inspected for expiry on each write, replacing a periodic full scan
+EXPIRY_SWEEP_SIZE = 8
+
+_MASK_64 = (1 << 64) - 1
+
+
+@dataclass(slots=True, frozen=True)
 class CacheEntry:
     """Cache entry with value and expiration."""
     value: Any
-    expires_at: float
-    created_at: float
+    expires_at: int  # time.monotonic_ns()
+    created_at: int
+
+
+class FrequencySketch:
+    """
+    Count-Min sketch of recent key frequencies with periodic aging.
+    
+    Four rows of small counters (capped at 15), each indexed by the top
+    bits of the key's hash multiplied by that row's odd constant, so every
+    row depends on all hash bits. Keys routed to one ShardedCache shard
+    share their low hash bits; a plain slice of the hash would put all of
+    them into a fraction of a row. Counters are halved once the number of
+    recorded accesses reaches the sample size, so old popularity decays.
+    """
+    
+    ROWS = 4
+    MAX_COUNT = 15
+    ROW_MULTIPLIERS = (
+        0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93
+    )
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize sketch.
+        
+        Args:
+            capacity: Number of entries the owning cache holds
+        """
+        width = 16
+        while width < capacity * 4 and width < 1 << 16:
+            width <<= 1
+        self._mask = width - 1
+        self._shift = 64 - width.bit_length() + 1
+        self._rows = [[0] * width for _ in range(self.ROWS)]
+        self._sample_size = max(10 * capacity, 16)
+        self._additions = 0
+    
+    def _indexes(self, key: str) -> List[int]:
+        h = hash(key) & _MASK_64
+        shift = self._shift
+        return [((h * m) & _MASK_64) >> shift for m in self.ROW_MULTIPLIERS]
+    
+    def increment(self, key: str) -> None:
+        """Record one access to key."""
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < self.MAX_COUNT:
+                row[index] += 1
+        
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._age()
+    
+    def estimate(self, key: str) -> int:
+        """Estimated recent access count for key."""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+    
+    def _age(self) -> None:
+        for row in self._rows:
+            for i, count in enumerate(row):
+                row[i] = count >> 1
+        self._additions //= 2
 
 
 class InMemoryCache:
     """
     Thread-safe in-memory cache with TTL support.
     Designed for caching document clauses, embeddings, and Q&A results.
+    
+    Eviction is LRU with TinyLFU admission: when full, a new key only
+    replaces the least recently used entry if it has been requested more
+    often recently, so one-off keys can't flush popular documents.
     """
     
     def __init__(self, default_ttl: int = 3600, max_size: int = 1000):
@@ -35,17 +108,22 @@ class InMemoryCache:
             max_size: Maximum number of entries (1000 entries)
         """
         self.default_ttl = default_ttl
+        self.default_ttl_ns = default_ttl * NS_PER_SECOND
         self.max_size = max_size
-        self._cache: Dict[str, CacheEntry] = {}
-        self._access_times: Dict[str, float] = {}
-        self._lock = asyncio.Lock()
+        # Ordered oldest-used first; hits move to the end, eviction pops the front
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # Guards mutations only; reads rely on single dict ops being atomic
+        self._lock = threading.Lock()
+        # Approximate counts; unsynchronized increments from get() may be lost, which is harmless
+        self._sketch = FrequencySketch(max_size)
         
         # Statistics
         self.hits = 0
         self.misses = 0
         self.evictions = 0
+        self.rejections = 0
         
-    async def get(self, key: str) -> Optional[Any]:
+    def get(self, key: str) -> Optional[Any]:
         """
         Get value from cache.
         
@@ -55,28 +133,28 @@ class InMemoryCache:
         Returns:
             Cached value or None if not found/expired
         """
-        async with self._lock:
-            entry = self._cache.get(key)
-            
-            if entry is None:
-                self.misses += 1
-                return None
-            
-            current_time = time.time()
-            
-            # Check if expired
-            if current_time > entry.expires_at:
-                del self._cache[key]
-                self._access_times.pop(key, None)
-                self.misses += 1
-                return None
-            
-            # Update access time for LRU
-            self._access_times[key] = current_time
-            self.hits += 1
-            return entry.value
+        self._sketch.increment(key)
+        entry = self._cache.get(key)
+        
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        # Check if expired
+        if time.monotonic_ns() > entry.expires_at:
+            with self._lock:
+                self._cache.pop(key, None)
+            self.misses += 1
+            return None
+        
+        # Mark as most recently used (may have been evicted since the read)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+        self.hits += 1
+        return entry.value
     
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """
         Set value in cache.
         
@@ -85,25 +163,47 @@ class InMemoryCache:
             value: Value to cache
             ttl: Time-to-live in seconds (uses default if None)
         """
-        async with self._lock:
-            ttl = ttl or self.default_ttl
-            current_time = time.time()
+        with self._lock:
+            ttl_ns = ttl * NS_PER_SECOND if ttl else self.default_ttl_ns
+            current_time = time.monotonic_ns()
             
             # Create cache entry
             entry = CacheEntry(
                 value=value,
-                expires_at=current_time + ttl,
+                expires_at=current_time + ttl_ns,
                 created_at=current_time
             )
             
-            # Check if we need to evict entries
-            if len(self._cache) >= self.max_size and key not in self._cache:
-                await self._evict_lru()
+            self._sketch.increment(key)
+            
+            # One lookup decides both eviction and whether the key needs reordering
+            existing = self._cache.get(key)
+            if existing is None and len(self._cache) >= self.max_size:
+                victim_key, victim = next(iter(self._cache.items()))
+                if (current_time <= victim.expires_at and
+                        self._sketch.estimate(key) <= self._sketch.estimate(victim_key)):
+                    # Victim is still live and at least as popular; don't admit
+                    self.rejections += 1
+                    return
+                del self._cache[victim_key]
+                self.evictions += 1
             
             self._cache[key] = entry
-            self._access_times[key] = current_time
+            if existing is not None:
+                self._cache.move_to_end(key)
+            
+            self._sweep_front(current_time)
+    
+    def _sweep_front(self, current_time: int) -> None:
+        """Drop expired entries among the least recently used few; caller holds the lock."""
+        expired_keys = [
+            key for key, entry in islice(self._cache.items(), EXPIRY_SWEEP_SIZE)
+            if current_time > entry.expires_at
+        ]
+        for key in expired_keys:
+            del self._cache[key]
     
-    async def delete(self, key: str) -> bool:
+    def delete(self, key: str) -> bool:
         """
         Delete key from cache.
         
@@ -113,53 +213,35 @@ class InMemoryCache:
         Returns:
             True if key was deleted, False if not found
         """
-        async with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                self._access_times.pop(key, None)
-                return True
-            return False
+        with self._lock:
+            return self._cache.pop(key, None) is not None
     
-    async def exists(self, key: str) -> bool:
-        """Check if key exists and is not expired."""
-        value = await self.get(key)
-        return value is not None
+    def exists(self, key: str) -> bool:
+        """Check if key exists and is not expired, without touching stats or LRU order."""
+        entry = self._cache.get(key)
+        return entry is not None and time.monotonic_ns() <= entry.expires_at
     
-    async def clear(self) -> None:
+    def clear(self) -> None:
         """Clear all cache entries."""
-        async with self._lock:
+        with self._lock:
             self._cache.clear()
-            self._access_times.clear()
             self.hits = 0
             self.misses = 0
             self.evictions = 0
+            self.rejections = 0
     
-    async def _evict_lru(self) -> None:
-        """Evict least recently used entry."""
-        if not self._access_times:
-            return
-        
-        # Find least recently used key
-        lru_key = min(self._access_times.items(), key=lambda x: x[1])[0]
-        
-        # Remove from cache
-        self._cache.pop(lru_key, None)
-        self._access_times.pop(lru_key, None)
-        self.evictions += 1
-    
-    async def cleanup_expired(self) -> int:
+    def cleanup_expired(self) -> int:
         """Remove expired entries and return count removed."""
-        async with self._lock:
-            current_time = time.time()
+        with self._lock:
+            current_time = time.monotonic_ns()
             expired_keys = []
             
-            for key, entry in self._cache.items():
+            for key, entry in list(self._cache.items()):
                 if current_time > entry.expires_at:
                     expired_keys.append(key)
             
             for key in expired_keys:
                 del self._cache[key]
-                self._access_times.pop(key, None)
             
             return len(expired_keys)
     
@@ -173,6 +255,75 @@ class InMemoryCache:
             "hits": self.hits,
             "misses": self.misses,
             "evictions": self.evictions,
+            "rejections": self.rejections,
+            "hit_rate": round(hit_rate, 3),
+            "default_ttl": self.default_ttl
+        }
+
+
+class ShardedCache:
+    """
+    InMemoryCache split into independently locked stripes.
+    
+    Keys are routed by hash so writes to unrelated documents don't
+    contend on one lock; the interface matches InMemoryCache.
+    """
+    
+    def __init__(self, default_ttl: int = 3600, max_size: int = 1000, shard_count: int = 16):
+        """
+        Initialize sharded cache.
+        
+        Args:
+            default_ttl: Default time-to-live in seconds
+            max_size: Total maximum number of entries across all shards
+            shard_count: Number of stripes (must be a power of two)
+        """
+        if shard_count & (shard_count - 1):
+            raise ValueError("shard_count must be a power of two")
+        self.default_ttl = default_ttl
+        self.max_size = max_size
+        self._mask = shard_count - 1
+        self._shards = [
+            InMemoryCache(default_ttl=default_ttl, max_size=max(1, max_size // shard_count))
+            for _ in range(shard_count)
+        ]
+    
+    def _shard(self, key: str) -> InMemoryCache:
+        return self._shards[hash(key) & self._mask]
+    
+    def get(self, key: str) -> Optional[Any]:
+        return self._shard(key).get(key)
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self._shard(key).set(key, value, ttl)
+    
+    def delete(self, key: str) -> bool:
+        return self._shard(key).delete(key)
+    
+    def exists(self, key: str) -> bool:
+        return self._shard(key).exists(key)
+    
+    def clear(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+    
+    def cleanup_expired(self) -> int:
+        return sum(shard.cleanup_expired() for shard in self._shards)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics summed across shards."""
+        hits = sum(shard.hits for shard in self._shards)
+        misses = sum(shard.misses for shard in self._shards)
+        hit_rate = hits / (hits + misses) if (hits + misses) > 0 else 0
+        
+        return {
+            "size": sum(len(shard._cache) for shard in self._shards),
+            "max_size": self.max_size,
+            "shards": len(self._shards),
+            "hits": hits,
+            "misses": misses,
+            "evictions": sum(shard.evictions for shard in self._shards),
+            "rejections": sum(shard.rejections for shard in self._shards),
             "hit_rate": round(hit_rate, 3),
             "default_ttl": self.default_ttl
         }
@@ -180,59 +331,61 @@ class InMemoryCache:
 
 # Cache keys for different data types
 class CacheKeys:
-    """Standard cache key patterns."""
+    """
+    Standard cache key patterns.
+    
+    Builders are memoized so repeat lookups reuse the same str object,
+    whose hash CPython caches, instead of formatting and rehashing a new key.
+    """
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def document_clauses(doc_id: str) -> str:
         return f"doc_clauses:{doc_id}"
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def clause_embeddings(doc_id: str) -> str:
         return f"doc_embeddings:{doc_id}"
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def qa_result(doc_id: str, question_hash: str) -> str:
         return f"qa_result:{doc_id}:{question_hash}"
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def conversation_context(session_id: str) -> str:
         return f"conv_context:{session_id}"
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def document_metadata(doc_id: str) -> str:
         return f"doc_meta:{doc_id}"
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def user_by_email(email: str) -> str:
+        return f"user_email:{email}"
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def clause_summary(summary_key: str) -> str:
+        return f"clause_summary:{summary_key}"
 
 
 # Global cache instance
-_cache_instance: Optional[InMemoryCache] = None
+_cache_instance: Optional[ShardedCache] = None
 
 
 @lru_cache()
-def get_cache() -> InMemoryCache:
+def get_cache() -> ShardedCache:
     """Get singleton cache instance."""
     global _cache_instance
     if _cache_instance is None:
         logger.info("Initializing in-memory cache")
-        _cache_instance = InMemoryCache(
+        _cache_instance = ShardedCache(
             default_ttl=3600,  # 1 hour
             max_size=1000      # 1000 entries
         )
     return _cache_instance
-
-
-async def start_cache_cleanup_task():
-    """Start background task for cache cleanup."""
-    cache = get_cache()
-    
-    async def cleanup_loop():
-        while True:
-            try:
-                await asyncio.sleep(300)  # Cleanup every 5 minutes
-                removed = await cache.cleanup_expired()
-                if removed > 0:
-                    logger.info(f"Cache cleanup: removed {removed} expired entries")
-            except Exception as e:
-                logger.error(f"Cache cleanup error: {e}")
-    
-    asyncio.create_task(cleanup_loop())
-    logger.info("Cache cleanup task started")
@@ -1,9 +1,11 @@
 """
 Chat Session Service for managing conversation memory and document context
 """
+import asyncio
 import logging
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Tuple
-from uuid import uuid4
+from uuid6 import uuid7
 from datetime import datetime, timedelta
 
 from google.cloud.firestore import SERVER_TIMESTAMP, FieldFilter, Increment
@@ -18,11 +20,20 @@ from backend.models.chat import (
     UpdateSessionDocumentsRequest,
     AddMessageRequest
 )
+from backend.services.cache_service import CacheKeys, get_cache
 from backend.services.firestore_client import FirestoreClient, FirestoreError
 from backend.services.gemini_client import GeminiClient
 
 logger = logging.getLogger(__name__)
 
+CONTEXT_CACHE_TTL_SECONDS = 30
+
+# Session fields fetched for list views; omits selected_documents and context_summary
+LIST_VIEW_FIELDS = [
+    'session_id', 'title', 'created_at', 'updated_at', 'last_activity',
+    'user_id', 'total_messages', 'total_questions', 'is_archived'
+]
+
 
 class ChatSessionService:
     """Service for managing chat sessions and conversation memory."""
@@ -41,6 +52,14 @@ class ChatSessionService:
         self.context_window_messages = 20  # Messages to include in context
         self.auto_summary_threshold = 50  # Summarize when session exceeds this
         
+        # Locally tracked message counts so add_message only re-reads the
+        # session when the count may have crossed the summary threshold;
+        # least recently active sessions are evicted past the size limit
+        self._last_known_total: "OrderedDict[str, int]" = OrderedDict()
+        self._last_known_total_size = 10000
+        # In-flight summary checks, also keeps the tasks referenced until done
+        self._summary_tasks: Dict[str, asyncio.Task] = {}
+        
     async def create_session(
         self, 
         request: CreateChatSessionRequest
@@ -57,7 +76,7 @@ class ChatSessionService:
         Raises:
             FirestoreError: If session creation fails
         """
-        session_id = str(uuid4())
+        session_id = uuid7().hex
         now = datetime.utcnow()
         
         try:
@@ -93,7 +112,7 @@ class ChatSessionService:
             if 'document_ids' not in session_data or not session_data['document_ids']:
                 session_data['document_ids'] = request.selected_document_ids or []
 
-            session_ref.set(session_data)
+            await asyncio.to_thread(session_ref.set, session_data)
             
             logger.info(f"Created chat session: {session_id}")
             return session, selected_documents
@@ -115,18 +134,13 @@ class ChatSessionService:
         try:
             db = self.firestore_client.db
             session_ref = db.collection(self.sessions_collection).document(session_id)
-            session_doc = session_ref.get()
+            session_doc = await asyncio.to_thread(session_ref.get)
             
             if not session_doc.exists:
                 return None
             
             session_data = session_doc.to_dict()
             
-            # Convert Firestore timestamps to datetime
-            for field in ['created_at', 'updated_at', 'last_activity']:
-                if field in session_data and session_data[field]:
-                    session_data[field] = session_data[field]
-            
             # Get messages for this session
             messages = await self._get_session_messages(session_id)
             session_data['messages'] = messages
@@ -142,7 +156,8 @@ class ChatSessionService:
         self, 
         user_id: Optional[str] = None,
         limit: int = 50,
-        include_archived: bool = False
+        include_archived: bool = False,
+        include_documents: bool = False
     ) -> List[ChatSession]:
         """
         List chat sessions for a user.
@@ -151,6 +166,7 @@ class ChatSessionService:
             user_id: User identifier (optional)
             limit: Maximum number of sessions to return
             include_archived: Whether to include archived sessions
+            include_documents: Whether to load selected_documents and context_summary
             
         Returns:
             List of chat sessions (without full message history)
@@ -171,15 +187,14 @@ class ChatSessionService:
             query = query.order_by("last_activity", direction="DESCENDING")
             query = query.limit(limit)
             
+            if not include_documents:
+                # List view only needs the summary fields
+                query = query.select(LIST_VIEW_FIELDS)
+            
             sessions = []
-            for doc in query.stream():
+            for doc in await asyncio.to_thread(list, query.stream()):
                 session_data = doc.to_dict()
                 
-                # Convert timestamps
-                for field in ['created_at', 'updated_at', 'last_activity']:
-                    if field in session_data and session_data[field]:
-                        session_data[field] = session_data[field]
-                
                 # Don't include full message history in list view
                 session_data['messages'] = []
                 
@@ -220,12 +235,12 @@ class ChatSessionService:
             session_ref = db.collection(self.sessions_collection).document(session_id)
             
             update_data = {
-                'selected_documents': [doc.model_dump() for doc in selected_documents],
+                'selected_documents': [doc.to_firestore() for doc in selected_documents],
                 'updated_at': SERVER_TIMESTAMP,
                 'last_activity': SERVER_TIMESTAMP
             }
             
-            session_ref.update(update_data)
+            await asyncio.to_thread(session_ref.update, update_data)
             
             logger.info(f"Updated documents for session {session_id}: {len(selected_documents)} docs")
             return selected_documents
@@ -253,17 +268,9 @@ class ChatSessionService:
             FirestoreError: If message addition fails
         """
         try:
-            message_id = str(uuid4())
-            now = datetime.utcnow()
-            
-            message = ChatMessage(
-                message_id=message_id,
-                role=request.role,
-                content=request.content,
-                timestamp=now,
-                sources=request.sources or [],
-                metadata=request.metadata or {}
-            )
+            message_id = uuid7().hex
+            sources = request.sources or []
+            metadata = request.metadata or {}
             
             # Store message in subcollection
             db = self.firestore_client.db
@@ -274,11 +281,17 @@ class ChatSessionService:
                 .document(message_id)
             )
             
-            message_data = message.model_dump()
-            message_data['timestamp'] = SERVER_TIMESTAMP
-            message_ref.set(message_data)
+            # Fields were validated by AddMessageRequest; build the payload directly
+            message_data = {
+                'message_id': message_id,
+                'role': request.role.value,
+                'content': request.content,
+                'timestamp': SERVER_TIMESTAMP,
+                'sources': sources,
+                'metadata': metadata
+            }
             
-            # Update session metadata
+            # Store message and update session metadata in one commit
             session_ref = db.collection(self.sessions_collection).document(session_id)
             
             update_data = {
@@ -290,13 +303,29 @@ class ChatSessionService:
             if request.role == MessageRole.USER:
                 update_data['total_questions'] = Increment(1)
             
-            session_ref.update(update_data)
-            
-            # Check if we need to summarize conversation
-            await self._maybe_summarize_session(session_id)
+            batch = db.batch()
+            batch.set(message_ref, message_data)
+            batch.update(session_ref, update_data)
+            await asyncio.to_thread(batch.commit)
+            
+            # Check if we need to summarize conversation (in the background)
+            known_total = self._last_known_total.get(session_id)
+            if known_total is not None:
+                known_total += 1
+                self._remember_total(session_id, known_total)
+            if ((known_total is None or known_total % self.auto_summary_threshold == 0)
+                    and session_id not in self._summary_tasks):
+                self._schedule_summary_check(session_id)
             
             logger.info(f"Added message to session {session_id}: {message_id}")
-            return message
+            return ChatMessage.model_construct(
+                message_id=message_id,
+                role=request.role,
+                content=request.content,
+                timestamp=datetime.utcnow(),
+                sources=sources,
+                metadata=metadata
+            )
             
         except Exception as e:
             logger.error(f"Failed to add message to session {session_id}: {e}")
@@ -318,10 +347,22 @@ class ChatSessionService:
             Tuple of (recent messages, context summary)
         """
         try:
-            # Get session to check for existing summary
-            session = await self.get_session(session_id)
-            if not session:
-                return [], None
+            # Only context_summary is cached; new messages don't change it, so only
+            # _summarize_conversation and delete_session invalidate the entry
+            cache = get_cache()
+            cache_key = CacheKeys.conversation_context(session_id)
+            session_meta = cache.get(cache_key)
+            if session_meta is None:
+                db = self.firestore_client.db
+                session_ref = db.collection(self.sessions_collection).document(session_id)
+                session_doc = await asyncio.to_thread(
+                    session_ref.get, field_paths=['context_summary']
+                )
+                if not session_doc.exists:
+                    return [], None
+                
+                session_meta = session_doc.to_dict() or {}
+                cache.set(cache_key, session_meta, ttl=CONTEXT_CACHE_TTL_SECONDS)
             
             # Get recent messages
             messages = await self._get_session_messages(
@@ -329,7 +370,7 @@ class ChatSessionService:
                 limit=max_messages
             )
             
-            return messages, session.context_summary
+            return messages, session_meta.get('context_summary')
             
         except Exception as e:
             logger.error(f"Failed to get conversation context for {session_id}: {e}")
@@ -359,21 +400,23 @@ class ChatSessionService:
             batch = db.batch()
             batch_count = 0
             
-            for message_doc in messages_ref.stream():
+            for message_doc in await asyncio.to_thread(list, messages_ref.stream()):
                 batch.delete(message_doc.reference)
                 batch_count += 1
                 
                 if batch_count >= 500:  # Firestore batch limit
-                    batch.commit()
+                    await asyncio.to_thread(batch.commit)
                     batch = db.batch()
                     batch_count = 0
             
             if batch_count > 0:
-                batch.commit()
+                await asyncio.to_thread(batch.commit)
             
             # Delete session document
             session_ref = db.collection(self.sessions_collection).document(session_id)
-            session_ref.delete()
+            await asyncio.to_thread(session_ref.delete)
+            self._last_known_total.pop(session_id, None)
+            get_cache().delete(CacheKeys.conversation_context(session_id))
             
             logger.info(f"Deleted chat session: {session_id}")
             return True
@@ -396,7 +439,7 @@ class ChatSessionService:
             db = self.firestore_client.db
             session_ref = db.collection(self.sessions_collection).document(session_id)
             
-            session_ref.update({
+            await asyncio.to_thread(session_ref.update, {
                 'is_archived': True,
                 'updated_at': SERVER_TIMESTAMP
             })
@@ -413,24 +456,28 @@ class ChatSessionService:
         document_ids: List[str]
     ) -> List[DocumentContext]:
         """Get metadata for selected documents."""
-        documents = []
+        try:
+            docs = await self.firestore_client.get_documents(document_ids)
+        except Exception as e:
+            logger.warning(f"Could not get metadata for documents {document_ids}: {e}")
+            # Add with minimal info
+            return [
+                DocumentContext(
+                    doc_id=doc_id,
+                    doc_name=f'Document {doc_id[:8]}',
+                    added_at=datetime.utcnow()
+                )
+                for doc_id in document_ids
+            ]
         
+        documents = []
         for doc_id in document_ids:
-            try:
-                doc = await self.firestore_client.get_document(doc_id)
-                if doc:
-                    documents.append(DocumentContext(
-                        doc_id=doc_id,
-                        doc_name=doc.get('filename', f'Document {doc_id[:8]}'),
-                        status=doc.get('status'),
-                        added_at=datetime.utcnow()
-                    ))
-            except Exception as e:
-                logger.warning(f"Could not get metadata for document {doc_id}: {e}")
-                # Add with minimal info
+            doc = docs.get(doc_id)
+            if doc:
                 documents.append(DocumentContext(
                     doc_id=doc_id,
-                    doc_name=f'Document {doc_id[:8]}',
+                    doc_name=doc.get('filename', f'Document {doc_id[:8]}'),
+                    status=doc.get('status'),
                     added_at=datetime.utcnow()
                 ))
         
@@ -464,14 +511,8 @@ class ChatSessionService:
                 )
             
             messages = []
-            for doc in messages_ref.stream():
-                message_data = doc.to_dict()
-                
-                # Convert timestamp
-                if 'timestamp' in message_data and message_data['timestamp']:
-                    message_data['timestamp'] = message_data['timestamp']
-                
-                messages.append(ChatMessage(**message_data))
+            for doc in await asyncio.to_thread(list, messages_ref.stream()):
+                messages.append(ChatMessage.from_firestore(doc.to_dict()))
             
             # If we limited and reversed, reverse back to chronological order
             if limit:
@@ -483,22 +524,61 @@ class ChatSessionService:
             logger.error(f"Failed to get messages for session {session_id}: {e}")
             return []
     
-    async def _maybe_summarize_session(self, session_id: str) -> None:
-        """Check if session needs summarization and perform it if needed."""
-        try:
-            session = await self.get_session(session_id)
-            if not session:
+    def _remember_total(self, session_id: str, total: int) -> None:
+        """Record a session's message count, evicting the least recently active session if full."""
+        self._last_known_total[session_id] = total
+        self._last_known_total.move_to_end(session_id)
+        if len(self._last_known_total) > self._last_known_total_size:
+            self._last_known_total.popitem(last=False)
+    
+    def _schedule_summary_check(self, session_id: str) -> None:
+        """Run _maybe_summarize_session as a task and record the total it observes."""
+        task = asyncio.create_task(self._maybe_summarize_session(session_id))
+        self._summary_tasks[session_id] = task
+        
+        def _on_done(done: asyncio.Task) -> None:
+            self._summary_tasks.pop(session_id, None)
+            if done.cancelled() or done.exception() is not None:
                 return
+            total = done.result()
+            if total is not None:
+                # Messages counted locally while the check ran are newer than its read
+                self._remember_total(session_id, max(total, self._last_known_total.get(session_id, 0)))
+        
+        task.add_done_callback(_on_done)
+    
+    async def _maybe_summarize_session(self, session_id: str) -> Optional[int]:
+        """
+        Check if session needs summarization and perform it if needed.
+        
+        Returns:
+            The session's current total message count, or None if unavailable
+        """
+        try:
+            # Only the two fields needed here; get_session would stream every message
+            db = self.firestore_client.db
+            session_ref = db.collection(self.sessions_collection).document(session_id)
+            session_doc = await asyncio.to_thread(
+                session_ref.get, field_paths=['total_messages', 'context_summary']
+            )
+            if not session_doc.exists:
+                return None
+            
+            session_data = session_doc.to_dict() or {}
+            total_messages = session_data.get('total_messages', 0)
             
             # Check if we need to summarize
-            if (session.total_messages >= self.auto_summary_threshold and 
-                not session.context_summary):
+            if (total_messages >= self.auto_summary_threshold and 
+                not session_data.get('context_summary')):
                 
                 logger.info(f"Auto-summarizing session {session_id}")
                 await self._summarize_conversation(session_id)
+            
+            return total_messages
                 
         except Exception as e:
             logger.warning(f"Failed to check/perform summarization for {session_id}: {e}")
+            return None
     
     async def _summarize_conversation(self, session_id: str) -> Optional[str]:
         """Generate a summary of the conversation using Gemini."""
@@ -550,10 +630,11 @@ Keep the summary under 200 words."""
                 db = self.firestore_client.db
                 session_ref = db.collection(self.sessions_collection).document(session_id)
                 
-                session_ref.update({
+                await asyncio.to_thread(session_ref.update, {
                     'context_summary': summary,
                     'updated_at': SERVER_TIMESTAMP
                 })
+                get_cache().delete(CacheKeys.conversation_context(session_id))
                 
                 logger.info(f"Generated conversation summary for session {session_id}")
                 return summary
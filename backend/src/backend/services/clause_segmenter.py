@@ -1,15 +1,484 @@
 """
 Clause segmentation service for legal documents
 """
+import asyncio
 import logging
+import os
 import re
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+import string
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field
+
+import numpy as np
+
+# RE2 matches in linear time without backtracking; fall back to re when it isn't installed
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
 
 from backend.core.logging import get_logger, LogContext
 
 logger = get_logger(__name__)
 
+# Comprehensive category patterns with expanded legal terminology
+_CATEGORY_PATTERNS: Dict[str, List[str]] = {
+    "Termination": [
+        # Core termination terms
+        r"\bterminate?\b", r"\bterminating\b", r"\btermination\b", r"\bterminated\b",
+        r"\bend\s+(?:this|the|such)?\s*(?:agreement|contract)\b", r"\bexpir\w*\b",
+        r"\bcancel\w*\b", r"\brescind\b", r"\bvoid\b", r"\bnull\b",
+        # Breach and violation
+        r"\bbreach\b", r"\bviolat\w*\b", r"\bdefault\b", r"\bnon.?compliance\b",
+        r"\bmaterial\s+breach\b", r"\bfundamental\s+breach\b",
+        # Notice and dissolution
+        r"\bnotice\s+(?:of|to)\s+(?:terminate|termination)\b", r"\bdissol\w*\b",
+        r"\bwithdr\w*\b", r"\bquit\b", r"\bexit\b", r"\bceasing?\b", r"\bcease\b",
+        # Automatic termination
+        r"\bautomatic\w*\s+terminat\w*\b", r"\bimmediate\s+terminat\w*\b",
+        # Contract end
+        r"\bcontract\s+(?:end|expir)\w*\b", r"\bagreement\s+(?:end|expir)\w*\b",
+        r"\beffective\s+date\s+of\s+terminat\w*\b"
+    ],
+    "Liability": [
+        # Core liability terms
+        r"\bliabilit\w*\b", r"\bliable\b", r"\bresponsib\w*\b",
+        r"\bdamages?\b", r"\bloss(?:es)?\b", r"\bharm\b", r"\binjur\w*\b",
+        # Limitation of liability
+        r"\blimit\w*\s+(?:of\s+)?liabilit\w*\b", r"\bexclud\w*\s+liabilit\w*\b",
+        r"\bno\s+liabilit\w*\b", r"\bdisclaim\w*\s+liabilit\w*\b",
+        # Types of damages
+        r"\bconsequential\s+damage\w*\b", r"\bincidental\s+damage\w*\b",
+        r"\bpunitive\s+damage\w*\b", r"\bindirect\s+damage\w*\b",
+        r"\bspecial\s+damage\w*\b", r"\bexemplary\s+damage\w*\b",
+        # Causation and fault
+        r"\bcaus\w*\s+(?:by|of|from)\b", r"\bfault\b", r"\bnegligen\w*\b",
+        r"\bmisconduct\b", r"\bwrongful\b", r"\btort\b",
+        # Financial responsibility
+        r"\bpay\w*\s+(?:for\s+)?damage\w*\b", r"\bcompensate?\b", r"\bcompensation\b",
+        r"\breimburse\w*\b", r"\bmake\s+good\b", r"\bcovering?\s+(?:the\s+)?(?:cost|expense)\w*\b"
+    ],
+    "Indemnity": [
+        # Core indemnification
+        r"\bindemnif\w*\b", r"\bindemnity\b", r"\bhold\s+harmless\b",
+        r"\bdefend\b", r"\bprotect\b", r"\bsave\s+harmless\b",
+        # Defense obligations
+        r"\bdefend\s+(?:and\s+)?(?:indemnif\w*|hold\s+harmless)\b",
+        r"\bdefense\s+(?:of|against)\b", r"\blegal\s+defense\b",
+        # Reimbursement and costs
+        r"\breimburse\w*\b", r"\bpay\s+(?:all\s+)?(?:cost|expense)\w*\b",
+        r"\battorney\s*(?:'?s)?\s+fee\w*\b", r"\blegal\s+fee\w*\b", r"\bcourt\s+cost\w*\b",
+        # Third party claims
+        r"\bthird\s+party\s+claim\w*\b", r"\bclaim\w*\s+(?:by|from)\s+third\s+part\w*\b",
+        r"\bsuit\w*\s+(?:by|from|against)\b", r"\baction\w*\s+(?:by|from|against)\b",
+        # Mutual indemnification
+        r"\bmutual\s+indemnif\w*\b", r"\breciprocal\s+indemnit\w*\b",
+        # Indemnification scope
+        r"\bindemnif\w*\s+(?:against|for|from)\b", r"\bhold\s+\w+\s+harmless\s+(?:against|for|from)\b"
+    ],
+    "Confidentiality": [
+        # Core confidentiality
+        r"\bconfidential\w*\b", r"\bnon.?disclosure\b", r"\bNDA\b",
+        r"\bproprietary\b", r"\btrade\s+secret\w*\b", r"\bsecret\b", r"\bprivate\b",
+        # Information protection
+        r"\bprotect\w*\s+information\b", r"\bsensitive\s+information\b",
+        r"\bconfidential\s+information\b", r"\bproprietary\s+information\b",
+        # Disclosure restrictions
+        r"\bnot\s+disclos\w*\b", r"\bprohibit\w*\s+disclos\w*\b", r"\brestrict\w*\s+disclos\w*\b",
+        r"\bforbid\w*\s+disclos\w*\b", r"\bkeep\s+(?:confidential|secret)\b",
+        # Non-use provisions
+        r"\bnon.?use\b", r"\bnot\s+us\w*\s+(?:for|except)\b", r"\bprohibit\w*\s+us\w*\b",
+        # Exceptions and carve-outs
+        r"\bpublic\s+(?:domain|knowledge)\b", r"\bpublicly\s+available\b",
+        r"\bindependent\w*\s+develop\w*\b", r"\bright\w*\s+retain\w*\b",
+        # Duration and survival
+        r"\bsurviv\w*\s+(?:termination|expir\w*)\b", r"\bperpetual\s+confidentialit\w*\b",
+        r"\bconfidentialit\w*\s+(?:period|term)\b"
+    ],
+    "Payment": [
+        # Core payment terms
+        r"\bpayment\w*\b", r"\bpay\b", r"\bfee\w*\b", r"\bcost\w*\b", r"\bprice\w*\b",
+        r"\bamount\w*\b", r"\bsum\w*\b", r"\bcharg\w*\b", r"\bbill\w*\b",
+        # Invoice and billing
+        r"\binvoice\w*\b", r"\bbilling\b", r"\bstatement\w*\b", r"\baccount\w*\b",
+        # Payment terms
+        r"\bdue\s+(?:date|on|within)\b", r"\bnet\s+\d+\b", r"\b(?:30|60|90)\s+day\w*\b",
+        r"\bupon\s+(?:receipt|completion|delivery)\b", r"\bin\s+advance\b",
+        # Payment methods
+        r"\bwire\s+transfer\b", r"\bcheck\b", r"\bcredit\s+card\b", r"\bbank\s+transfer\b",
+        r"\bpaypal\b", r"\belectronic\s+payment\b", r"\bACH\b",
+        # Late payment
+        r"\blate\s+(?:fee|payment|penalty)\b", r"\binterest\s+(?:on|for)\s+late\b",
+        r"\bdelinquen\w*\b", r"\boverdue\b", r"\bdefault\s+(?:in\s+)?payment\b",
+        # Taxes and expenses
+        r"\btax\w*\b", r"\bVAT\b", r"\bsales\s+tax\b", r"\bwithhold\w*\s+tax\b",
+        r"\bexpens\w*\b", r"\breimburs\w*\s+expens\w*\b", r"\bout.?of.?pocket\b"
+    ],
+    "IP Ownership": [
+        # Intellectual property
+        r"\bintellectual\s+property\b", r"\bIP\s+(?:right|ownership)\w*\b",
+        r"\bcopyright\w*\b", r"\btrademark\w*\b", r"\bpatent\w*\b",
+        r"\btrade\s+(?:mark|name)\w*\b", r"\bservice\s+mark\w*\b",
+        # Ownership and rights
+        r"\bownership\b", r"\bown\w*\s+(?:right|title)\w*\b", r"\bproperty\s+right\w*\b",
+        r"\btitle\s+(?:to|in)\b", r"\bright\w*\s+(?:to|in)\b", r"\bexclusive\s+right\w*\b",
+        # Work product and creations
+        r"\bwork\s+product\b", r"\bderivative\s+work\w*\b", r"\boriginal\s+work\w*\b",
+        r"\bcreation\w*\b", r"\binvention\w*\b", r"\bdevelopment\w*\b",
+        # Assignment and licensing
+        r"\bassign\w*\s+(?:right|title|IP|intellectual\s+property)\b",
+        r"\blicens\w*\s+(?:right|IP|intellectual\s+property)\b",
+        r"\btransfer\s+(?:right|ownership|title)\b",
+        # Moral rights and attribution
+        r"\bmoral\s+right\w*\b", r"\battribution\b", r"\bcredit\b", r"\bauthor\w*\b"
+    ],
+    "Dispute Resolution": [
+        # Core dispute terms
+        r"\bdispute\w*\b", r"\bcontroversy\b", r"\bdisagreement\w*\b",
+        r"\bconflict\w*\b", r"\bclaim\w*\b", r"\bgrievance\w*\b",
+        # Alternative dispute resolution
+        r"\barbitration\b", r"\bmediat\w*\b", r"\bnegotiat\w*\b",
+        r"\bconciliat\w*\b", r"\bADR\b", r"\balternative\s+dispute\s+resolution\b",
+        # Court and litigation
+        r"\blitigation\b", r"\bcourt\w*\b", r"\btribunal\w*\b", r"\bjudg\w*\b",
+        r"\bjury\b", r"\btrial\b", r"\blawsuit\w*\b", r"\bsuit\w*\b",
+        # Jurisdiction and venue
+        r"\bjurisdiction\b", r"\bvenue\b", r"\bcompetent\s+court\w*\b",
+        r"\bexclusive\s+jurisdiction\b", r"\bsubmit\s+to\s+jurisdiction\b",
+        # Binding decisions
+        r"\bbinding\s+(?:arbitration|decision|resolution)\b",
+        r"\bfinal\s+(?:and\s+)?binding\b", r"\bnon.?appealable\b",
+        # Escalation procedures
+        r"\bescalat\w*\b", r"\bfirst\s+(?:attempt|try|discuss)\b",
+        r"\bgood\s+faith\s+(?:effort|negotiat\w*)\b"
+    ],
+    "Governing Law": [
+        # Governing law
+        r"\bgoverning\s+law\b", r"\bapplicable\s+law\b", r"\bconstrued\s+(?:under|in\s+accordance\s+with)\b",
+        r"\binterpreted\s+(?:under|in\s+accordance\s+with)\b",
+        # Jurisdiction references
+        r"\bjurisdiction\b", r"\bstate\s+(?:of\s+)?\w+\s+law\b", r"\bfederal\s+law\b",
+        r"\bcountry\s+(?:of\s+)?\w+\s+law\b", r"\blaw\w*\s+of\s+(?:the\s+)?(?:state|country)\b",
+        # Venue
+        r"\bvenue\b", r"\bproper\s+venue\b", r"\bexclusive\s+venue\b",
+        r"\bsubmit\s+to\s+(?:the\s+)?jurisdiction\b",
+        # Choice of law
+        r"\bchoice\s+of\s+law\b", r"\bselection\s+of\s+law\b",
+        r"\blaw\s+(?:governing|applicable\s+to)\b"
+    ],
+    "Assignment": [
+        # Assignment of rights/obligations
+        r"\bassign\w*\b", r"\btransfer\w*\b", r"\bconvey\w*\b",
+        r"\bdelegate\w*\b", r"\bsubcontract\w*\b", r"\bnovation\b",
+        # Assignment restrictions
+        r"\bnot\s+(?:assign|transfer)\b", r"\bprohibit\w*\s+(?:assignment|transfer)\b",
+        r"\brestrict\w*\s+(?:assignment|transfer)\b", r"\bforbid\w*\s+(?:assignment|transfer)\b",
+        # Consent requirements
+        r"\bconsent\s+(?:to\s+)?(?:assign|transfer)\b", r"\bapproval\s+(?:for\s+)?(?:assign|transfer)\b",
+        r"\bwritten\s+consent\b", r"\bprior\s+(?:written\s+)?(?:consent|approval)\b",
+        # Assignment effects
+        r"\bbind\w*\s+(?:successor|assign)\w*\b", r"\bsuccessor\w*\s+(?:and\s+)?assign\w*\b",
+        r"\benure\w*\s+(?:to\s+)?(?:benefit|successor)\b"
+    ],
+    "Modification": [
+        # Amendment and modification
+        r"\bmodif\w*\b", r"\bamend\w*\b", r"\bchange\w*\b", r"\balter\w*\b",
+        r"\bvaried?\b", r"\brevise?\b", r"\bupdate\w*\b", r"\badjust\w*\b",
+        # Waiver and supplement
+        r"\bwaiv\w*\b", r"\bsupplemented?\b", r"\baddendum\b", r"\baddenda\b",
+        # Written requirements
+        r"\bwritten\s+(?:amendment|modification|change)\b",
+        r"\bin\s+writing\b", r"\bsign\w*\s+(?:amendment|modification)\b",
+        # No oral modifications
+        r"\bno\s+oral\s+(?:amendment|modification|change)\b",
+        r"\bwritten\s+agreement\s+(?:only|required)\b",
+        # Entire agreement
+        r"\bentire\s+agreement\b", r"\bcomplete\s+agreement\b", r"\bfull\s+agreement\b",
+        r"\bintegrat\w*\s+agreement\b", r"\bsupersede\w*\b"
+    ],
+    "Warranties": [
+        # Express warranties
+        r"\bwarrant\w*\b", r"\bguarantee\w*\b", r"\brepresent\w*\b",
+        r"\bassur\w*\b", r"\bcovenant\w*\b", r"\bundertaking\w*\b",
+        # Warranty disclaimers
+        r"\bdisclaim\w*\s+warrant\w*\b", r"\bno\s+warrant\w*\b", r"\bas\s+is\b",
+        r"\bwithout\s+warrant\w*\b", r"\bexclud\w*\s+warrant\w*\b",
+        # Types of warranties
+        r"\bmerchantabilit\w*\b", r"\bfitness\s+for\s+(?:a\s+particular\s+)?purpose\b",
+        r"\bnon.?infringement\b", r"\btitle\s+warrant\w*\b",
+        # Warranty period
+        r"\bwarrant\w*\s+period\b", r"\bguarantee\w*\s+period\b",
+        r"\bdefect\w*\b", r"\bconform\w*\s+to\s+specification\w*\b"
+    ],
+    "Force Majeure": [
+        # Force majeure events
+        r"\bforce\s+majeure\b", r"\bact\w*\s+of\s+god\b", r"\buncontrollable\s+circumstance\w*\b",
+        r"\bunavoidable\s+(?:event|circumstance)\w*\b", r"\bbeyond\s+(?:reasonable\s+)?control\b",
+        # Natural disasters
+        r"\bearthquake\w*\b", r"\bflood\w*\b", r"\bhurricane\w*\b", r"\bfire\w*\b",
+        r"\bnatural\s+disaster\w*\b", r"\bcatastroph\w*\b",
+        # Human-caused events
+        r"\bwar\b", r"\bterrorism\b", r"\bstrike\w*\b", r"\blabor\s+dispute\w*\b",
+        r"\bgovernment\w*\s+action\w*\b", r"\bregulatory\s+action\w*\b",
+        # Performance excuses
+        r"\bexcus\w*\s+(?:performance|delay)\b", r"\bsuspend\w*\s+(?:performance|obligation)\w*\b",
+        r"\breliev\w*\s+(?:from|of)\s+(?:performance|obligation)\w*\b"
+    ],
+    "Definitions": [
+        # Definition clauses
+        r"\bdefinition\w*\b", r"\bdefin\w*\s+(?:as|to\s+mean)\b", r"\bmean\w*\b",
+        r"\binclude\w*\s+(?:but\s+(?:not\s+)?limited\s+to)?\b", r"\brefer\w*\s+to\b",
+        # Term definitions
+        r"\b(?:shall\s+)?mean\w*\b", r"\b(?:shall\s+)?include\w*\b",
+        r"\binterpret\w*\s+(?:to\s+mean|as)\b", r"\bunderstood\s+(?:to\s+mean|as)\b",
+        # Capitalized terms
+        r"\bcapitalized\s+term\w*\b", r"\bterm\w*\s+(?:used\s+)?(?:herein|in\s+this\s+agreement)\b",
+        # Cross-references
+        r"\bas\s+defined\s+(?:above|below|herein)\b", r"\bas\s+set\s+forth\s+(?:above|below|herein)\b"
+    ]
+}
+
+# Characters a heading pattern can start with under re.IGNORECASE, including
+# the non-ASCII letters that case-fold into [A-Z] (long s, Kelvin sign, dotless i)
+_HEADING_START_CHARS = frozenset(string.ascii_letters + string.digits + "(\u017f\u212a\u0131")
+
+# Common legal document heading patterns
+_HEADING_PATTERNS: Tuple[str, ...] = (
+    # Numbered sections (1., 2., 3. or 1.1, 1.2, etc.)
+    r'^(\d+\.(?:\d+\.)*)\s+(.+?)(?:\n|$)',
+    # Roman numerals (I., II., III., IV.)
+    r'^([IVX]+\.)\s+(.+?)(?:\n|$)',
+    # Letters (a), (b), (c) or A., B., C.
+    r'^(\([a-z]\)|\(?[A-Z]\.)\s+(.+?)(?:\n|$)',
+    # Article/Section keywords
+    r'^((?:ARTICLE|SECTION|CLAUSE)\s+\d+(?:\.\d+)*)\s*[:\-]?\s*(.+?)(?:\n|$)',
+    # All caps headings
+    r'^([A-Z\s]{3,}?)(?:\n|$)',
+)
+
+# Fuse the patterns into one ordered alternation so each line is matched once;
+# alternatives are tried left to right, same as looping over them in order
+_HEADING_RE = re.compile(
+    "|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(_HEADING_PATTERNS)),
+    re.MULTILINE | re.IGNORECASE
+)
+
+
+def _heading_group_indices() -> Dict[str, List[int]]:
+    """For each alternative of _HEADING_RE, the fused-regex indices of its own capture groups."""
+    groups: Dict[str, List[int]] = {}
+    group_index = 1
+    for i, pattern in enumerate(_HEADING_PATTERNS):
+        inner_groups = re.compile(pattern).groups
+        groups[f"p{i}"] = list(range(group_index + 1, group_index + 1 + inner_groups))
+        group_index += 1 + inner_groups
+    return groups
+
+
+_HEADING_GROUPS = _heading_group_indices()
+
+# Common legal clause keywords for validation
+_LEGAL_KEYWORDS = frozenset({
+    'termination', 'liability', 'indemnity', 'confidentiality', 'payment',
+    'intellectual property', 'dispute resolution', 'governing law',
+    'assignment', 'modification', 'severability', 'entire agreement',
+    'force majeure', 'warranties', 'representations', 'damages',
+    'breach', 'notice', 'jurisdiction', 'venue', 'arbitration'
+})
+# Single pass over the clause finds every keyword (longest first so overlaps prefer the full phrase)
+_LEGAL_KEYWORD_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(_LEGAL_KEYWORDS, key=len, reverse=True))
+)
+
+
+# Clause text cleanup
+_WS_RE = re.compile(r'\s+')
+# Whole page-footer lines only ("Page 3", "Page 3 of 10"); "Page 3" inside a sentence is body text
+_PAGE_RE = re.compile(r'^[ \t]*Page \d+(?: of \d+)?[ \t]*$\n?', re.MULTILINE)
+_FF_RE = re.compile(r'\f')
+_QUOTE_TABLE = str.maketrans({'\u201c': '"', '\u201d': '"', '\u2018': "'", '\u2019': "'"})
+_ASCII_DIGIT_RE = re.compile(r'[0-9]')
+
+
+def _has_digit(text: str) -> bool:
+    """str.isdigit() on any character, scanned in C for the usual ASCII line."""
+    if text.isascii():
+        return _ASCII_DIGIT_RE.search(text) is not None
+    return any(char.isdigit() for char in text)
+
+
+def _compile_category_regex(patterns: List[str]):
+    """Compile a category's patterns into one case-insensitive alternation, preferring RE2."""
+    alternation = "|".join(f"(?:{p})" for p in patterns)
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(f"(?i){alternation}")
+        except Exception as e:
+            logger.warning(f"RE2 rejected category pattern, using re: {e}")
+    return re.compile(alternation, re.IGNORECASE)
+
+
+# Compiled once at import: one alternation per category so each clause is scanned once per category
+_CATEGORY_REGEXES: Dict[str, Any] = {
+    category: _compile_category_regex(patterns)
+    for category, patterns in _CATEGORY_PATTERNS.items()
+}
+
+_CATEGORY_NAMES: List[str] = list(_CATEGORY_PATTERNS)
+_CATEGORY_REGEX_LIST = [_CATEGORY_REGEXES[category] for category in _CATEGORY_NAMES]
+# Patterns per category, aligned with _CATEGORY_NAMES, for normalizing scores
+_PATTERN_COUNTS = np.array([len(_CATEGORY_PATTERNS[c]) for c in _CATEGORY_NAMES], dtype=np.float64)
+
+
+def _required_literal(pattern: str) -> Optional[str]:
+    """
+    Longest lowercase letter run that every match of pattern must contain.
+    
+    Only unquantified letters outside groups count; a letter followed by
+    ?, * or { is optional and ends the run.
+    
+    Args:
+        pattern: Category regex source
+        
+    Returns:
+        Required literal, or None if the pattern has none (or a top-level |)
+    """
+    runs, run, i, depth = [], "", 0, 0
+    while i < len(pattern):
+        if pattern[i] == "\\":
+            token_end = i + 2
+        elif pattern[i] == "[":
+            token_end = pattern.index("]", i) + 1
+        else:
+            token_end = i + 1
+        token, i = pattern[i:token_end], token_end
+        
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+        elif token == "|" and depth == 0:
+            return None
+        
+        quantified = i < len(pattern) and pattern[i] in "?*{"
+        if depth == 0 and token.isalpha() and not quantified:
+            run += token.lower()
+        else:
+            runs.append(run)
+            run = ""
+    runs.append(run)
+    return max(runs, key=len) or None
+
+
+def _category_literals(patterns: List[str]) -> Optional[List[str]]:
+    """Literals of which any clause matching the category contains at least one, or None if unknown."""
+    literals = set()
+    for pattern in patterns:
+        literal = _required_literal(pattern)
+        if literal is None:
+            return None
+        literals.add(literal)
+    # A literal containing a shorter one is redundant: the shorter one is found whenever it is
+    return [
+        literal for literal in sorted(literals, key=len)
+        if not any(other in literal for other in literals if other != literal)
+    ]
+
+
+# Cheap substring prefilter aligned with _CATEGORY_NAMES: a category whose literals are
+# all absent from a clause can't match, so its regex is skipped
+_CATEGORY_LITERALS = [_category_literals(_CATEGORY_PATTERNS[c]) for c in _CATEGORY_NAMES]
+
+# Below this many clauses thread start-up costs more than the overlapped scans save
+PARALLEL_SCAN_MIN_CLAUSES = 16
+
+# Clauses shorter than this are left as "Other" without scanning
+MIN_SCORING_WORDS = 20
+# Clauses longer than this are categorized from their first MAX_SCORING_CHARS characters
+MAX_SCORING_WORDS = 5000
+MAX_SCORING_CHARS = 20000
+
+# Apply confidence threshold - require minimum confidence to avoid "Other"
+CATEGORY_CONFIDENCE_THRESHOLD = 0.2  # Minimum 20% confidence
+CATEGORY_EVIDENCE_THRESHOLD = 1.5    # Minimum weighted evidence score
+
+
+def _count_category_matches(text_lower: str) -> List[int]:
+    """Match counts for one clause, in _CATEGORY_NAMES order; touches only the compiled regexes."""
+    # Case-insensitive matching folds a few non-ASCII letters (e.g. the Kelvin sign) onto
+    # ASCII ones, which substring checks would miss, so only prefilter ASCII text
+    prefilter = text_lower.isascii()
+    counts = []
+    for regex, literals in zip(_CATEGORY_REGEX_LIST, _CATEGORY_LITERALS):
+        if prefilter and literals is not None and not any(literal in text_lower for literal in literals):
+            counts.append(0)
+        else:
+            # Count matches lazily rather than building findall's list of match strings
+            counts.append(sum(1 for _ in regex.finditer(text_lower)))
+    return counts
+
+
+def _score_categories(match_counts: np.ndarray, clause_lengths: np.ndarray) -> np.ndarray:
+    """
+    Weighted category scores for a batch of clauses.
+    
+    Args:
+        match_counts: (clauses, categories) pattern hits, columns aligned with _CATEGORY_NAMES
+        clause_lengths: Clause lengths in words
+        
+    Returns:
+        (clauses, categories) scores, 0.0 where nothing matched
+    """
+    # Longer clauses get slight boost for pattern matches
+    length_factor = np.where(
+        clause_lengths > 50,
+        np.minimum(1.5, 1.0 + (clause_lengths - 50) / 200),
+        1.0
+    )
+    
+    # Normalize score by number of patterns in category to prevent bias
+    return match_counts * length_factor[:, None] / _PATTERN_COUNTS[None, :] * match_counts
+
+
+def _pick_categories(scores: np.ndarray) -> List[str]:
+    """
+    Choose a category per clause, or "Other" where the evidence is weak.
+    
+    Args:
+        scores: (clauses, categories) scores from _score_categories
+        
+    Returns:
+        Category name per clause
+    """
+    best_index = scores.argmax(axis=1)
+    # Only the top two per row matter; partition finds them in linear time instead of sorting
+    top_two = np.partition(scores, -2, axis=1)
+    best_score, runner_up = top_two[:, -1], top_two[:, -2]
+    matched_categories = (scores > 0).sum(axis=1)
+    
+    # Calculate confidence based on score separation and total evidence
+    with np.errstate(divide="ignore", invalid="ignore"):
+        separation = (best_score - runner_up) / best_score
+    confidence = np.where(
+        matched_categories > 1,
+        separation,
+        np.minimum(1.0, best_score / 2.0)  # Single category match
+    )
+    
+    accepted = (
+        (matched_categories > 0)
+        & (confidence >= CATEGORY_CONFIDENCE_THRESHOLD)
+        & (best_score >= CATEGORY_EVIDENCE_THRESHOLD)
+    )
+    return [
+        _CATEGORY_NAMES[index] if ok else "Other"
+        for index, ok in zip(best_index.tolist(), accepted.tolist())
+    ]
+
 
 @dataclass
 class ClauseCandidate:
@@ -24,42 +493,38 @@ class ClauseCandidate:
     bounding_box: Optional[Dict[str, float]] = None
     order: int = 0
     category: str = "Other"
+    # Derived-value caches, each tagged with the text they were computed from since
+    # merging and cleaning reassign text
+    _text_lower: Optional[Tuple[str, str]] = field(default=None, init=False, repr=False, compare=False)
+    _word_count: Optional[Tuple[str, int]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def text_lower(self) -> str:
+        """Lowercased text, computed once per text value."""
+        if self._text_lower is None or self._text_lower[0] is not self.text:
+            self._text_lower = (self.text, self.text.lower())
+        return self._text_lower[1]
+    
+    @property
+    def word_count(self) -> int:
+        """Whitespace-delimited word count, computed once per text value."""
+        if self._word_count is None or self._word_count[0] is not self.text:
+            self._word_count = (self.text, len(self.text.split()))
+        return self._word_count[1]
 
 
 class ClauseSegmenter:
     """Service for segmenting legal documents into individual clauses."""
     
     def __init__(self):
-
-        # Common legal document heading patterns
-        self.heading_patterns = [
-            # Numbered sections (1., 2., 3. or 1.1, 1.2, etc.)
-            r'^(\d+\.(?:\d+\.)*)\s+(.+?)(?:\n|$)',
-            # Roman numerals (I., II., III., IV.)
-            r'^([IVX]+\.)\s+(.+?)(?:\n|$)',
-            # Letters (a), (b), (c) or A., B., C.
-            r'^(\([a-z]\)|\(?[A-Z]\.)\s+(.+?)(?:\n|$)',
-            # Article/Section keywords
-            r'^((?:ARTICLE|SECTION|CLAUSE)\s+\d+(?:\.\d+)*)\s*[:\-]?\s*(.+?)(?:\n|$)',
-            # All caps headings
-            r'^([A-Z\s]{3,}?)(?:\n|$)',
-        ]
-        
-        # Compile regex patterns for performance
-        self.compiled_patterns = [re.compile(pattern, re.MULTILINE | re.IGNORECASE) 
-                                for pattern in self.heading_patterns]
-        
-        # Common legal clause keywords for validation
-        self.legal_keywords = {
-            'termination', 'liability', 'indemnity', 'confidentiality', 'payment',
-            'intellectual property', 'dispute resolution', 'governing law',
-            'assignment', 'modification', 'severability', 'entire agreement',
-            'force majeure', 'warranties', 'representations', 'damages',
-            'breach', 'notice', 'jurisdiction', 'venue', 'arbitration'
-        }
-
+        # Compiled tables are module-level and shared by every instance
+        self.heading_patterns = _HEADING_PATTERNS
+        self._heading_re = _HEADING_RE
+        self._heading_groups = _HEADING_GROUPS
+        self.legal_keywords = _LEGAL_KEYWORDS
+        self._legal_keyword_re = _LEGAL_KEYWORD_RE
     
-    async def segment_document(
+    def segment_document(
         self, 
         document_data: Dict[str, Any]
     ) -> List[ClauseCandidate]:
@@ -81,19 +546,34 @@ class ClauseSegmenter:
             
             if method == "document_ai":
                 # Use layout information from Document AI
-                clauses = await self._segment_with_layout(text, pages)
+                clauses = self._segment_with_layout(text, pages)
             else:
                 # Use text-based heuristics for fallback methods
-                clauses = await self._segment_with_text_analysis(text)
+                clauses = self._segment_with_text_analysis(text)
             
             # Post-process and validate clauses
-            validated_clauses = await self._validate_and_merge_clauses(clauses)
+            validated_clauses = self._validate_and_merge_clauses(clauses)
             
             logger.info(f"Segmentation complete: {len(validated_clauses)} clauses identified")
             
             return validated_clauses
     
-    async def _segment_with_layout(
+    async def segment_document_async(
+        self,
+        document_data: Dict[str, Any]
+    ) -> List[ClauseCandidate]:
+        """
+        Segment a document on a worker thread so the event loop stays free.
+        
+        Args:
+            document_data: Processed document from DocumentProcessor
+            
+        Returns:
+            List of clause candidates with metadata
+        """
+        return await asyncio.to_thread(self.segment_document, document_data)
+    
+    def _segment_with_layout(
         self, 
         text: str, 
         pages: List[Dict[str, Any]]
@@ -109,6 +589,11 @@ class ClauseSegmenter:
             List of clause candidates
         """
         clauses = []
+        # Blocks appear in document order, so search forward from the last match
+        cursor = 0
+        # Blocks merged into the last clause, joined once when the clause is complete
+        tail_parts: List[str] = []
+        tail_words = 0
         
         for page_info in pages:
             page_num = page_info.get("page_number", 1)
@@ -120,14 +605,26 @@ class ClauseSegmenter:
                 if len(block_text) < 50:  # Skip very short blocks
                     continue
                 
+                start = text.find(block_text, cursor)
+                if start == -1:
+                    # Out-of-order block; fall back to a full search
+                    start = text.find(block_text)
+                end = start + len(block_text)
+                if start != -1:
+                    cursor = end
+                
                 # Check if this looks like a clause heading
                 heading = self._extract_heading_from_text(block_text)
                 if heading:
                     # This block starts with a heading
+                    if len(tail_parts) > 1:
+                        clauses[-1].text = "\n".join(tail_parts)
+                    tail_parts = [block_text]
+                    tail_words = len(block_text.split())
                     clause = ClauseCandidate(
                         text=block_text,
-                        start_position=text.find(block_text),
-                        end_position=text.find(block_text) + len(block_text),
+                        start_position=start,
+                        end_position=end,
                         heading=heading,
                         confidence=block.get("confidence", 0.8),
                         page_number=page_num,
@@ -136,24 +633,32 @@ class ClauseSegmenter:
                     clauses.append(clause)
                 else:
                     # Check if this continues a previous clause
-                    if clauses and self._should_merge_with_previous(block_text, clauses[-1]):
-                        clauses[-1].text += "\n" + block_text
-                        clauses[-1].end_position = text.find(block_text) + len(block_text)
+                    if clauses and self._should_merge_with_previous(block_text, tail_words):
+                        tail_parts.append(block_text)
+                        tail_words += len(block_text.split())
+                        clauses[-1].end_position = end
                     else:
                         # This might be a clause without a clear heading
+                        if len(tail_parts) > 1:
+                            clauses[-1].text = "\n".join(tail_parts)
+                        tail_parts = [block_text]
+                        tail_words = len(block_text.split())
                         clause = ClauseCandidate(
                             text=block_text,
-                            start_position=text.find(block_text),
-                            end_position=text.find(block_text) + len(block_text),
+                            start_position=start,
+                            end_position=end,
                             confidence=block.get("confidence", 0.5),
                             page_number=page_num,
                             bounding_box=block.get("bounding_box")
                         )
                         clauses.append(clause)
         
+        if len(tail_parts) > 1:
+            clauses[-1].text = "\n".join(tail_parts)
+        
         return clauses
     
-    async def _segment_with_text_analysis(self, text: str) -> List[ClauseCandidate]:
+    def _segment_with_text_analysis(self, text: str) -> List[ClauseCandidate]:
         """
         Segment document using text analysis and pattern matching.
         
@@ -165,16 +670,20 @@ class ClauseSegmenter:
         """
         clauses = []
         lines = text.split('\n')
+        # Offset of each line in text: previous offset + line length + the newline
+        line_offsets = [0, *accumulate(len(raw) + 1 for raw in lines[:-1])]
         
         current_clause_lines = []
         current_heading = None
         current_start = 0
         
-        for i, line in enumerate(lines):
-            line = line.strip()
+        for i, raw_line in enumerate(lines):
+            line = raw_line.strip()
             if not line:
                 continue
             
+            line_start = line_offsets[i] + len(raw_line) - len(raw_line.lstrip())
+            
             # Check if this line is a heading
             heading_match = self._extract_heading_from_text(line)
             
@@ -186,15 +695,15 @@ class ClauseSegmenter:
                         text=clause_text,
                         start_position=current_start,
                         end_position=current_start + len(clause_text),
-                        heading=current_heading,
-                        confidence=self._calculate_clause_confidence(clause_text)
+                        heading=current_heading
                     )
+                    clause.confidence = self._calculate_clause_confidence(clause)
                     clauses.append(clause)
                 
                 # Start new clause
                 current_clause_lines = [line]
                 current_heading = heading_match
-                current_start = text.find(line)
+                current_start = line_start
             else:
                 # Add to current clause
                 if current_clause_lines:
@@ -202,7 +711,7 @@ class ClauseSegmenter:
                 else:
                     # This might be the beginning of the document
                     current_clause_lines = [line]
-                    current_start = text.find(line)
+                    current_start = line_start
         
         # Don't forget the last clause
         if current_clause_lines:
@@ -211,9 +720,9 @@ class ClauseSegmenter:
                 text=clause_text,
                 start_position=current_start,
                 end_position=current_start + len(clause_text),
-                heading=current_heading,
-                confidence=self._calculate_clause_confidence(clause_text)
+                heading=current_heading
             )
+            clause.confidence = self._calculate_clause_confidence(clause)
             clauses.append(clause)
         
         return clauses
@@ -229,20 +738,28 @@ class ClauseSegmenter:
             Heading text if found, None otherwise
         """
         text = text.strip()
-        
-        # Try each compiled pattern
-        for pattern in self.compiled_patterns:
-            match = pattern.match(text)
-            if match:
-                if len(match.groups()) >= 2:
-                    # Pattern with heading number and title
-                    return f"{match.group(1).strip()} {match.group(2).strip()}"
-                else:
-                    # Pattern with just heading text
-                    return match.group(1).strip()
+        if len(text) < 3:
+            return None
+        
+        # Every heading pattern starts with a digit (\d also matches non-ASCII
+        # decimal digits), a letter or "("; skip the regex otherwise
+        first = text[0]
+        match = (
+            self._heading_re.match(text)
+            if first in _HEADING_START_CHARS or first.isdecimal()
+            else None
+        )
+        if match:
+            groups = self._heading_groups[match.lastgroup]
+            if len(groups) >= 2:
+                # Pattern with heading number and title
+                return f"{match.group(groups[0]).strip()} {match.group(groups[1]).strip()}"
+            else:
+                # Pattern with just heading text
+                return match.group(groups[0]).strip()
         
         # Check for all-caps lines (potential headings)
-        if len(text) > 5 and text.isupper() and not any(char.isdigit() for char in text):
+        if len(text) > 5 and text.isupper() and not _has_digit(text):
             return text
         
         return None
@@ -250,14 +767,14 @@ class ClauseSegmenter:
     def _should_merge_with_previous(
         self, 
         current_text: str, 
-        previous_clause: ClauseCandidate
+        previous_word_count: int
     ) -> bool:
         """
         Determine if current text should be merged with the previous clause.
         
         Args:
             current_text: Current text block
-            previous_clause: Previous clause candidate
+            previous_word_count: Word count of the previous clause so far
             
         Returns:
             True if texts should be merged
@@ -267,11 +784,12 @@ class ClauseSegmenter:
             return False
         
         # Merge if previous clause doesn't have much content yet
-        if len(previous_clause.text.split()) < 20:
+        if previous_word_count < 20:
             return True
         
         # Merge if current text starts with lowercase (continuation)
-        first_word = current_text.split()[0] if current_text.split() else ""
+        words = current_text.split(maxsplit=1)
+        first_word = words[0] if words else ""
         if first_word and first_word[0].islower():
             return True
         
@@ -281,41 +799,42 @@ class ClauseSegmenter:
         
         return False
     
-    def _calculate_clause_confidence(self, text: str) -> float:
+    def _calculate_clause_confidence(self, clause: ClauseCandidate) -> float:
         """
         Calculate confidence score for a clause candidate.
         
         Args:
-            text: Clause text
+            clause: Clause candidate; its cached word count and lowercased
+                text are reused by later passes
             
         Returns:
             Confidence score between 0 and 1
         """
+        text = clause.text
         confidence = 0.5  # Base confidence
         
         # Length-based confidence
-        word_count = len(text.split())
+        word_count = clause.word_count
         if 20 <= word_count <= 500:
             confidence += 0.2
         elif word_count < 10:
             confidence -= 0.3
         
         # Legal keyword presence
-        text_lower = text.lower()
-        keyword_matches = sum(1 for keyword in self.legal_keywords 
-                            if keyword in text_lower)
+        text_lower = clause.text_lower
+        keyword_matches = len(set(self._legal_keyword_re.findall(text_lower)))
         
         if keyword_matches > 0:
             confidence += min(0.3, keyword_matches * 0.1)
         
         # Sentence structure
-        sentence_count = len([s for s in text.split('.') if s.strip()])
+        sentence_count = sum(1 for s in text.split('.') if s.strip())
         if sentence_count >= 2:
             confidence += 0.1
         
         return min(1.0, max(0.1, confidence))
     
-    async def _validate_and_merge_clauses(
+    def _validate_and_merge_clauses(
         self, 
         clauses: List[ClauseCandidate]
     ) -> List[ClauseCandidate]:
@@ -332,15 +851,36 @@ class ClauseSegmenter:
             return []
         
         validated = []
+        # Short clauses waiting to be prepended to the next kept clause
+        pending_prefix: List[str] = []
+        pending_start: Optional[int] = None
+        
+        # Column views of the numeric fields; a merged clause's word count is the
+        # sum of its parts, so merged text never needs re-splitting
+        word_counts = np.fromiter((c.word_count for c in clauses), dtype=np.int64, count=len(clauses))
+        confident = np.fromiter((c.confidence >= 0.8 for c in clauses), dtype=bool, count=len(clauses))
+        # Clauses long or confident enough on their own are kept regardless of merges
+        always_keep = (word_counts >= 5) | confident
+        carried_words = 0
         
         for i, clause in enumerate(clauses):
             # Skip very short clauses unless they have high confidence
-            if len(clause.text.split()) < 5 and clause.confidence < 0.8:
+            if not always_keep[i] and carried_words + word_counts[i] < 5:
                 # Try to merge with next clause
                 if i < len(clauses) - 1:
-                    clauses[i + 1].text = clause.text + "\n" + clauses[i + 1].text
-                    clauses[i + 1].start_position = clause.start_position
+                    pending_prefix.append(clause.text)
+                    if pending_start is None:
+                        pending_start = clause.start_position
+                    carried_words += int(word_counts[i])
                 continue
+            carried_words = 0
+            
+            if pending_prefix:
+                pending_prefix.append(clause.text)
+                clause.text = "\n".join(pending_prefix)
+                clause.start_position = pending_start
+                pending_prefix.clear()
+                pending_start = None
             
             # Clean up clause text
             clause.text = self._clean_clause_text(clause.text)
@@ -362,20 +902,19 @@ class ClauseSegmenter:
         Returns:
             Cleaned clause text
         """
-        # Remove excessive whitespace
-        text = re.sub(r'\\s+', ' ', text)
+        # Remove page breaks and similar artifacts (before newlines are collapsed)
+        text = _PAGE_RE.sub('', text)
+        text = _FF_RE.sub('', text)  # Form feed characters
         
-        # Remove page breaks and similar artifacts
-        text = re.sub(r'Page \\d+.*?\\n', '', text)
-        text = re.sub(r'\\f', '', text)  # Form feed characters
+        # Remove excessive whitespace
+        text = _WS_RE.sub(' ', text)
         
         # Normalize quotes
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace("'", "'").replace("'", "'")
+        text = text.translate(_QUOTE_TABLE)
         
         return text.strip()
     
-    async def identify_clause_types(
+    def identify_clause_types(
         self, 
         clauses: List[ClauseCandidate]
     ) -> List[ClauseCandidate]:
@@ -388,277 +927,34 @@ class ClauseSegmenter:
         Returns:
             Clauses with identified types
         """
-        # Comprehensive category patterns with expanded legal terminology
-        category_patterns = {
-            "Termination": [
-                # Core termination terms
-                r"\\bterminate?\\b", r"\\bterminating\\b", r"\\btermination\\b", r"\\bterminated\\b",
-                r"\\bend\\s+(?:this|the|such)?\\s*(?:agreement|contract)\\b", r"\\bexpir\\w*\\b",
-                r"\\bcancel\\w*\\b", r"\\brescind\\b", r"\\bvoid\\b", r"\\bnull\\b",
-                # Breach and violation
-                r"\\bbreach\\b", r"\\bviolat\\w*\\b", r"\\bdefault\\b", r"\\bnon.?compliance\\b",
-                r"\\bmaterial\\s+breach\\b", r"\\bfundamental\\s+breach\\b",
-                # Notice and dissolution
-                r"\\bnotice\\s+(?:of|to)\\s+(?:terminate|termination)\\b", r"\\bdissol\\w*\\b",
-                r"\\bwithdr\\w*\\b", r"\\bquit\\b", r"\\bexit\\b", r"\\bceasing?\\b", r"\\bcease\\b",
-                # Automatic termination
-                r"\\bautomatic\\w*\\s+terminat\\w*\\b", r"\\bimmediate\\s+terminat\\w*\\b",
-                # Contract end
-                r"\\bcontract\\s+(?:end|expir)\\w*\\b", r"\\bagreement\\s+(?:end|expir)\\w*\\b",
-                r"\\beffective\\s+date\\s+of\\s+terminat\\w*\\b"
-            ],
-            "Liability": [
-                # Core liability terms
-                r"\\bliabilit\\w*\\b", r"\\bliable\\b", r"\\bresponsib\\w*\\b",
-                r"\\bdamages?\\b", r"\\bloss(?:es)?\\b", r"\\bharm\\b", r"\\binjur\\w*\\b",
-                # Limitation of liability
-                r"\\blimit\\w*\\s+(?:of\\s+)?liabilit\\w*\\b", r"\\bexclud\\w*\\s+liabilit\\w*\\b",
-                r"\\bno\\s+liabilit\\w*\\b", r"\\bdisclaim\\w*\\s+liabilit\\w*\\b",
-                # Types of damages
-                r"\\bconsequential\\s+damage\\w*\\b", r"\\bincidental\\s+damage\\w*\\b",
-                r"\\bpunitive\\s+damage\\w*\\b", r"\\bindirect\\s+damage\\w*\\b",
-                r"\\bspecial\\s+damage\\w*\\b", r"\\bexemplary\\s+damage\\w*\\b",
-                # Causation and fault
-                r"\\bcaus\\w*\\s+(?:by|of|from)\\b", r"\\bfault\\b", r"\\bnegligen\\w*\\b",
-                r"\\bmisconduct\\b", r"\\bwrongful\\b", r"\\btort\\b",
-                # Financial responsibility
-                r"\\bpay\\w*\\s+(?:for\\s+)?damage\\w*\\b", r"\\bcompensate?\\b", r"\\bcompensation\\b",
-                r"\\breimburse\\w*\\b", r"\\bmake\\s+good\\b", r"\\bcovering?\\s+(?:the\\s+)?(?:cost|expense)\\w*\\b"
-            ],
-            "Indemnity": [
-                # Core indemnification
-                r"\\bindemnif\\w*\\b", r"\\bindemnity\\b", r"\\bhold\\s+harmless\\b",
-                r"\\bdefend\\b", r"\\bprotect\\b", r"\\bsave\\s+harmless\\b",
-                # Defense obligations
-                r"\\bdefend\\s+(?:and\\s+)?(?:indemnif\\w*|hold\\s+harmless)\\b",
-                r"\\bdefense\\s+(?:of|against)\\b", r"\\blegal\\s+defense\\b",
-                # Reimbursement and costs
-                r"\\breimburse\\w*\\b", r"\\bpay\\s+(?:all\\s+)?(?:cost|expense)\\w*\\b",
-                r"\\battorney\\s*(?:'?s)?\\s+fee\\w*\\b", r"\\blegal\\s+fee\\w*\\b", r"\\bcourt\\s+cost\\w*\\b",
-                # Third party claims
-                r"\\bthird\\s+party\\s+claim\\w*\\b", r"\\bclaim\\w*\\s+(?:by|from)\\s+third\\s+part\\w*\\b",
-                r"\\bsuit\\w*\\s+(?:by|from|against)\\b", r"\\baction\\w*\\s+(?:by|from|against)\\b",
-                # Mutual indemnification
-                r"\\bmutual\\s+indemnif\\w*\\b", r"\\breciprocal\\s+indemnit\\w*\\b",
-                # Indemnification scope
-                r"\\bindemnif\\w*\\s+(?:against|for|from)\\b", r"\\bhold\\s+\\w+\\s+harmless\\s+(?:against|for|from)\\b"
-            ],
-            "Confidentiality": [
-                # Core confidentiality
-                r"\\bconfidential\\w*\\b", r"\\bnon.?disclosure\\b", r"\\bNDA\\b",
-                r"\\bproprietary\\b", r"\\btrade\\s+secret\\w*\\b", r"\\bsecret\\b", r"\\bprivate\\b",
-                # Information protection
-                r"\\bprotect\\w*\\s+information\\b", r"\\bsensitive\\s+information\\b",
-                r"\\bconfidential\\s+information\\b", r"\\bproprietary\\s+information\\b",
-                # Disclosure restrictions
-                r"\\bnot\\s+disclos\\w*\\b", r"\\bprohibit\\w*\\s+disclos\\w*\\b", r"\\brestrict\\w*\\s+disclos\\w*\\b",
-                r"\\bforbid\\w*\\s+disclos\\w*\\b", r"\\bkeep\\s+(?:confidential|secret)\\b",
-                # Non-use provisions
-                r"\\bnon.?use\\b", r"\\bnot\\s+us\\w*\\s+(?:for|except)\\b", r"\\bprohibit\\w*\\s+us\\w*\\b",
-                # Exceptions and carve-outs
-                r"\\bpublic\\s+(?:domain|knowledge)\\b", r"\\bpublicly\\s+available\\b",
-                r"\\bindependent\\w*\\s+develop\\w*\\b", r"\\bright\\w*\\s+retain\\w*\\b",
-                # Duration and survival
-                r"\\bsurviv\\w*\\s+(?:termination|expir\\w*)\\b", r"\\bperpetual\\s+confidentialit\\w*\\b",
-                r"\\bconfidentialit\\w*\\s+(?:period|term)\\b"
-            ],
-            "Payment": [
-                # Core payment terms
-                r"\\bpayment\\w*\\b", r"\\bpay\\b", r"\\bfee\\w*\\b", r"\\bcost\\w*\\b", r"\\bprice\\w*\\b",
-                r"\\bamount\\w*\\b", r"\\bsum\\w*\\b", r"\\bcharg\\w*\\b", r"\\bbill\\w*\\b",
-                # Invoice and billing
-                r"\\binvoice\\w*\\b", r"\\bbilling\\b", r"\\bstatement\\w*\\b", r"\\baccount\\w*\\b",
-                # Payment terms
-                r"\\bdue\\s+(?:date|on|within)\\b", r"\\bnet\\s+\\d+\\b", r"\\b(?:30|60|90)\\s+day\\w*\\b",
-                r"\\bupon\\s+(?:receipt|completion|delivery)\\b", r"\\bin\\s+advance\\b",
-                # Payment methods
-                r"\\bwire\\s+transfer\\b", r"\\bcheck\\b", r"\\bcredit\\s+card\\b", r"\\bbank\\s+transfer\\b",
-                r"\\bpaypal\\b", r"\\belectronic\\s+payment\\b", r"\\bACH\\b",
-                # Late payment
-                r"\\blate\\s+(?:fee|payment|penalty)\\b", r"\\binterest\\s+(?:on|for)\\s+late\\b",
-                r"\\bdelinquen\\w*\\b", r"\\boverdue\\b", r"\\bdefault\\s+(?:in\\s+)?payment\\b",
-                # Taxes and expenses
-                r"\\btax\\w*\\b", r"\\bVAT\\b", r"\\bsales\\s+tax\\b", r"\\bwithhold\\w*\\s+tax\\b",
-                r"\\bexpens\\w*\\b", r"\\breimburs\\w*\\s+expens\\w*\\b", r"\\bout.?of.?pocket\\b"
-            ],
-            "IP Ownership": [
-                # Intellectual property
-                r"\\bintellectual\\s+property\\b", r"\\bIP\\s+(?:right|ownership)\\w*\\b",
-                r"\\bcopyright\\w*\\b", r"\\btrademark\\w*\\b", r"\\bpatent\\w*\\b",
-                r"\\btrade\\s+(?:mark|name)\\w*\\b", r"\\bservice\\s+mark\\w*\\b",
-                # Ownership and rights
-                r"\\bownership\\b", r"\\bown\\w*\\s+(?:right|title)\\w*\\b", r"\\bproperty\\s+right\\w*\\b",
-                r"\\btitle\\s+(?:to|in)\\b", r"\\bright\\w*\\s+(?:to|in)\\b", r"\\bexclusive\\s+right\\w*\\b",
-                # Work product and creations
-                r"\\bwork\\s+product\\b", r"\\bderivative\\s+work\\w*\\b", r"\\boriginal\\s+work\\w*\\b",
-                r"\\bcreation\\w*\\b", r"\\binvention\\w*\\b", r"\\bdevelopment\\w*\\b",
-                # Assignment and licensing
-                r"\\bassign\\w*\\s+(?:right|title|IP|intellectual\\s+property)\\b",
-                r"\\blicens\\w*\\s+(?:right|IP|intellectual\\s+property)\\b",
-                r"\\btransfer\\s+(?:right|ownership|title)\\b",
-                # Moral rights and attribution
-                r"\\bmoral\\s+right\\w*\\b", r"\\battribution\\b", r"\\bcredit\\b", r"\\bauthor\\w*\\b"
-            ],
-            "Dispute Resolution": [
-                # Core dispute terms
-                r"\\bdispute\\w*\\b", r"\\bcontroversy\\b", r"\\bdisagreement\\w*\\b",
-                r"\\bconflict\\w*\\b", r"\\bclaim\\w*\\b", r"\\bgrievance\\w*\\b",
-                # Alternative dispute resolution
-                r"\\barbitration\\b", r"\\bmediat\\w*\\b", r"\\bnegotiat\\w*\\b",
-                r"\\bconciliat\\w*\\b", r"\\bADR\\b", r"\\balternative\\s+dispute\\s+resolution\\b",
-                # Court and litigation
-                r"\\blitigation\\b", r"\\bcourt\\w*\\b", r"\\btribunal\\w*\\b", r"\\bjudg\\w*\\b",
-                r"\\bjury\\b", r"\\btrial\\b", r"\\blawsuit\\w*\\b", r"\\bsuit\\w*\\b",
-                # Jurisdiction and venue
-                r"\\bjurisdiction\\b", r"\\bvenue\\b", r"\\bcompetent\\s+court\\w*\\b",
-                r"\\bexclusive\\s+jurisdiction\\b", r"\\bsubmit\\s+to\\s+jurisdiction\\b",
-                # Binding decisions
-                r"\\bbinding\\s+(?:arbitration|decision|resolution)\\b",
-                r"\\bfinal\\s+(?:and\\s+)?binding\\b", r"\\bnon.?appealable\\b",
-                # Escalation procedures
-                r"\\bescalat\\w*\\b", r"\\bfirst\\s+(?:attempt|try|discuss)\\b",
-                r"\\bgood\\s+faith\\s+(?:effort|negotiat\\w*)\\b"
-            ],
-            "Governing Law": [
-                # Governing law
-                r"\\bgoverning\\s+law\\b", r"\\bapplicable\\s+law\\b", r"\\bconstrued\\s+(?:under|in\\s+accordance\\s+with)\\b",
-                r"\\binterpreted\\s+(?:under|in\\s+accordance\\s+with)\\b",
-                # Jurisdiction references
-                r"\\bjurisdiction\\b", r"\\bstate\\s+(?:of\\s+)?\\w+\\s+law\\b", r"\\bfederal\\s+law\\b",
-                r"\\bcountry\\s+(?:of\\s+)?\\w+\\s+law\\b", r"\\blaw\\w*\\s+of\\s+(?:the\\s+)?(?:state|country)\\b",
-                # Venue
-                r"\\bvenue\\b", r"\\bproper\\s+venue\\b", r"\\bexclusive\\s+venue\\b",
-                r"\\bsubmit\\s+to\\s+(?:the\\s+)?jurisdiction\\b",
-                # Choice of law
-                r"\\bchoice\\s+of\\s+law\\b", r"\\bselection\\s+of\\s+law\\b",
-                r"\\blaw\\s+(?:governing|applicable\\s+to)\\b"
-            ],
-            "Assignment": [
-                # Assignment of rights/obligations
-                r"\\bassign\\w*\\b", r"\\btransfer\\w*\\b", r"\\bconvey\\w*\\b",
-                r"\\bdelegate\\w*\\b", r"\\bsubcontract\\w*\\b", r"\\bnovation\\b",
-                # Assignment restrictions
-                r"\\bnot\\s+(?:assign|transfer)\\b", r"\\bprohibit\\w*\\s+(?:assignment|transfer)\\b",
-                r"\\brestrict\\w*\\s+(?:assignment|transfer)\\b", r"\\bforbid\\w*\\s+(?:assignment|transfer)\\b",
-                # Consent requirements
-                r"\\bconsent\\s+(?:to\\s+)?(?:assign|transfer)\\b", r"\\bapproval\\s+(?:for\\s+)?(?:assign|transfer)\\b",
-                r"\\bwritten\\s+consent\\b", r"\\bprior\\s+(?:written\\s+)?(?:consent|approval)\\b",
-                # Assignment effects
-                r"\\bbind\\w*\\s+(?:successor|assign)\\w*\\b", r"\\bsuccessor\\w*\\s+(?:and\\s+)?assign\\w*\\b",
-                r"\\benure\\w*\\s+(?:to\\s+)?(?:benefit|successor)\\b"
-            ],
-            "Modification": [
-                # Amendment and modification
-                r"\\bmodif\\w*\\b", r"\\bamend\\w*\\b", r"\\bchange\\w*\\b", r"\\balter\\w*\\b",
-                r"\\bvaried?\\b", r"\\brevise?\\b", r"\\bupdate\\w*\\b", r"\\badjust\\w*\\b",
-                # Waiver and supplement
-                r"\\bwaiv\\w*\\b", r"\\bsupplemented?\\b", r"\\baddendum\\b", r"\\baddenda\\b",
-                # Written requirements
-                r"\\bwritten\\s+(?:amendment|modification|change)\\b",
-                r"\\bin\\s+writing\\b", r"\\bsign\\w*\\s+(?:amendment|modification)\\b",
-                # No oral modifications
-                r"\\bno\\s+oral\\s+(?:amendment|modification|change)\\b",
-                r"\\bwritten\\s+agreement\\s+(?:only|required)\\b",
-                # Entire agreement
-                r"\\bentire\\s+agreement\\b", r"\\bcomplete\\s+agreement\\b", r"\\bfull\\s+agreement\\b",
-                r"\\bintegrat\\w*\\s+agreement\\b", r"\\bsupersede\\w*\\b"
-            ],
-            "Warranties": [
-                # Express warranties
-                r"\\bwarrant\\w*\\b", r"\\bguarantee\\w*\\b", r"\\brepresent\\w*\\b",
-                r"\\bassur\\w*\\b", r"\\bcovenant\\w*\\b", r"\\bundertaking\\w*\\b",
-                # Warranty disclaimers
-                r"\\bdisclaim\\w*\\s+warrant\\w*\\b", r"\\bno\\s+warrant\\w*\\b", r"\\bas\\s+is\\b",
-                r"\\bwithout\\s+warrant\\w*\\b", r"\\bexclud\\w*\\s+warrant\\w*\\b",
-                # Types of warranties
-                r"\\bmerchantabilit\\w*\\b", r"\\bfitness\\s+for\\s+(?:a\\s+particular\\s+)?purpose\\b",
-                r"\\bnon.?infringement\\b", r"\\btitle\\s+warrant\\w*\\b",
-                # Warranty period
-                r"\\bwarrant\\w*\\s+period\\b", r"\\bguarantee\\w*\\s+period\\b",
-                r"\\bdefect\\w*\\b", r"\\bconform\\w*\\s+to\\s+specification\\w*\\b"
-            ],
-            "Force Majeure": [
-                # Force majeure events
-                r"\\bforce\\s+majeure\\b", r"\\bact\\w*\\s+of\\s+god\\b", r"\\buncontrollable\\s+circumstance\\w*\\b",
-                r"\\bunavoidable\\s+(?:event|circumstance)\\w*\\b", r"\\bbeyond\\s+(?:reasonable\\s+)?control\\b",
-                # Natural disasters
-                r"\\bearthquake\\w*\\b", r"\\bflood\\w*\\b", r"\\bhurricane\\w*\\b", r"\\bfire\\w*\\b",
-                r"\\bnatural\\s+disaster\\w*\\b", r"\\bcatastroph\\w*\\b",
-                # Human-caused events
-                r"\\bwar\\b", r"\\bterrorism\\b", r"\\bstrike\\w*\\b", r"\\blabor\\s+dispute\\w*\\b",
-                r"\\bgovernment\\w*\\s+action\\w*\\b", r"\\bregulatory\\s+action\\w*\\b",
-                # Performance excuses
-                r"\\bexcus\\w*\\s+(?:performance|delay)\\b", r"\\bsuspend\\w*\\s+(?:performance|obligation)\\w*\\b",
-                r"\\breliev\\w*\\s+(?:from|of)\\s+(?:performance|obligation)\\w*\\b"
-            ],
-            "Definitions": [
-                # Definition clauses
-                r"\\bdefinition\\w*\\b", r"\\bdefin\\w*\\s+(?:as|to\\s+mean)\\b", r"\\bmean\\w*\\b",
-                r"\\binclude\\w*\\s+(?:but\\s+(?:not\\s+)?limited\\s+to)?\\b", r"\\brefer\\w*\\s+to\\b",
-                # Term definitions
-                r"\\b(?:shall\\s+)?mean\\w*\\b", r"\\b(?:shall\\s+)?include\\w*\\b",
-                r"\\binterpret\\w*\\s+(?:to\\s+mean|as)\\b", r"\\bunderstood\\s+(?:to\\s+mean|as)\\b",
-                # Capitalized terms
-                r"\\bcapitalized\\s+term\\w*\\b", r"\\bterm\\w*\\s+(?:used\\s+)?(?:herein|in\\s+this\\s+agreement)\\b",
-                # Cross-references
-                r"\\bas\\s+defined\\s+(?:above|below|herein)\\b", r"\\bas\\s+set\\s+forth\\s+(?:above|below|herein)\\b"
-            ]
-        }
-        
-        for clause in clauses:
-            text_lower = clause.text.lower()
-            clause_length = len(clause.text.split())
-
-            # Calculate weighted scores for each category
-            category_scores = {}
-            total_patterns_found = 0
-
-            for category, patterns in category_patterns.items():
-                score = 0
-                patterns_found = 0
-
-                for pattern in patterns:
-                    matches = re.findall(pattern, text_lower)
-                    if matches:
-                        patterns_found += len(matches)
-                        # Weight by pattern strength and clause context
-                        pattern_weight = 1.0
-                        # Longer clauses get slight boost for pattern matches
-                        length_factor = min(1.5, 1.0 + (clause_length - 50) / 200) if clause_length > 50 else 1.0
-                        score += len(matches) * pattern_weight * length_factor
-
-                if score > 0:
-                    # Normalize score by number of patterns in category to prevent bias
-                    normalized_score = score / len(patterns) * patterns_found
-                    category_scores[category] = normalized_score
-                    total_patterns_found += patterns_found
-
-            # Determine best category with confidence scoring
-            if category_scores:
-                # Find the best match
-                best_category = max(category_scores.keys(), key=lambda x: category_scores[x])
-                best_score = category_scores[best_category]
-
-                # Calculate confidence based on score separation and total evidence
-                confidence = 0.0
-                if len(category_scores) > 1:
-                    sorted_scores = sorted(category_scores.values(), reverse=True)
-                    if len(sorted_scores) >= 2 and sorted_scores[0] > 0:
-                        confidence = (sorted_scores[0] - sorted_scores[1]) / sorted_scores[0]
-                    else:
-                        confidence = 1.0 if sorted_scores[0] > 0 else 0.0
-                else:
-                    confidence = min(1.0, best_score / 2.0)  # Single category match
-
-                # Apply confidence threshold - require minimum confidence to avoid "Other"
-                confidence_threshold = 0.2  # Minimum 20% confidence
-                evidence_threshold = 1.5    # Minimum weighted evidence score
-
-                if confidence >= confidence_threshold and best_score >= evidence_threshold:
-                    clause.category = best_category
-                else:
-                    clause.category = "Other"
-            else:
-                clause.category = "Other"
+        if not clauses:
+            return clauses
+        
+        clause_lengths = np.fromiter((c.word_count for c in clauses), dtype=np.float64, count=len(clauses))
+        
+        # Fragments too short to carry category evidence stay unscanned (all-zero rows, so "Other");
+        # very long merged clauses are scanned on a prefix to bound regex time and memory
+        scored_rows = np.flatnonzero(clause_lengths >= MIN_SCORING_WORDS).tolist()
+        texts_lower = [
+            clauses[row].text[:MAX_SCORING_CHARS].lower()
+            if clause_lengths[row] > MAX_SCORING_WORDS else clauses[row].text_lower
+            for row in scored_rows
+        ]
+        
+        # Count pattern hits into a (clauses, categories) matrix, then score every clause at once
+        if RE2_AVAILABLE and len(texts_lower) >= PARALLEL_SCAN_MIN_CLAUSES:
+            # RE2 drops the GIL while matching, so scans of separate clauses overlap
+            workers = min(len(texts_lower), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                rows = list(executor.map(_count_category_matches, texts_lower))
+        else:
+            rows = [_count_category_matches(text_lower) for text_lower in texts_lower]
+        match_counts = np.zeros((len(clauses), len(_CATEGORY_NAMES)), dtype=np.float64)
+        if rows:
+            match_counts[scored_rows] = rows
+        
+        categories = _pick_categories(_score_categories(match_counts, clause_lengths))
+        for clause, category in zip(clauses, categories):
+            clause.category = category
 
         return clauses
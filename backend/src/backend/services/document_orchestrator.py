@@ -2,10 +2,13 @@
 Document processing orchestrator that coordinates all services
 """
 import asyncio
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from uuid import uuid4
 from datetime import datetime
 
+from google.cloud import firestore
+
 from backend.core.logging import get_logger, LogContext, log_execution_time
 from backend.models.document import DocumentStatus, RiskLevel, SupportedLanguage
 from backend.services.document_processor_grpc import DocumentProcessorGRPC, DocumentProcessingError
@@ -21,6 +24,9 @@ from backend.services.language_detection_service import LanguageDetectionService
 
 logger = get_logger(__name__)
 
+# Summarized batches analyzed at once; each holds two executor threads while running
+MAX_CONCURRENT_BATCH_ANALYSES = 4
+
 
 class DocumentOrchestrator:
     """Orchestrates the complete document processing pipeline."""
@@ -37,6 +43,11 @@ class DocumentOrchestrator:
         self.embeddings_service = EmbeddingsService()
         self.language_detection_service = LanguageDetectionService()
     
+    async def close(self):
+        """Release network connections held by the document processors."""
+        await self.document_processor.close()
+        await self.document_processor_http.close()
+    
     async def process_document_complete(
         self,
         doc_id: str,
@@ -59,7 +70,7 @@ class DocumentOrchestrator:
         Returns:
             Processing result summary
         """
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.monotonic()
         
         with LogContext(logger, doc_id=doc_id, filename=filename, session_id=session_id):
             logger.info("Starting complete document processing pipeline")
@@ -72,6 +83,8 @@ class DocumentOrchestrator:
                 "errors": [],
                 "statistics": {}
             }
+            # Background embeddings task, cancelled if the pipeline fails before finishing
+            embeddings_task: Optional[asyncio.Task] = None
             
             try:
                 # Stage 1: Document Processing (Text Extraction)
@@ -81,10 +94,14 @@ class DocumentOrchestrator:
                 )
                 processing_result["stages_completed"].append("text_extraction")
                 
+                # Status updates from stages 1-2 are queued and committed together before stage 3
+                status_batch = self.firestore_client.open_batch()
+                
                 # Update document with actual page count (document already created in API endpoint)
                 await self.firestore_client.update_document_status(
                     doc_id, DocumentStatus.PROCESSING, 
-                    {"page_count": document_data.get("page_count", 1)}
+                    {"page_count": document_data.get("page_count", 1)},
+                    batch=status_batch
                 )
                 
                 # Stage 1.5: Language Detection (if not provided by user)
@@ -99,9 +116,12 @@ class DocumentOrchestrator:
                         sample_text = document_data["text"][:2000]
                         logger.info(f"Sample text for detection (first 100 chars): {sample_text[:100]}")
                         
-                        detection_result = await self.language_detection_service.detect_language_advanced(
-                            sample_text
-                        )
+                        # Most uploads are plain English; only run the full detector when that's unclear
+                        detection_result = self.language_detection_service.quick_is_english(sample_text)
+                        if detection_result is None:
+                            detection_result = await self.language_detection_service.detect_language_advanced(
+                                sample_text
+                            )
                         detected_language = detection_result.language
                         logger.info(f"✓ DETECTED LANGUAGE: {detected_language.value} (confidence: {detection_result.confidence:.2f}, method: {detection_result.method})")
                         
@@ -112,7 +132,8 @@ class DocumentOrchestrator:
                                 "language": detected_language.value,
                                 "language_detection_confidence": detection_result.confidence,
                                 "language_detection_method": detection_result.method.value
-                            }
+                            },
+                            batch=status_batch
                         )
                     except Exception as e:
                         logger.error(f"Language detection failed, defaulting to English: {e}", exc_info=True)
@@ -127,9 +148,9 @@ class DocumentOrchestrator:
                 
                 # Stage 2: Privacy Analysis and PII Masking
                 logger.info("Stage 2: Privacy analysis and PII masking") 
-                masked_text, pii_matches = await self.privacy_service.detect_and_mask_pii(
-                    document_data["text"]
-                )
+                # Segmentation reads the original text, so only the matches are needed;
+                # building a masked copy of the whole document would be thrown away
+                pii_matches = await self.privacy_service.detect_pii(document_data["text"])
                 
                 privacy_summary = {} # Need a way to generate summary from pii_matches if needed
                 if hasattr(self.privacy_service, 'get_pii_summary'):
@@ -140,84 +161,110 @@ class DocumentOrchestrator:
                 # Update document with masking info
                 await self.firestore_client.update_document_status(
                     doc_id, DocumentStatus.PROCESSING, 
-                    {"masked": len(pii_matches) > 0, "pii_summary": privacy_summary}
+                    {"masked": len(pii_matches) > 0, "pii_summary": privacy_summary},
+                    batch=status_batch
                 )
+                await self.firestore_client.commit_batch(status_batch)
                 
                 # Stage 3: Clause Segmentation
                 logger.info("Stage 3: Clause segmentation")
                 
                 # Use ORIGINAL text for segmentation for better quality summaries
                 # PII info is still recorded but not applied to visible output
-                clause_candidates = await self.clause_segmenter.segment_document(document_data)
+                clause_candidates = await self.clause_segmenter.segment_document_async(document_data)
                 
-                # Identify clause types
-                clause_candidates = await self.clause_segmenter.identify_clause_types(clause_candidates)
+                # Identify clause types (CPU-bound regex scanning, kept off the event loop)
+                clause_candidates = await asyncio.to_thread(
+                    self.clause_segmenter.identify_clause_types, clause_candidates
+                )
                 processing_result["stages_completed"].append("clause_segmentation")
                 
                 if not clause_candidates:
                     raise Exception("No clauses could be extracted from document")
                 
-                # Stage 4: Gemini Summarization
-                logger.info(f"Stage 4: AI summarization (language: {language.value})")
-                summarization_results = await self.gemini_client.batch_summarize_clauses(
-                    clause_candidates, include_negotiation_tips=True, language=language
-                )
-                processing_result["stages_completed"].append("ai_summarization")
-                
-                if len(summarization_results) != len(clause_candidates):
-                    logger.warning(f"Summarization count mismatch: {len(summarization_results)} vs {len(clause_candidates)}")
-                
-                # Stages 5 & 6: Risk Analysis and Readability Comparison (Concurrent)
-                logger.info("Stages 5 & 6: Risk analysis and readability analysis (concurrent)")
-                
-                # Create parallel tasks for risk analysis
-                risk_tasks = []
-                for i, (clause, summary_result) in enumerate(zip(clause_candidates, summarization_results)):
-                    task = self.risk_analyzer.analyze_clause_risk(
-                        clause.text,
-                        summary_result.get("summary"),
-                        summary_result.get("risk_level"),
-                        summary_result.get("category")
-                    )
-                    risk_tasks.append(task)
+                # Stages 4-6: Gemini summarization, with risk and readability analysis of each
+                # batch starting as soon as its summaries arrive
+                logger.info(f"Stages 4-6: AI summarization streamed into risk and readability analysis (language: {language.value})")
                 
-                # Create parallel tasks for readability analysis
-                readability_tasks = []
-                for clause, summary_result in zip(clause_candidates, summarization_results):
-                    task = self.readability_service.compare_readability(
-                        clause.text, summary_result.get("summary", "")
-                    )
-                    readability_tasks.append(task)
+                clause_count = len(clause_candidates)
+                summary_slots: List[Optional[Dict[str, Any]]] = [None] * clause_count
+                risk_slots: List[Optional[RiskAssessment]] = [None] * clause_count
+                readability_slots: List[Optional[Dict[str, Any]]] = [None] * clause_count
                 
-                # Execute both risk and readability analyses concurrently
-                risk_assessments, readability_comparisons = await asyncio.gather(
-                    asyncio.gather(*risk_tasks),
-                    asyncio.gather(*readability_tasks)
+                # The task group cancels the remaining batches as soon as one fails
+                analysis_semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCH_ANALYSES)
+                try:
+                    async with asyncio.TaskGroup() as analysis_group:
+                        async for indices, batch_results in self.gemini_client.stream_summarize_clauses(
+                            clause_candidates, include_negotiation_tips=True, language=language
+                        ):
+                            for index, summary_result in zip(indices, batch_results):
+                                summary_slots[index] = summary_result
+                            analysis_group.create_task(
+                                self._analyze_summarized_batch(
+                                    indices, clause_candidates, batch_results,
+                                    risk_slots, readability_slots, analysis_semaphore
+                                )
+                            )
+                        processing_result["stages_completed"].append("ai_summarization")
+                except ExceptionGroup as group:
+                    # Surface the first failure itself so the stored error stays readable
+                    raise group.exceptions[0]
+                processing_result["stages_completed"].extend(["risk_analysis", "readability_analysis"])
+                
+                # A batch whose task failed outright leaves its slots empty; drop those clauses
+                summarized = [i for i, summary_result in enumerate(summary_slots) if summary_result is not None]
+                if len(summarized) != clause_count:
+                    logger.warning(f"Summarization count mismatch: {len(summarized)} vs {clause_count}")
+                clause_candidates = [clause_candidates[i] for i in summarized]
+                summarization_results = [summary_slots[i] for i in summarized]
+                risk_assessments = [risk_slots[i] for i in summarized]
+                readability_comparisons = [readability_slots[i] for i in summarized]
+                
+                # Stage 7.5: Generate Embeddings for Clauses (Background Processing)
+                # Embedding only needs the summaries, so generation starts now and overlaps
+                # storage; its Firestore writes wait until the document has been finalized
+                logger.info("Stage 7.5: Starting background embeddings generation")
+                
+                document_finalized = asyncio.Event()
+                embedding_inputs = [
+                    (f"{doc_id}_clause_{i}", summary_result.get("summary") or clause.text)
+                    for i, (clause, summary_result) in enumerate(zip(clause_candidates, summarization_results))
+                ]
+                embeddings_task = asyncio.create_task(
+                    self._generate_clause_embeddings_background(doc_id, embedding_inputs, document_finalized)
                 )
                 
-                processing_result["stages_completed"].extend(["risk_analysis", "readability_analysis"])
+                # Don't await the task - let it run in the background
+                processing_result["stages_completed"].append("embeddings_background_started")
+                logger.info(f"Background embeddings generation started for {len(embedding_inputs)} clauses")
                 
                 # Stage 7: Data Assembly and Storage
                 logger.info(f"Stage 7: Assembling and storing clause data (language: {language.value})")
                 
-                clauses_data = []
+                language_code = language.value
+                # One slot per clause, filled by index like the stage 4-6 slots
+                clauses_data: List[Optional[Dict[str, Any]]] = [None] * len(clause_candidates)
                 for i, (clause, summary_result, risk_assessment, readability_comp) in enumerate(
                     zip(clause_candidates, summarization_results, risk_assessments, readability_comparisons)
                 ):
-                    clause_data = {
+                    # Each nested readability dict is looked up once per clause
+                    simplified_metrics = readability_comp["simplified"]
+                    improvements = readability_comp["improvements"]
+                    clauses_data[i] = {
                         "clause_id": f"{doc_id}_clause_{i}",
                         "order": i + 1,
                         "original_text": clause.text,  # This is already masked
                         "summary": summary_result.get("summary", ""),
                         "category": summary_result.get("category", "Other"),
-                        "language": language.value,
+                        "language": language_code,
                         "risk_level": risk_assessment.risk_level.value,
                         "needs_review": risk_assessment.needs_review,
                         "readability_metrics": {
                             "original_grade": readability_comp["original"]["flesch_kincaid_grade"],
-                            "summary_grade": readability_comp["simplified"]["flesch_kincaid_grade"],
-                            "delta": readability_comp["improvements"]["grade_level_delta"],
-                            "flesch_score": readability_comp["simplified"]["flesch_reading_ease"]
+                            "summary_grade": simplified_metrics["flesch_kincaid_grade"],
+                            "delta": improvements["grade_level_delta"],
+                            "flesch_score": simplified_metrics["flesch_reading_ease"]
                         },
                         "negotiation_tip": summary_result.get("negotiation_tip"),
                         "confidence": risk_assessment.confidence,
@@ -226,28 +273,15 @@ class DocumentOrchestrator:
                         "metadata": {
                             "risk_score": risk_assessment.risk_score,
                             "detected_keywords": risk_assessment.detected_keywords,
-                            "readability_improvement": readability_comp["improvements"]["overall_improvement_score"]
+                            "readability_improvement": improvements["overall_improvement_score"]
                         }
                     }
-                    clauses_data.append(clause_data)
                 
                 # Store clauses in Firestore
                 clause_ids = await self.firestore_client.create_clauses(doc_id, clauses_data)
                 logger.info(f"✓ Stored {len(clause_ids)} clauses with language: {language.value}")
                 processing_result["stages_completed"].append("data_storage")
                 
-                # Stage 7.5: Generate Embeddings for Clauses (Background Processing)
-                logger.info("Stage 7.5: Starting background embeddings generation")
-                
-                # Start embeddings generation as a fire-and-forget background task
-                embeddings_task = asyncio.create_task(
-                    self._generate_clause_embeddings_background(doc_id, clauses_data)
-                )
-                
-                # Don't await the task - let it run in the background
-                processing_result["stages_completed"].append("embeddings_background_started")
-                logger.info(f"Background embeddings generation started for {len(clauses_data)} clauses")
-                
                 # Stage 8: Generate Document-Level Analytics
                 logger.info("Stage 8: Document-level analytics")
                 
@@ -274,12 +308,14 @@ class DocumentOrchestrator:
                 await self.firestore_client.update_document_status(
                     doc_id, DocumentStatus.COMPLETED, final_metadata
                 )
+                # The completed status rewrites processing_statistics; embedding results go after it
+                document_finalized.set()
                 
                 processing_result["status"] = "completed"
                 processing_result["statistics"] = final_metadata["processing_statistics"]
                 
                 # Log completion
-                total_time = (asyncio.get_event_loop().time() - start_time) * 1000
+                total_time = (time.monotonic() - start_time) * 1000
                 log_execution_time(logger, "complete_document_processing", total_time)
                 
                 logger.info(f"Document processing completed successfully: {len(clause_ids)} clauses processed")
@@ -292,6 +328,9 @@ class DocumentOrchestrator:
                 processing_result["status"] = "failed"
                 processing_result["errors"].append(str(e))
                 
+                if embeddings_task is not None:
+                    embeddings_task.cancel()
+                
                 # Update document status to failed
                 try:
                     await self.firestore_client.update_document_status(
@@ -304,6 +343,48 @@ class DocumentOrchestrator:
                 # Re-raise the original exception
                 raise Exception(f"Document processing failed: {e}")
     
+    async def _analyze_summarized_batch(
+        self,
+        indices: List[int],
+        clause_candidates: List[ClauseCandidate],
+        summary_results: List[Dict[str, Any]],
+        risk_slots: List[Optional[RiskAssessment]],
+        readability_slots: List[Optional[Dict[str, Any]]],
+        semaphore: asyncio.Semaphore
+    ) -> None:
+        """
+        Run risk and readability analysis for one summarized batch.
+        
+        Args:
+            indices: Positions in clause_candidates of the batch's clauses
+            clause_candidates: All clauses of the document
+            summary_results: Summary per entry of indices
+            risk_slots: Per-clause risk assessments, filled in place
+            readability_slots: Per-clause readability comparisons, filled in place
+            semaphore: Limits how many batches are analyzed at once
+        """
+        clause_texts = [clause_candidates[index].text for index in indices]
+        
+        # One batched call per analysis instead of a coroutine per clause
+        async with semaphore:
+            risk_assessments, readability_comparisons = await asyncio.gather(
+                self.risk_analyzer.analyze_clauses_batch(
+                    clause_texts,
+                    [summary_result.get("summary") for summary_result in summary_results],
+                    [summary_result.get("risk_level") for summary_result in summary_results],
+                    [summary_result.get("category") for summary_result in summary_results]
+                ),
+                self.readability_service.compare_readability_batch(
+                    clause_texts,
+                    [summary_result.get("summary", "") for summary_result in summary_results]
+                )
+            )
+        for index, risk_assessment, readability_comparison in zip(
+            indices, risk_assessments, readability_comparisons
+        ):
+            risk_slots[index] = risk_assessment
+            readability_slots[index] = readability_comparison
+    
     async def get_processing_status(self, doc_id: str) -> Dict[str, Any]:
         """
         Get detailed processing status for a document.
@@ -380,7 +461,8 @@ class DocumentOrchestrator:
     async def _generate_clause_embeddings(
         self, 
         doc_id: str, 
-        clauses_data: List[Dict[str, Any]]
+        clause_texts: List[Tuple[str, str]],
+        document_finalized: asyncio.Event
     ) -> int:
         """
         Generate and store embeddings for all clauses in the document.
@@ -391,7 +473,9 @@ class DocumentOrchestrator:
         
         Args:
             doc_id: Document identifier
-            clauses_data: List of clause data dictionaries containing summaries
+            clause_texts: (clause_id, text to embed) per clause; the summary, or the
+                original text when there is none
+            document_finalized: Set once the clause records and final status are stored
             
         Returns:
             Number of embeddings successfully generated and stored
@@ -399,22 +483,19 @@ class DocumentOrchestrator:
         Raises:
             EmbeddingsError: If embeddings generation fails
         """
-        with LogContext(logger, doc_id=doc_id, clause_count=len(clauses_data)):
+        with LogContext(logger, doc_id=doc_id, clause_count=len(clause_texts)):
             logger.info("Starting background embeddings generation")
             
             # Initialize timing variable for error handling
             embeddings_start_time = 0.0
             
-            # Prepare texts for embedding (use summary, fallback to original text)
             texts = []
             clause_ids = []
             
-            for clause_data in clauses_data:
-                # Prefer summary over original text for embeddings
-                text = clause_data.get("summary") or clause_data.get("original_text", "")
+            for clause_id, text in clause_texts:
                 if text.strip():
                     texts.append(text)
-                    clause_ids.append(clause_data.get("clause_id"))
+                    clause_ids.append(clause_id)
             
             if not texts:
                 logger.warning("No valid text found in clauses for embedding generation")
@@ -431,7 +512,8 @@ class DocumentOrchestrator:
                     embeddings_data[clause_id] = embedding
             
             if embeddings_data:
-                # Store embeddings in Firestore
+                # Store embeddings in Firestore once the clause records exist
+                await document_finalized.wait()
                 await self.firestore_client.update_clause_embeddings(doc_id, embeddings_data)
                 logger.info(f"Successfully stored embeddings for {len(embeddings_data)} clauses")
                 return len(embeddings_data)
@@ -441,36 +523,41 @@ class DocumentOrchestrator:
     async def _generate_clause_embeddings_background(
         self, 
         doc_id: str, 
-        clauses_data: List[Dict[str, Any]]
+        clause_texts: List[Tuple[str, str]],
+        document_finalized: asyncio.Event
     ) -> None:
         """
         Generate and store embeddings for all clauses in the document as a background task.
         
         This method runs in the background and updates the document status when complete.
-        It handles errors gracefully without affecting the main pipeline.
+        It handles errors gracefully without affecting the main pipeline. Generation starts
+        right away; every Firestore write waits for document_finalized.
         
         Args:
             doc_id: Document identifier
-            clauses_data: List of clause data dictionaries containing summaries
+            clause_texts: (clause_id, text to embed) per clause
+            document_finalized: Set once the clause records and final status are stored
         """
         # Initialize timing variable before try block for error handling visibility
         embeddings_start_time = 0.0
         
         try:
-            with LogContext(logger, doc_id=doc_id, clause_count=len(clauses_data)):
+            with LogContext(logger, doc_id=doc_id, clause_count=len(clause_texts)):
                 logger.info("Starting background embeddings generation")
                 
                 # Track start time for performance metrics
-                embeddings_start_time = asyncio.get_event_loop().time()
+                embeddings_start_time = time.monotonic()
                 
                 # Call the original embeddings method
-                embeddings_count = await self._generate_clause_embeddings(doc_id, clauses_data)
+                embeddings_count = await self._generate_clause_embeddings(
+                    doc_id, clause_texts, document_finalized
+                )
                 
                 # Calculate processing time
-                embeddings_duration = (asyncio.get_event_loop().time() - embeddings_start_time) * 1000
+                embeddings_duration = (time.monotonic() - embeddings_start_time) * 1000
                 
                 # Calculate success/failure rates
-                total_clauses = len(clauses_data)
+                total_clauses = len(clause_texts)
                 success_rate = (embeddings_count / total_clauses) * 100 if total_clauses > 0 else 0
                 
                 # Update document with successful embeddings completion (metadata only)
@@ -481,7 +568,7 @@ class DocumentOrchestrator:
                     "processing_statistics.embeddings_success_rate": success_rate,
                     "processing_statistics.embeddings_failed_count": total_clauses - embeddings_count,
                     "processing_statistics.embeddings_duration_ms": embeddings_duration,
-                    "processing_statistics.embeddings_generated_at": asyncio.get_event_loop().time()
+                    "processing_statistics.embeddings_generated_at": time.time()
                 })
                 
                 logger.info(f"Background embeddings generation completed: {embeddings_count}/{total_clauses} embeddings generated (Success rate: {success_rate:.1f}%)")
@@ -492,18 +579,19 @@ class DocumentOrchestrator:
             
             try:
                 # Calculate timing info even for failures
-                embeddings_duration = (asyncio.get_event_loop().time() - embeddings_start_time) * 1000
+                embeddings_duration = (time.monotonic() - embeddings_start_time) * 1000
                 
                 # Update document with failure status (metadata only)
+                await document_finalized.wait()
                 await self._update_document_metadata(doc_id, {
                     "processing_statistics.embeddings_completed": False,
                     "processing_statistics.embeddings_count": 0,
-                    "processing_statistics.embeddings_total_clauses": len(clauses_data),
+                    "processing_statistics.embeddings_total_clauses": len(clause_texts),
                     "processing_statistics.embeddings_success_rate": 0,
-                    "processing_statistics.embeddings_failed_count": len(clauses_data),
+                    "processing_statistics.embeddings_failed_count": len(clause_texts),
                     "processing_statistics.embeddings_duration_ms": embeddings_duration,
                     "processing_statistics.embeddings_error": str(e),
-                    "processing_statistics.embeddings_failed_at": asyncio.get_event_loop().time()
+                    "processing_statistics.embeddings_failed_at": time.time()
                 })
             except Exception as update_error:
                 logger.error(f"Failed to update embeddings failure status: {update_error}")
@@ -528,15 +616,13 @@ class DocumentOrchestrator:
         """
         try:
             # Use Firestore's direct update method to update only metadata
-            doc_ref = self.firestore_client.db.collection("documents").document(doc_id)
+            doc_ref = self.firestore_client.documents.document(doc_id)
             
-            # Add updated timestamp - import firestore at the top if not already
-            from google.cloud import firestore
-            update_data = metadata_updates.copy()
-            update_data["updated_at"] = firestore.SERVER_TIMESTAMP
+            # Union builds the write payload in one step, leaving the caller's dict untouched
+            update_data = metadata_updates | {"updated_at": firestore.SERVER_TIMESTAMP}
             
-            # Use Firestore's update method directly
-            doc_ref.update(update_data)
+            # Use Firestore's update method directly, off the event loop
+            await asyncio.to_thread(doc_ref.update, update_data)
             
             logger.debug(f"Updated document metadata for {doc_id}: {list(metadata_updates.keys())}")
             return True
@@ -3,11 +3,12 @@ Document processing service using direct Document AI REST API calls
 """
 import json
 import base64
-import requests
 import asyncio
 import tempfile
 import os
 from typing import Optional, Dict, Any
+
+import httpx
 from google.auth.transport.requests import Request
 from google.oauth2 import service_account
 from google.auth import default
@@ -20,6 +21,10 @@ from backend.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Shared HTTP client limits; keep-alive lets consecutive PDFs reuse one TLS connection
+HTTP_TIMEOUT_SECONDS = 60.0
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=75.0)
+
 
 class DocumentProcessingError(Exception):
     """Custom exception for document processing errors."""
@@ -37,6 +42,7 @@ class DocumentProcessor:
         self.processor_id = self.settings.DOC_AI_PROCESSOR_ID
         self.endpoint_url = f"https://us-documentai.googleapis.com/v1/projects/{self.project_number}/locations/{self.location}/processors/{self.processor_id}:process"
         self._access_token = None
+        self._http_client: Optional[httpx.AsyncClient] = None
         logger.info(f"Initialized DocumentProcessor with direct REST API")
         logger.info(f"Endpoint URL: {self.endpoint_url}")
     
@@ -92,6 +98,22 @@ class DocumentProcessor:
         self._access_token = None
         logger.info("Cleared access token cache")
     
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Lazily created async HTTP client, pooled across requests."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=HTTP_TIMEOUT_SECONDS,
+                limits=HTTP_LIMITS
+            )
+        return self._http_client
+    
+    async def close(self):
+        """Close the pooled HTTP client and its connections."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+    
     async def _process_with_document_ai_api(self, pdf_content: bytes) -> Optional[str]:
         """
         Process a document using Document AI REST API.
@@ -129,14 +151,11 @@ class DocumentProcessor:
             logger.info(f"Making POST request to {self.endpoint_url}")
             logger.info(f"PDF content size: {len(pdf_content)} bytes")
             
-            # Make the API request
-            # Using asyncio.to_thread for blocking requests call
-            response = await asyncio.to_thread(
-                requests.post,
+            # Make the API request over the pooled connection
+            response = await self.http_client.post(
                 self.endpoint_url,
                 headers=headers,
-                json=payload,
-                timeout=60
+                json=payload
             )
             
             logger.info(f"Document AI API response status: {response.status_code}")
@@ -159,7 +178,7 @@ class DocumentProcessor:
                 logger.error(f"Response body: {response.text}")
                 return None
                 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Network error during Document AI API call: {str(e)}")
             return None
         except Exception as e:
@@ -15,6 +15,10 @@ from backend.core.logging import get_logger, log_execution_time
 logger = get_logger(__name__)
 
 
+# Texts per embed_content request; the API accepts up to 100 contents per batch call
+EMBED_BATCH_SIZE = 100
+
+
 class EmbeddingsError(Exception):
     """Custom exception for embeddings operations."""
     pass
@@ -98,8 +102,7 @@ class EmbeddingsService:
         
         Args:
             texts: List of texts to generate embeddings for
-            max_concurrent: Maximum number of concurrent requests (default: 5)
-            batch_size: Number of texts to process in parallel batches (default: 20)
+            max_concurrent: Maximum number of concurrent batch requests
             
         Returns:
             List of embeddings corresponding to input texts (None for failed embeddings)
@@ -113,49 +116,46 @@ class EmbeddingsService:
             if not texts:
                 return []
             
-            logger.info(f"Generating embeddings for {len(texts)} texts with max {max_concurrent} concurrent requests")
+            # Empty texts can't be embedded; they keep a None slot like any other failure
+            indexed_texts = [(i, text.strip()) for i, text in enumerate(texts) if text and text.strip()]
+            chunks = [
+                indexed_texts[i:i + EMBED_BATCH_SIZE]
+                for i in range(0, len(indexed_texts), EMBED_BATCH_SIZE)
+            ]
+            
+            logger.info(f"Generating embeddings for {len(texts)} texts in {len(chunks)} requests with max {max_concurrent} concurrent")
             
             # Create semaphore to limit concurrent requests
             semaphore = asyncio.Semaphore(max_concurrent)
+            embeddings: List[Optional[List[float]]] = [None] * len(texts)
             
-            async def generate_with_semaphore(text: str, index: int) -> Tuple[int, Optional[List[float]]]:
-                """Generate embedding with concurrency control and error handling."""
+            async def embed_chunk(chunk: List[Tuple[int, str]]) -> None:
+                """Embed a chunk in one request, retrying text by text if the request fails."""
                 async with semaphore:
                     try:
-                        embedding = await self.generate_embedding(text)
-                        return index, embedding
+                        result = await asyncio.to_thread(
+                            genai.embed_content,  # type: ignore
+                            model=self.model_name,
+                            content=[text for _, text in chunk],
+                            task_type="retrieval_document"
+                        )
+                        for (index, _), embedding in zip(chunk, result['embedding']):
+                            embeddings[index] = embedding
+                        return
                     except Exception as e:
-                        logger.warning(f"Failed to generate embedding for text {index}: {e}")
-                        return index, None
-            
-            # Process all texts in parallel with controlled concurrency
-            tasks = [
-                generate_with_semaphore(text, i) 
-                for i, text in enumerate(texts)
-            ]
+                        logger.warning(f"Batch embedding request failed, retrying {len(chunk)} texts individually: {e}")
+                    
+                    # One bad text shouldn't cost the rest of the chunk their embeddings
+                    for index, text in chunk:
+                        try:
+                            embeddings[index] = await self.generate_embedding(text)
+                        except Exception as e:
+                            logger.warning(f"Failed to generate embedding for text {index}: {e}")
             
-            # Use gather with return_exceptions=True to handle individual failures
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.gather(*(embed_chunk(chunk) for chunk in chunks))
             
-            # Process results and maintain order
-            embeddings: List[Optional[List[float]]] = [None] * len(texts)
-            successful_count = 0
-            failed_count = 0
-            
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.error(f"Task failed with exception: {result}")
-                    failed_count += 1
-                    continue
-                
-                # Type checker knows result is a tuple after Exception check
-                index, embedding = result  # type: ignore
-                embeddings[index] = embedding
-                
-                if embedding is not None:
-                    successful_count += 1
-                else:
-                    failed_count += 1
+            successful_count = sum(1 for embedding in embeddings if embedding is not None)
+            failed_count = len(texts) - successful_count
             
             self._log_execution_time("generate_embeddings_batch", start_time)
             logger.info(f"Batch embedding generation completed: {successful_count} successful, {failed_count} failed")
@@ -231,23 +231,29 @@ class EmbeddingsService:
             if not chunk_embeddings:
                 return []
             
-            # Calculate similarities for all chunks
-            similarities = []
+            candidates = [chunk_data for chunk_data in chunk_embeddings if 'embedding' in chunk_data]
+            if not candidates:
+                return []
             
-            for chunk_data in chunk_embeddings:
-                if 'embedding' not in chunk_data:
-                    continue
-                
-                similarity = self.cosine_similarity(query_embedding, chunk_data['embedding'])
-                
-                if similarity >= similarity_threshold:
-                    chunk_with_similarity = chunk_data.copy()
-                    chunk_with_similarity['similarity'] = similarity
-                    similarities.append(chunk_with_similarity)
-            
-            # Sort by similarity (highest first) and take top_k
-            similarities.sort(key=lambda x: x['similarity'], reverse=True)
-            top_chunks = similarities[:top_k]
+            # Score every chunk with one float32 matrix-vector product
+            matrix = np.asarray([chunk_data['embedding'] for chunk_data in candidates], dtype=np.float32)
+            query = np.asarray(query_embedding, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+            scores = np.divide(
+                matrix @ query, norms,
+                out=np.zeros(len(candidates), dtype=np.float32),
+                where=norms > 0
+            )
+            
+            # Highest first; the stable sort keeps input order among ties
+            above = np.flatnonzero(scores >= similarity_threshold)
+            ranked = above[np.argsort(-scores[above], kind="stable")][:top_k]
+            
+            top_chunks = []
+            for row in ranked:
+                chunk_with_similarity = candidates[row].copy()
+                chunk_with_similarity['similarity'] = float(scores[row])
+                top_chunks.append(chunk_with_similarity)
             
             self._log_execution_time("find_similar_chunks", start_time)
             logger.info(f"Found {len(top_chunks)} similar chunks above threshold {similarity_threshold}")
@@ -1,6 +1,7 @@
 """
 Firestore integration service for document and clause storage
 """
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
@@ -14,9 +15,16 @@ from google.api_core.exceptions import GoogleAPIError, NotFound
 from backend.core.config import get_settings
 from backend.core.logging import get_logger, LogContext
 from backend.models.document import DocumentStatus, RiskLevel
+from backend.services.cache_service import CacheKeys, get_cache
 
 logger = get_logger(__name__)
 
+# Short TTL: user lookups run on every authenticated request
+USER_CACHE_TTL_SECONDS = 30
+
+# Maximum writes Firestore accepts in one batch commit
+FIRESTORE_BATCH_LIMIT = 500
+
 
 class FirestoreError(Exception):
 
@@ -30,6 +38,7 @@ class FirestoreClient:
         self.settings = get_settings()
         self._client: Optional[firestore.Client] = None
         self._db: Optional[firestore.Client] = None
+        self._documents: Optional[firestore.CollectionReference] = None
         self._initialized = False
     
     @property
@@ -66,14 +75,34 @@ class FirestoreClient:
         
         return self._db
     
+    @property
+    def documents(self) -> firestore.CollectionReference:
+        """The documents collection, resolved once instead of per call."""
+        if self._documents is None:
+            self._documents = self.db.collection("documents")
+        return self._documents
+    
     def close(self):
 
         if self._client:
             self._client.close()
             self._client = None
             self._db = None
+            self._documents = None
             self._initialized = False
     
+    def open_batch(self) -> firestore.WriteBatch:
+        """Start a write batch; pass it to update methods and commit it with commit_batch."""
+        return self.db.batch()
+    
+    async def commit_batch(self, batch: firestore.WriteBatch) -> None:
+        """Commit a write batch from open_batch in one round trip."""
+        try:
+            batch.commit()
+        except GoogleAPIError as e:
+            logger.error(f"Failed to commit batch: {e}")
+            raise FirestoreError(f"Failed to commit batch: {e}")
+    
     # Document Operations
     
     async def create_document(
@@ -89,7 +118,68 @@ class FirestoreClient:
         """Create a new document record with optional user association."""
         logger.info(f"Creating document record: {doc_id} for user: {user_id}")
         
-        document_data = {
+        document_data = self._build_document_data(
+            doc_id, filename, file_size, page_count, session_id, language, user_id
+        )
+        
+        try:
+            doc_ref = self.documents.document(doc_id)
+            doc_ref.set(document_data)
+            return document_data
+            
+        except GoogleAPIError as e:
+            logger.error(f"Failed to create document: {e}")
+            raise FirestoreError(f"Failed to create document: {e}")
+
+    async def create_documents_batch(
+        self,
+        documents: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several document records in a single batched write.
+        
+        Args:
+            documents: Dicts with the same keys as create_document's arguments
+            
+        Returns:
+            List of created document records, in input order
+        """
+        logger.info(f"Creating {len(documents)} document records in one batch")
+        
+        try:
+            documents_collection = self.documents
+            batches = [self.db.batch()]
+            created = []
+            
+            for i, document in enumerate(documents):
+                document_data = self._build_document_data(**document)
+                if i and i % FIRESTORE_BATCH_LIMIT == 0:
+                    batches.append(self.db.batch())
+                batches[-1].set(documents_collection.document(document_data["doc_id"]), document_data)
+                created.append(document_data)
+            
+            # Chunks are independent, so their round trips overlap
+            if created:
+                await asyncio.gather(*(asyncio.to_thread(chunk.commit) for chunk in batches))
+            
+            return created
+            
+        except GoogleAPIError as e:
+            logger.error(f"Failed to create documents: {e}")
+            raise FirestoreError(f"Failed to create documents: {e}")
+
+    @staticmethod
+    def _build_document_data(
+        doc_id: str,
+        filename: str,
+        file_size: int,
+        page_count: int,
+        session_id: Optional[str] = None,
+        language: Optional[str] = "en",
+        user_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the initial Firestore record for a newly uploaded document."""
+        return {
             "doc_id": doc_id,
             "filename": filename,
             "file_size": file_size,
@@ -105,26 +195,42 @@ class FirestoreClient:
             "clause_count": 0,
             "processing_metadata": {}
         }
-        
-        try:
-            doc_ref = self.db.collection("documents").document(doc_id)
-            doc_ref.set(document_data)
-            return document_data
-            
-        except GoogleAPIError as e:
-            logger.error(f"Failed to create document: {e}")
-            raise FirestoreError(f"Failed to create document: {e}")
 
     async def get_document(self, doc_id: str) -> Optional[Dict[str, Any]]:
 
         try:
-            doc_ref = self.db.collection("documents").document(doc_id)
+            doc_ref = self.documents.document(doc_id)
             doc = doc_ref.get()
             return doc.to_dict() if doc.exists else None
         except GoogleAPIError as e:
             logger.error(f"Failed to get document {doc_id}: {e}")
             raise FirestoreError(f"Failed to get document: {e}")
 
+    async def get_documents(self, doc_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch several documents in a single round trip.
+        
+        Args:
+            doc_ids: Document identifiers
+            
+        Returns:
+            Mapping of doc_id to document data; missing documents are omitted
+        """
+        if not doc_ids:
+            return {}
+        
+        try:
+            documents_collection = self.documents
+            refs = [documents_collection.document(doc_id) for doc_id in doc_ids]
+            return {
+                snapshot.id: snapshot.to_dict()
+                for snapshot in self.db.get_all(refs)
+                if snapshot.exists
+            }
+        except GoogleAPIError as e:
+            logger.error(f"Failed to get {len(doc_ids)} documents: {e}")
+            raise FirestoreError(f"Failed to get documents: {e}")
+
     async def list_documents(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
         List all documents, ordered by creation date (newest first).
@@ -137,7 +243,7 @@ class FirestoreClient:
         """
         try:
             docs_ref = (
-                self.db.collection("documents")
+                self.documents
                 .order_by("created_at", direction=firestore.Query.DESCENDING)
                 .limit(limit)
             )
@@ -151,11 +257,23 @@ class FirestoreClient:
         self, 
         doc_id: str, 
         status: DocumentStatus,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        batch: Optional[firestore.WriteBatch] = None
     ) -> bool:
-        """Update document processing status."""
+        """
+        Update document processing status.
+        
+        Args:
+            doc_id: Document identifier
+            status: New processing status
+            metadata: Extra fields to set alongside the status
+            batch: If given, the update is queued on it instead of written now
+            
+        Returns:
+            True once written or queued
+        """
         try:
-            doc_ref = self.db.collection("documents").document(doc_id)
+            doc_ref = self.documents.document(doc_id)
             update_data = {
                 "status": status.value,
                 "updated_at": firestore.SERVER_TIMESTAMP
@@ -165,7 +283,10 @@ class FirestoreClient:
             if metadata:
                 update_data.update(metadata)
             
-            doc_ref.update(update_data)
+            if batch is not None:
+                batch.update(doc_ref, update_data)
+            else:
+                doc_ref.update(update_data)
             return True
             
         except GoogleAPIError as e:
@@ -179,14 +300,14 @@ class FirestoreClient:
         doc_id: str, 
         clauses_data: List[Dict[str, Any]]
     ) -> List[str]:
-        """Create multiple clause records for a document."""
+        """Create multiple clause records for a document, updating its clause count in the same commit."""
         logger.info(f"Creating {len(clauses_data)} clause records for doc {doc_id}")
         
-        batch = self.db.batch()
+        batches = [self.db.batch()]
         clause_ids = []
         
         try:
-            doc_ref = self.db.collection("documents").document(doc_id)
+            doc_ref = self.documents.document(doc_id)
             clauses_collection = doc_ref.collection("clauses")
             
             for i, clause_data in enumerate(clauses_data):
@@ -209,7 +330,6 @@ class FirestoreClient:
                     "processing_method": clause_data.get("processing_method", "unknown"),
                     "created_at": firestore.SERVER_TIMESTAMP,
                     "updated_at": firestore.SERVER_TIMESTAMP,
-                    "updated_at": firestore.SERVER_TIMESTAMP,
                     "metadata": clause_data.get("metadata", {})
                 }
                 
@@ -218,11 +338,21 @@ class FirestoreClient:
                 if embedding:
                     firestore_clause_data["embedding"] = Vector(embedding)
                     
-                batch.set(clause_ref, firestore_clause_data)
+                if i and i % FIRESTORE_BATCH_LIMIT == 0:
+                    batches.append(self.db.batch())
+                batches[-1].set(clause_ref, firestore_clause_data)
                 clause_ids.append(clause_id)
             
-            batch.commit()
-            await self._update_clause_count(doc_id, len(clause_ids))
+            # The count update rides along as one more write
+            if clause_ids and len(clause_ids) % FIRESTORE_BATCH_LIMIT == 0:
+                batches.append(self.db.batch())
+            batches[-1].update(doc_ref, {
+                "clause_count": len(clause_ids),
+                "updated_at": firestore.SERVER_TIMESTAMP
+            })
+            
+            # Chunks are independent, so their round trips overlap
+            await asyncio.gather(*(asyncio.to_thread(chunk.commit) for chunk in batches))
             
             return clause_ids
             
@@ -230,19 +360,6 @@ class FirestoreClient:
             logger.error(f"Failed to create clauses: {e}")
             raise FirestoreError(f"Failed to create clauses: {e}")
 
-    async def _update_clause_count(self, doc_id: str, count: int) -> bool:
-        """Update the clause count in the document record."""
-        try:
-            doc_ref = self.db.collection("documents").document(doc_id)
-            doc_ref.update({
-                "clause_count": count,
-                "updated_at": firestore.SERVER_TIMESTAMP
-            })
-            return True
-        except Exception as e:
-            logger.warning(f"Failed to update clause count: {e}")
-            return False
-
     async def get_document_clauses(
         self, 
         doc_id: str, 
@@ -250,7 +367,7 @@ class FirestoreClient:
     ) -> List[Dict[str, Any]]:
         """Get all clauses for a document."""
         try:
-            doc_ref = self.db.collection("documents").document(doc_id)
+            doc_ref = self.documents.document(doc_id)
             clauses_collection = doc_ref.collection("clauses")
             query = clauses_collection.order_by(order_by)
             return [clause.to_dict() for clause in query.stream()]
@@ -262,7 +379,7 @@ class FirestoreClient:
     async def get_clause(self, doc_id: str, clause_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific clause by ID."""
         try:
-            doc_ref = self.db.collection("documents").document(doc_id)
+            doc_ref = self.documents.document(doc_id)
             clause_ref = doc_ref.collection("clauses").document(clause_id)
             clause = clause_ref.get()
             return clause.to_dict() if clause.exists else None
@@ -278,7 +395,7 @@ class FirestoreClient:
     ) -> List[Dict[str, Any]]:
         """Search for similar clauses using vector search."""
         try:
-            doc_ref = self.db.collection("documents").document(doc_id)
+            doc_ref = self.documents.document(doc_id)
             clauses_collection = doc_ref.collection("clauses")
             
             # Vector search query
@@ -310,7 +427,7 @@ class FirestoreClient:
             embeddings_map: Dictionary mapping clause_id to embedding vector
         """
         try:
-            doc_ref = self.db.collection("documents").document(doc_id)
+            doc_ref = self.documents.document(doc_id)
             clauses_collection = doc_ref.collection("clauses")
             batch = self.db.batch()
             
@@ -333,6 +450,57 @@ class FirestoreClient:
             logger.error(f"Failed to update clause embeddings: {e}")
             raise FirestoreError(f"Failed to update embeddings: {e}")
 
+    # Clause Summary Memo Operations
+    
+    async def get_clause_summaries(self, summary_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch memoized clause summaries in a single round trip.
+        
+        Args:
+            summary_keys: Keys built from clause text hash, language and options
+            
+        Returns:
+            Mapping of summary key to stored summary result; misses are omitted
+        """
+        if not summary_keys:
+            return {}
+        
+        try:
+            summaries_collection = self.db.collection("clause_summaries")
+            refs = [summaries_collection.document(key) for key in summary_keys]
+            return {
+                snapshot.id: snapshot.to_dict()["result"]
+                for snapshot in self.db.get_all(refs)
+                if snapshot.exists
+            }
+        except GoogleAPIError as e:
+            logger.error(f"Failed to get clause summaries: {e}")
+            raise FirestoreError(f"Failed to get clause summaries: {e}")
+    
+    async def save_clause_summaries(self, summaries: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Store clause summaries for reuse across documents.
+        
+        Args:
+            summaries: Mapping of summary key to summary result
+        """
+        try:
+            summaries_collection = self.db.collection("clause_summaries")
+            batch = self.db.batch()
+            for i, (key, result) in enumerate(summaries.items()):
+                if i and i % FIRESTORE_BATCH_LIMIT == 0:
+                    batch.commit()
+                    batch = self.db.batch()
+                batch.set(summaries_collection.document(key), {
+                    "result": result,
+                    "created_at": firestore.SERVER_TIMESTAMP
+                })
+            if summaries:
+                batch.commit()
+        except GoogleAPIError as e:
+            logger.error(f"Failed to save clause summaries: {e}")
+            raise FirestoreError(f"Failed to save clause summaries: {e}")
+
     # Negotiation Operations
     
     async def save_negotiation_history(
@@ -360,6 +528,13 @@ class FirestoreClient:
     # User Management
     async def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Get user by email."""
+        cache = get_cache()
+        cache_key = CacheKeys.user_by_email(email)
+        cached_user = cache.get(cache_key)
+        if cached_user is not None:
+            # Callers may mutate the returned dict
+            return dict(cached_user)
+        
         try:
             users_ref = self.db.collection("users")
             # Use where with FieldFilter for consistency with other methods, or simple args
@@ -372,6 +547,7 @@ class FirestoreClient:
             doc = results[0]
             user_data = doc.to_dict()
             user_data["id"] = doc.id
+            cache.set(cache_key, dict(user_data), ttl=USER_CACHE_TTL_SECONDS)
             return user_data
         except Exception as e:
             logger.error(f"Failed to get user by email: {e}")
@@ -385,6 +561,8 @@ class FirestoreClient:
             doc_ref = self.db.collection("users").document()
             user_data["created_at"] = firestore.SERVER_TIMESTAMP
             doc_ref.set(user_data)
+            if user_data.get("email"):
+                get_cache().delete(CacheKeys.user_by_email(user_data["email"]))
             return doc_ref.id
         except Exception as e:
             logger.error(f"Failed to create user: {e}")
@@ -518,7 +696,7 @@ class FirestoreClient:
         """
         try:
             docs_ref = (
-                self.db.collection("documents")
+                self.documents
                 .where(filter=FieldFilter("user_id", "==", user_id))
                 .limit(limit)
             )
@@ -4,7 +4,9 @@ Gemini AI client for batch summarization and Q&A
 import logging
 import json
 import asyncio
-from typing import List, Dict, Any, Optional, Union
+import time
+import hashlib
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
 
 from google import genai
@@ -14,9 +16,17 @@ from backend.core.config import get_settings
 from backend.core.logging import get_logger, LogContext, log_execution_time
 # from backend.services.clause_segmenter import ClauseCandidate # Phase 2: To be implemented/ported
 from backend.models.document import SupportedLanguage
+from backend.services.cache_service import CacheKeys, get_cache
+from backend.services.firestore_client import FirestoreClient
 
 logger = get_logger(__name__)
 
+# Summaries depend only on clause text and options, so memoized entries can live long
+SUMMARY_CACHE_TTL_SECONDS = 24 * 3600
+
+# Result fields tied to one summarization call rather than to the clause text
+_PER_CALL_SUMMARY_FIELDS = frozenset({"clause_id", "original_text", "processed_at"})
+
 # DATE: Providing a mock ClauseCandidate for now to avoid import errors until ported
 from dataclasses import dataclass
 @dataclass
@@ -57,6 +67,14 @@ class GeminiClient:
         self.settings = get_settings()
         self._client: Optional[genai.Client] = None
         self._initialized = False
+        self._firestore_client: Optional[FirestoreClient] = None
+    
+    @property
+    def firestore_client(self) -> FirestoreClient:
+        """Firestore client for the clause summary memo, created on first use."""
+        if self._firestore_client is None:
+            self._firestore_client = FirestoreClient()
+        return self._firestore_client
     
     async def initialize(self):
         """Initialize Google GenAI client."""
@@ -95,42 +113,178 @@ class GeminiClient:
         language: SupportedLanguage = SupportedLanguage.ENGLISH
     ) -> List[Dict[str, Any]]:
         """Batch summarize clauses using Gemini with structured JSON output and parallel processing."""
+        start_time = time.monotonic()
+        
+        # Slot each batch back by index so results line up with the input clauses
+        slots: List[Optional[Dict[str, Any]]] = [None] * len(clauses)
+        async for indices, batch_results in self.stream_summarize_clauses(
+            clauses, include_negotiation_tips, language
+        ):
+            for index, result in zip(indices, batch_results):
+                slots[index] = result
+        all_results = [result for result in slots if result is not None]
+        
+        processing_time = (time.monotonic() - start_time) * 1000
+        log_execution_time(logger, "batch_summarization", processing_time)
+        logger.info(f"Batch summarization complete: {len(all_results)} results")
+        return all_results
+    
+    async def stream_summarize_clauses(
+        self,
+        clauses: List[ClauseCandidate],
+        include_negotiation_tips: bool = True,
+        language: SupportedLanguage = SupportedLanguage.ENGLISH
+    ) -> AsyncIterator[Tuple[List[int], List[Dict[str, Any]]]]:
+        """
+        Summarize clauses in parallel batches, yielding each batch as soon as it completes.
+        
+        Clauses summarized before (same text, language and options) are served
+        from the memo first; only the rest are sent to Gemini.
+        
+        Args:
+            clauses: Clauses to summarize
+            include_negotiation_tips: Whether to request negotiation tips
+            language: Summary language
+            
+        Yields:
+            (indices, results) where results[k] is the summary of clauses[indices[k]];
+            batches arrive in completion order, not input order
+        """
         await self.initialize()
-        start_time = asyncio.get_event_loop().time()
         
         # Adaptation: MAX_CLAUSES_PER_BATCH might not be in Brainwave settings yet. Use default.
         max_clauses = getattr(self.settings, 'MAX_CLAUSES_PER_BATCH', 10)
 
         with LogContext(logger, clause_count=len(clauses)):
             logger.info("Starting batch clause summarization")
-            batches = self._create_batches(clauses, max_clauses)
+            
+            summary_keys = [
+                self._summary_key(clause.text, language, include_negotiation_tips) for clause in clauses
+            ]
+            memoized = await self._get_memoized_summaries(summary_keys)
+            hit_indices = [i for i, key in enumerate(summary_keys) if key in memoized]
+            if hit_indices:
+                logger.info(f"Reusing {len(hit_indices)} memoized clause summaries")
+                yield hit_indices, [
+                    self._from_memoized_summary(memoized[summary_keys[i]], clauses[i], i)
+                    for i in hit_indices
+                ]
+            
+            miss_indices = [i for i, key in enumerate(summary_keys) if key not in memoized]
+            batches = self._create_batches([clauses[i] for i in miss_indices], max_clauses)
             
             # Create tasks for all batches to process them in parallel
             batch_tasks = []
+            offset = 0
             for i, batch in enumerate(batches):
                 logger.info(f"Queuing batch {i+1}/{len(batches)} with {len(batch)} clauses")
                 task = asyncio.create_task(
-                    self._process_batch_with_retry(batch, include_negotiation_tips, i+1)
+                    self._process_indexed_batch(
+                        miss_indices[offset:offset + len(batch)], batch, include_negotiation_tips, i+1
+                    )
                 )
                 batch_tasks.append(task)
+                offset += len(batch)
             
             logger.info(f"Processing {len(batch_tasks)} batches concurrently...")
-            all_results = []
             
-            # Process batches as they complete
-            for task in asyncio.as_completed(batch_tasks):
-                try:
-                    batch_results = await task
-                    all_results.extend(batch_results)
-                except Exception as e:
-                    logger.error(f"Batch task failed: {e}")
-                    # Task should have already handled fallback, but add safety check
-                    continue
-            
-            processing_time = (asyncio.get_event_loop().time() - start_time) * 1000
-            log_execution_time(logger, "batch_summarization", processing_time)
-            logger.info(f"Batch summarization complete: {len(all_results)} results")
-            return all_results
+            fresh_summaries: Dict[str, Dict[str, Any]] = {}
+            try:
+                # Process batches as they complete
+                for task in asyncio.as_completed(batch_tasks):
+                    try:
+                        indices, batch_results = await task
+                    except Exception as e:
+                        logger.error(f"Batch task failed: {e}")
+                        # Task should have already handled fallback, but add safety check
+                        continue
+                    for index, result in zip(indices, batch_results):
+                        # Fallbacks are per-failure placeholders; only real summaries are reusable
+                        if result.get("processing_method") == "gemini":
+                            fresh_summaries[summary_keys[index]] = result
+                    yield indices, batch_results
+            finally:
+                # Consumer stopped early or failed; don't leave Gemini calls running
+                for task in batch_tasks:
+                    task.cancel()
+            
+            await self._memoize_summaries(fresh_summaries)
+    
+    async def _process_indexed_batch(
+        self,
+        indices: List[int],
+        batch: List[ClauseCandidate],
+        include_negotiation_tips: bool,
+        batch_num: int
+    ) -> Tuple[List[int], List[Dict[str, Any]]]:
+        """Process a batch and tag its results with the batch's positions in the clause list."""
+        return indices, await self._process_batch_with_retry(batch, include_negotiation_tips, batch_num)
+    
+    @staticmethod
+    def _summary_key(
+        clause_text: str,
+        language: SupportedLanguage,
+        include_negotiation_tips: bool
+    ) -> str:
+        """Memo key for a clause summary: text digest plus everything else that shapes the output."""
+        digest = hashlib.blake2b(clause_text.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{digest}:{language.value}:{int(include_negotiation_tips)}"
+    
+    async def _get_memoized_summaries(self, summary_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Look summary keys up in the process cache, then Firestore for the remainder."""
+        cache = get_cache()
+        memoized = {}
+        for key in set(summary_keys):
+            result = cache.get(CacheKeys.clause_summary(key))
+            if result is not None:
+                memoized[key] = result
+        
+        remaining = [key for key in set(summary_keys) if key not in memoized]
+        if remaining:
+            try:
+                stored = await self.firestore_client.get_clause_summaries(remaining)
+            except Exception as e:
+                # The memo only saves work; summarize everything rather than fail
+                logger.warning(f"Clause summary memo lookup failed: {e}")
+                stored = {}
+            for key, result in stored.items():
+                cache.set(CacheKeys.clause_summary(key), result, ttl=SUMMARY_CACHE_TTL_SECONDS)
+            memoized.update(stored)
+        
+        return memoized
+    
+    async def _memoize_summaries(self, summaries: Dict[str, Dict[str, Any]]) -> None:
+        """Record fresh summaries in the process cache and Firestore."""
+        if not summaries:
+            return
+        
+        # Per-call fields are rebuilt on reuse
+        reusable = {
+            key: {field: value for field, value in result.items() if field not in _PER_CALL_SUMMARY_FIELDS}
+            for key, result in summaries.items()
+        }
+        cache = get_cache()
+        for key, result in reusable.items():
+            cache.set(CacheKeys.clause_summary(key), result, ttl=SUMMARY_CACHE_TTL_SECONDS)
+        
+        try:
+            await self.firestore_client.save_clause_summaries(reusable)
+        except Exception as e:
+            logger.warning(f"Failed to store clause summary memo: {e}")
+    
+    def _from_memoized_summary(
+        self,
+        memoized: Dict[str, Any],
+        clause: ClauseCandidate,
+        index: int
+    ) -> Dict[str, Any]:
+        """Rebuild a full summary result for this clause from a memoized one."""
+        return {
+            **memoized,
+            "clause_id": f"clause_{index}",
+            "original_text": clause.text,
+            "processed_at": datetime.utcnow().isoformat()
+        }
     
     async def _process_batch(
         self, 
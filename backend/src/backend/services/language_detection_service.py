@@ -15,6 +15,20 @@ from backend.models.document import SupportedLanguage
 
 logger = get_logger(__name__)
 
+# Fast English pre-check: how much of a document to sample, and what it must show
+QUICK_SAMPLE_CHARS = 512
+QUICK_ASCII_RATIO = 0.97
+QUICK_MIN_STOPWORDS = 3
+
+_ENGLISH_STOPWORDS = frozenset({
+    "the", "of", "and", "to", "a", "in", "is", "that", "for", "it", "as", "with", "be",
+    "on", "by", "this", "are", "or", "at", "from", "not", "which", "an", "have", "has",
+    "shall", "will", "any", "all", "such", "its", "was", "were", "been", "may", "their",
+    "other", "than", "under", "into", "upon", "each", "if", "no", "these", "those", "our",
+    "herein", "hereby", "party", "parties"
+})
+_WORD_RE = re.compile(r"[a-z]+")
+
 
 class DetectionMethod(str, Enum):
     """Detection method enumeration for tracking accuracy"""
@@ -117,6 +131,38 @@ class LanguageDetectionService:
         except Exception as e:
             logger.warning(f"Google Translate API not available: {e}")
 
+    def quick_is_english(self, text: str) -> Optional[LanguageDetectionResult]:
+        """
+        Decide plainly English text from a short sample without the full detector.
+        
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            English result if the sample is almost all ASCII and contains common
+            English words, None if the full detector is needed
+        """
+        sample = text[:QUICK_SAMPLE_CHARS]
+        if not sample:
+            return None
+        
+        # Non-ASCII characters are dropped by the C-level encode, so the length shrinks by their count
+        ascii_ratio = len(sample.encode("ascii", "ignore")) / len(sample)
+        if ascii_ratio <= QUICK_ASCII_RATIO:
+            return None
+        
+        stopword_hits = len(_ENGLISH_STOPWORDS.intersection(_WORD_RE.findall(sample.lower())))
+        if stopword_hits < QUICK_MIN_STOPWORDS:
+            return None
+        
+        return LanguageDetectionResult(
+            language=SupportedLanguage.ENGLISH,
+            confidence=0.9,
+            method=DetectionMethod.PATTERN_BASED,
+            raw_detection="en",
+            reasoning=f"ASCII ratio {ascii_ratio:.2f} with {stopword_hits} English stopwords"
+        )
+
     async def detect_language_advanced(
         self,
         text: str,
@@ -5,7 +5,7 @@ This service generates strategic alternatives for risky contract clauses,
 empowering users with negotiation leverage and safer contract options.
 """
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import json
 import asyncio
@@ -241,6 +241,63 @@ class NegotiationService:
         
         return successful_responses
     
+    async def stream_batch_alternatives(
+        self,
+        clauses: List[ClauseDetail],
+        document_context: Optional[Dict[str, Any]] = None,
+        user_preferences: Optional[Dict[str, Any]] = None,
+        max_concurrent: int = 5
+    ) -> AsyncIterator[NegotiationResponse]:
+        """
+        Generate alternatives for multiple clauses, yielding each response as soon as it completes.
+        
+        Same filtering and concurrency limit as generate_batch_alternatives, but results
+        arrive in completion order instead of being collected into one list.
+        
+        Args:
+            clauses: List of ClauseDetail objects to generate alternatives for
+            document_context: Additional context about the document
+            user_preferences: User preferences for alternative generation
+            max_concurrent: Maximum number of concurrent generations
+            
+        Yields:
+            NegotiationResponse objects for successful generations
+        """
+        risky_clauses = [
+            c for c in clauses 
+            if c.risk_level in [RiskLevel.MODERATE, RiskLevel.ATTENTION]
+        ]
+        
+        if not risky_clauses:
+            logger.info("No risky clauses found requiring alternatives")
+            return
+        
+        logger.info(f"Streaming alternatives for {len(risky_clauses)} risky clauses")
+        
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def generate_with_semaphore(clause: ClauseDetail) -> NegotiationResponse:
+            async with semaphore:
+                return await self.generate_alternatives(
+                    clause_text=clause.original_text,
+                    clause_category=clause.category,
+                    risk_level=clause.risk_level,
+                    document_context=document_context,
+                    user_preferences=user_preferences
+                )
+        
+        tasks = [asyncio.create_task(generate_with_semaphore(clause)) for clause in risky_clauses]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    yield await next_done
+                except Exception as e:
+                    logger.error(f"Failed to generate alternatives in stream: {e}", exc_info=e)
+        finally:
+            # Client disconnects close the generator early; don't leave generations running
+            for task in tasks:
+                task.cancel()
+    
     def _build_negotiation_prompt(
         self,
         clause_text: str,
@@ -420,7 +477,7 @@ class NegotiationService:
                     risk_reduction=alt_data.get("risk_reduction", ""),
                     implementation_notes=alt_data.get("implementation_notes", ""),
                     confidence=float(alt_data.get("confidence", 0.7)),
-                    alternative_type=alt_type
+                    alternative_type=alt_type.value
                 )
                 
                 # Validate required fields
@@ -452,7 +509,7 @@ class NegotiationService:
                 risk_reduction="N/A",
                 implementation_notes="Please regenerate alternatives or consult a legal professional",
                 confidence=0.0,
-                alternative_type=AlternativeType.BALANCED
+                alternative_type=AlternativeType.BALANCED.value
             )
         ]
     
@@ -117,19 +117,7 @@ class PrivacyService:
         with LogContext(logger, text_length=len(text), mask_mode=mask_mode):
             logger.info("Starting PII detection and masking")
             
-            detected_pii = []
-            
-            # Try DLP API first if enabled and available
-            if getattr(self.settings, 'DLP_ENABLED', False) and DLP_AVAILABLE:
-                try:
-                    detected_pii = await self._detect_pii_with_dlp(text)
-                    logger.info(f"DLP API detected {len(detected_pii)} PII instances")
-                except Exception as e:
-                    logger.warning(f"DLP API failed: {e}. Falling back to regex patterns")
-                    detected_pii = await self._detect_pii_with_fallback(text)
-            else:
-                logger.info("DLP API disabled or unavailable, using fallback patterns")
-                detected_pii = await self._detect_pii_with_fallback(text)
+            detected_pii = await self.detect_pii(text)
             
             # Apply masking
             if detected_pii:
@@ -141,6 +129,32 @@ class PrivacyService:
             
             return masked_text, detected_pii
     
+    async def detect_pii(self, text: str) -> List[PIIMatch]:
+        """
+        Detect PII in text without building a masked copy.
+        
+        Args:
+            text: Input text to scan
+            
+        Returns:
+            Detected PII matches
+        """
+        if not text or not text.strip():
+            return []
+        
+        # Try DLP API first if enabled and available
+        if getattr(self.settings, 'DLP_ENABLED', False) and DLP_AVAILABLE:
+            try:
+                detected_pii = await self._detect_pii_with_dlp(text)
+                logger.info(f"DLP API detected {len(detected_pii)} PII instances")
+                return detected_pii
+            except Exception as e:
+                logger.warning(f"DLP API failed: {e}. Falling back to regex patterns")
+        else:
+            logger.info("DLP API disabled or unavailable, using fallback patterns")
+        
+        return await self._detect_pii_with_fallback(text)
+    
     async def _detect_pii_with_dlp(self, text: str) -> List[PIIMatch]:
         """Detect PII using Google Cloud DLP API."""
         try:
@@ -221,25 +235,35 @@ class PrivacyService:
         # Sort by start position
         sorted_matches = sorted(matches, key=lambda x: x.start_position)
         
+        # Kept matches in insertion order; replaced ones are dropped at the end
         filtered_matches = []
+        replaced = set()
+        # Kept matches that may still overlap later ones, in the same relative order.
+        # Starts only grow, so a match ending at or before the current start is done.
+        active = []
         for match in sorted_matches:
+            active = [existing for existing in active if existing.end_position > match.start_position]
+            
             # Check if this match overlaps with any existing match
             overlaps = False
-            for existing in filtered_matches:
+            for existing in active:
                 if (match.start_position < existing.end_position and 
                     match.end_position > existing.start_position):
                     # Overlapping match found
                     if match.confidence > existing.confidence:
                         # Remove the existing match and add this one
-                        filtered_matches.remove(existing)
+                        replaced.add(id(existing))
+                        active.remove(existing)
                         filtered_matches.append(match)
+                        active.append(match)
                     overlaps = True
                     break
             
             if not overlaps:
                 filtered_matches.append(match)
+                active.append(match)
         
-        return filtered_matches
+        return [match for match in filtered_matches if id(match) not in replaced]
     
     async def _apply_masking(
         self, 
@@ -251,29 +275,43 @@ class PrivacyService:
         if not pii_matches:
             return text
         
-        # Sort matches by position (reverse order to avoid position shifts)
-        sorted_matches = sorted(pii_matches, key=lambda x: x.start_position, reverse=True)
+        sorted_matches = sorted(pii_matches, key=lambda x: x.start_position)
         
-        masked_text = text
+        # Overlapping spans (possible from DLP) keep the original back-to-front splicing
+        if any(
+            following.start_position < preceding.end_position
+            for preceding, following in zip(sorted_matches, sorted_matches[1:])
+        ):
+            masked_text = text
+            for match in sorted(pii_matches, key=lambda x: x.start_position, reverse=True):
+                masked_text = (
+                    masked_text[:match.start_position] + 
+                    self._masking_replacement(match, mask_mode) + 
+                    masked_text[match.end_position:]
+                )
+            return masked_text
         
+        # Disjoint spans: one pass collecting the pieces, joined once
+        parts = []
+        position = 0
         for match in sorted_matches:
-            if mask_mode == "token":
-                replacement = match.replacement_token
-            elif mask_mode == "redact":
-                replacement = "[REDACTED]"
-            elif mask_mode == "hash":
-                replacement = f"[{match.pii_type}_HASH_{hash(match.original_text) % 10000:04d}]"
-            else:
-                replacement = "[MASKED]"
-            
-            # Replace the text
-            masked_text = (
-                masked_text[:match.start_position] + 
-                replacement + 
-                masked_text[match.end_position:]
-            )
+            parts.append(text[position:match.start_position])
+            parts.append(self._masking_replacement(match, mask_mode))
+            position = match.end_position
+        parts.append(text[position:])
         
-        return masked_text
+        return "".join(parts)
+    
+    def _masking_replacement(self, match: PIIMatch, mask_mode: str) -> str:
+        """Replacement text for one PII match under the given masking mode."""
+        if mask_mode == "token":
+            return match.replacement_token
+        elif mask_mode == "redact":
+            return "[REDACTED]"
+        elif mask_mode == "hash":
+            return f"[{match.pii_type}_HASH_{hash(match.original_text) % 10000:04d}]"
+        else:
+            return "[MASKED]"
     
     def _generate_replacement_token(self, pii_type: str) -> str:
         """Generate a replacement token for a PII type."""
@@ -12,7 +12,7 @@ from fastapi import BackgroundTasks, HTTPException
 from google.cloud.firestore import SERVER_TIMESTAMP
 
 from backend.core.config import get_settings
-from backend.models.qa import QuestionRequest, AnswerResponse, SourceCitation
+from backend.models.qa import QuestionRequest, AnswerResponse, SourceCitation, SOURCE_CITATION_LIST_ADAPTER
 from backend.models.chat import (
     ChatQuestionRequest, 
     ChatAnswerResponse, 
@@ -368,12 +368,12 @@ class QAService:
     async def _get_document_clauses(self, doc_id: str) -> List[Dict[str, Any]]:
         # Check cache
         cache_key = CacheKeys.document_clauses(doc_id)
-        clauses = await self.cache_service.get(cache_key)
+        clauses = self.cache_service.get(cache_key)
         
         if not clauses:
             clauses = await self.firestore_client.get_document_clauses(doc_id)
             if clauses:
-                await self.cache_service.set(cache_key, clauses, ttl=1800)
+                self.cache_service.set(cache_key, clauses, ttl=1800)
         
         if not clauses:
             raise HTTPException(status_code=404, detail=f"No clauses found for document {doc_id}")
@@ -418,14 +418,14 @@ class QAService:
                 original_text = clause.get("original_text", "")
                 snippet = original_text[:300] + "..." if len(original_text) > 300 else original_text
                 
-                sources.append(SourceCitation(
-                    clause_id=clause["clause_id"],
-                    clause_number=clause.get("order"),
-                    category=clause.get("category"),
-                    snippet=snippet,
-                    relevance_score=clause.get("similarity", 0.0)
-                ))
-        return sources
+                sources.append({
+                    "clause_id": clause["clause_id"],
+                    "clause_number": clause.get("order"),
+                    "category": clause.get("category"),
+                    "snippet": snippet,
+                    "relevance_score": clause.get("similarity", 0.0)
+                })
+        return SOURCE_CITATION_LIST_ADAPTER.validate_python(sources)
 
     def _format_sources_dict(
         self, 
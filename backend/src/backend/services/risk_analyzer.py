@@ -1,7 +1,11 @@
 """
 Risk analysis service with LLM + keyword approach
 """
+import asyncio
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Tuple, Set
 from dataclasses import dataclass
 from enum import Enum
@@ -60,6 +64,12 @@ class RiskAnalyzer:
         self.risk_keywords = self._initialize_risk_keywords()
         self.compiled_patterns = self._compile_keyword_patterns()
         
+        # Keyword scans are pure in the text; boilerplate clauses repeat across documents
+        self._keyword_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._keyword_cache_size = 4096
+        # Batches run on worker threads, so cache reordering and eviction are serialized
+        self._keyword_cache_lock = threading.Lock()
+        
         # Risk level thresholds
         self.risk_thresholds = {
             "low": 0.3,
@@ -173,17 +183,55 @@ class RiskAnalyzer:
         """
         Analyze risk level of a clause using hybrid approach.
         """
+        return self._assess_clause(clause_text, clause_summary, llm_risk_assessment, clause_category)
+    
+    async def analyze_clauses_batch(
+        self,
+        clause_texts: List[str],
+        clause_summaries: List[Optional[str]],
+        llm_risk_assessments: List[Optional[str]],
+        clause_categories: List[Optional[str]]
+    ) -> List[RiskAssessment]:
+        """
+        Analyze risk for a whole document's clauses in one worker-thread call.
+        
+        Args:
+            clause_texts: Original clause texts
+            clause_summaries: Summary per clause
+            llm_risk_assessments: LLM risk level per clause
+            clause_categories: Category per clause
+            
+        Returns:
+            Risk assessments in input order
+        """
+        logger.info(f"Analyzing risk for {len(clause_texts)} clauses")
+        
+        # map is lazy, so every assessment runs inside the worker thread
+        return await asyncio.to_thread(
+            list,
+            map(self._assess_clause, clause_texts, clause_summaries, llm_risk_assessments, clause_categories)
+        )
+    
+    def _assess_clause(
+        self,
+        clause_text: str,
+        clause_summary: Optional[str],
+        llm_risk_assessment: Optional[str],
+        clause_category: Optional[str]
+    ) -> RiskAssessment:
+        """Run the hybrid risk pipeline for one clause."""
         with LogContext(logger, clause_length=len(clause_text), category=clause_category):
-            logger.info("Analyzing clause risk")
+            # Per-clause detail stays at debug; batch callers log once per batch
+            logger.debug("Analyzing clause risk")
             
             # Step 1: Keyword-based analysis
-            keyword_assessment = await self._analyze_keywords(clause_text, clause_summary)
+            keyword_assessment = self._analyze_keywords(clause_text, clause_summary)
             
             # Step 2: Parse LLM assessment
             llm_assessment = self._parse_llm_assessment(llm_risk_assessment)
             
             # Step 3: Hybrid scoring
-            hybrid_score = await self._calculate_hybrid_score(
+            hybrid_score = self._calculate_hybrid_score(
                 keyword_assessment, llm_assessment, clause_category
             )
             
@@ -191,12 +239,12 @@ class RiskAnalyzer:
             final_risk_level = self._determine_risk_level(hybrid_score)
             
             # Step 5: Conflict detection and review flagging
-            needs_review = await self._detect_conflicts(
+            needs_review = self._detect_conflicts(
                 keyword_assessment, llm_assessment, hybrid_score
             )
             
             # Step 6: Generate explanation
-            explanation = await self._generate_risk_explanation(
+            explanation = self._generate_risk_explanation(
                 keyword_assessment, llm_assessment, final_risk_level, needs_review
             )
             
@@ -214,7 +262,7 @@ class RiskAnalyzer:
             
             return assessment
     
-    async def _analyze_keywords(
+    def _analyze_keywords(
         self, 
         clause_text: str, 
         clause_summary: Optional[str] = None
@@ -224,6 +272,13 @@ class RiskAnalyzer:
         if clause_summary:
             analysis_text += f"\n{clause_summary}"
         
+        cache_key = hashlib.blake2b(analysis_text.encode("utf-8"), digest_size=16).digest()
+        with self._keyword_cache_lock:
+            cached = self._keyword_cache.get(cache_key)
+            if cached is not None:
+                self._keyword_cache.move_to_end(cache_key)
+                return dict(cached)
+        
         detected_keywords = []
         risk_factors = []
         category_scores = {category: 0.0 for category in RiskCategory}
@@ -258,7 +313,7 @@ class RiskAnalyzer:
         if detected_keywords:
             total_risk_score = min(1.0, total_risk_score / len(detected_keywords))
         
-        return {
+        result = {
             "risk_score": total_risk_score,
             "detected_keywords": list(set(detected_keywords)),
             "risk_factors": risk_factors,
@@ -266,6 +321,13 @@ class RiskAnalyzer:
             "keyword_count": len(set(detected_keywords)),
             "method": "keyword_analysis"
         }
+        
+        with self._keyword_cache_lock:
+            self._keyword_cache[cache_key] = result
+            if len(self._keyword_cache) > self._keyword_cache_size:
+                self._keyword_cache.popitem(last=False)
+        
+        return dict(result)
     
     def _parse_llm_assessment(self, llm_risk_assessment: Optional[str]) -> Optional[Dict[str, Any]]:
         """Parse and validate LLM risk assessment."""
@@ -296,7 +358,7 @@ class RiskAnalyzer:
             "method": "llm_assessment"
         }
     
-    async def _calculate_hybrid_score(
+    def _calculate_hybrid_score(
         self, 
         keyword_assessment: Dict[str, Any],
         llm_assessment: Optional[Dict[str, Any]],
@@ -340,7 +402,7 @@ class RiskAnalyzer:
         else:
             return RiskLevel.LOW
     
-    async def _detect_conflicts(
+    def _detect_conflicts(
         self,
         keyword_assessment: Dict[str, Any],
         llm_assessment: Optional[Dict[str, Any]],
@@ -377,7 +439,7 @@ class RiskAnalyzer:
             base_confidence += agreement * 0.2
         return min(1.0, base_confidence)
     
-    async def _generate_risk_explanation(
+    def _generate_risk_explanation(
         self,
         keyword_assessment: Dict[str, Any],
         llm_assessment: Optional[Dict[str, Any]],
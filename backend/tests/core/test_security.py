@@ -0,0 +1,37 @@
+"""Tests for password hashing with the argon2id / legacy bcrypt fallback."""
+
+import pytest
+
+bcrypt = pytest.importorskip("bcrypt")
+pytest.importorskip("argon2")
+pytest.importorskip("jose")
+pytest.importorskip("pydantic_settings")
+
+from backend.core.security import ARGON2_PREFIX, DUMMY_PASSWORD_HASH, get_password_hash, verify_password
+
+
+def test_new_hashes_are_argon2id():
+    hashed = get_password_hash("correct horse")
+    assert hashed.startswith(ARGON2_PREFIX)
+    assert verify_password("correct horse", hashed)
+    assert not verify_password("wrong horse", hashed)
+
+
+def test_accepts_bytes_password_and_hash():
+    hashed = get_password_hash(b"correct horse")
+    assert verify_password(b"correct horse", hashed.encode("utf-8"))
+
+
+def test_legacy_bcrypt_hashes_still_verify():
+    legacy = bcrypt.hashpw(b"correct horse", bcrypt.gensalt(rounds=4)).decode("utf-8")
+    assert verify_password("correct horse", legacy)
+    assert not verify_password("wrong horse", legacy)
+
+
+def test_malformed_argon2_hash_is_rejected():
+    assert not verify_password("correct horse", ARGON2_PREFIX + "id$not-a-hash")
+
+
+def test_dummy_hash_rejects_real_passwords():
+    assert DUMMY_PASSWORD_HASH.startswith(ARGON2_PREFIX)
+    assert not verify_password("correct horse", DUMMY_PASSWORD_HASH)
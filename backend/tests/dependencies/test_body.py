@@ -0,0 +1,60 @@
+"""Tests for the json_body request dependency and its OpenAPI documentation."""
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from backend.dependencies.body import add_json_body_schemas, json_body, json_body_openapi
+
+
+class Item(BaseModel):
+    name: str
+
+
+class Order(BaseModel):
+    item: Item
+    quantity: int
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+
+    @app.post("/orders", openapi_extra=json_body_openapi(Order))
+    async def create_order(order: Order = Depends(json_body(Order))):
+        return {"quantity": order.quantity}
+
+    def openapi():
+        if app.openapi_schema is None:
+            add_json_body_schemas(FastAPI.openapi(app))
+        return app.openapi_schema
+
+    app.openapi = openapi
+    return TestClient(app)
+
+
+def test_valid_body_is_parsed(client):
+    response = client.post("/orders", json={"item": {"name": "a"}, "quantity": 2})
+    assert response.status_code == 200
+    assert response.json() == {"quantity": 2}
+
+
+def test_validation_errors_are_located_in_body(client):
+    response = client.post("/orders", json={"item": {}, "quantity": "x"})
+    assert response.status_code == 422
+    locs = {tuple(error["loc"]) for error in response.json()["detail"]}
+    assert locs == {("body", "item", "name"), ("body", "quantity")}
+
+
+def test_request_model_is_documented(client):
+    schema = client.get("/openapi.json").json()
+    body = schema["paths"]["/orders"]["post"]["requestBody"]
+    assert body["content"]["application/json"]["schema"] == {"$ref": "#/components/schemas/Order"}
+    components = schema["components"]["schemas"]
+    assert components["Order"]["properties"]["item"] == {"$ref": "#/components/schemas/Item"}
+    assert "Item" in components
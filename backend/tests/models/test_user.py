@@ -0,0 +1,28 @@
+"""Tests for user request models."""
+
+import pytest
+
+pytest.importorskip("pydantic")
+pytest.importorskip("email_validator")
+
+from pydantic import ValidationError
+
+from backend.models.user import UserCreate, UserLogin
+
+
+@pytest.mark.parametrize(
+    "email",
+    ["Foo@Example.COM", "foo@example.com", "First.Last@Sub.Example.Org", "josé@Exämple.de"],
+)
+def test_login_email_matches_registered_form(email):
+    registered = UserCreate(email=email, password="secret").email
+    assert UserLogin(email=email, password="secret").email == registered
+
+
+def test_login_keeps_local_part_case():
+    assert UserLogin(email="Foo@Example.COM", password="secret").email == "Foo@example.com"
+
+
+def test_login_rejects_malformed_email():
+    with pytest.raises(ValidationError):
+        UserLogin(email="not-an-email", password="secret")
@@ -0,0 +1,28 @@
+"""Tests for the cache admission sketch."""
+
+from backend.services.cache_service import FrequencySketch
+
+
+def test_sketch_counts_and_caps_accesses():
+    sketch = FrequencySketch(capacity=64)
+    for _ in range(3):
+        sketch.increment("a")
+    assert sketch.estimate("a") == 3
+    assert sketch.estimate("b") == 0
+
+    for _ in range(2 * FrequencySketch.MAX_COUNT):
+        sketch.increment("a")
+    assert sketch.estimate("a") <= FrequencySketch.MAX_COUNT
+
+
+def test_sketch_rows_spread_keys_sharing_low_hash_bits():
+    # Keys routed to one ShardedCache shard agree on their low hash bits
+    sketch = FrequencySketch(capacity=4096)
+    width = sketch._mask + 1
+    keys = [key for key in (f"doc:{i}" for i in range(100_000)) if hash(key) & 15 == 3][:2000]
+
+    for row in range(FrequencySketch.ROWS):
+        used = {sketch._indexes(key)[row] for key in keys}
+        assert max(used) < width
+        # Random placement of 2000 keys into 16384 slots fills about 1885
+        assert len(used) > 1700
@@ -0,0 +1,50 @@
+"""Regression tests for clause text cleaning and heading extraction."""
+
+import pytest
+
+from backend.services.clause_segmenter import ClauseSegmenter
+
+
+@pytest.fixture
+def segmenter() -> ClauseSegmenter:
+    return ClauseSegmenter()
+
+
+def test_clean_keeps_page_reference_inside_body_text(segmenter):
+    text = (
+        "Services described on Page 3 of Schedule A, including support.\n"
+        "The Supplier shall deliver them."
+    )
+    assert segmenter._clean_clause_text(text) == (
+        "Services described on Page 3 of Schedule A, including support. "
+        "The Supplier shall deliver them."
+    )
+
+
+def test_clean_keeps_line_starting_with_page_reference(segmenter):
+    text = "Page 3 of Schedule A applies.\nNothing else."
+    assert segmenter._clean_clause_text(text) == "Page 3 of Schedule A applies. Nothing else."
+
+
+@pytest.mark.parametrize("footer", ["Page 3", "  Page 4 of 10  ", "Page 12 of 12"])
+def test_clean_removes_whole_page_footer_lines(segmenter, footer):
+    text = f"First line.\n{footer}\nSecond line."
+    assert segmenter._clean_clause_text(text) == "First line. Second line."
+
+
+def test_clean_removes_trailing_page_footer(segmenter):
+    assert segmenter._clean_clause_text("Last line.\nPage 7") == "Last line."
+
+
+@pytest.mark.parametrize(
+    "line",
+    ["1. Definitions", "१. परिभाषाएँ", "১. সংজ্ঞা", "٣. التعريفات"],
+)
+def test_extract_heading_accepts_any_decimal_digit(segmenter, line):
+    assert segmenter._extract_heading_from_text(line) == line
+
+
+@pytest.mark.parametrize("line", ["- bullet point", "“Quoted” text", "... continued"])
+def test_extract_heading_prefilter_matches_full_regex(segmenter, line):
+    expected = segmenter._heading_re.match(line.strip()) is not None
+    assert (segmenter._extract_heading_from_text(line) is not None) == expected
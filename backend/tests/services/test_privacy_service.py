@@ -0,0 +1,92 @@
+"""Regression tests for PII overlap removal and masking."""
+
+import asyncio
+import random
+
+import pytest
+
+pytest.importorskip("pydantic_settings")
+
+from backend.services.privacy_service import PIIMatch, PrivacyService
+
+MASK_MODES = ["token", "redact", "hash", "other"]
+
+
+def _reference_remove_overlapping(matches):
+    # Original quadratic scan over every kept match
+    filtered = []
+    for match in sorted(matches, key=lambda x: x.start_position):
+        overlaps = False
+        for existing in filtered:
+            if (match.start_position < existing.end_position and
+                    match.end_position > existing.start_position):
+                if match.confidence > existing.confidence:
+                    filtered.remove(existing)
+                    filtered.append(match)
+                overlaps = True
+                break
+        if not overlaps:
+            filtered.append(match)
+    return filtered
+
+
+def _reference_apply_masking(service, text, matches, mask_mode):
+    # Original back-to-front splicing of every match
+    masked = text
+    for match in sorted(matches, key=lambda x: x.start_position, reverse=True):
+        masked = (
+            masked[:match.start_position] +
+            service._masking_replacement(match, mask_mode) +
+            masked[match.end_position:]
+        )
+    return masked
+
+
+def _random_matches(rng, text_length, count):
+    matches = []
+    for i in range(count):
+        start = rng.randrange(text_length)
+        end = min(text_length, start + rng.randint(1, 12))
+        matches.append(PIIMatch(
+            pii_type=rng.choice(["EMAIL", "PHONE", "SSN"]),
+            original_text=f"pii{i}",
+            start_position=start,
+            end_position=end,
+            confidence=rng.choice([0.5, 0.7, 0.9]),
+            replacement_token=f"[TOKEN_{i}]",
+        ))
+    return matches
+
+
+@pytest.fixture
+def service() -> PrivacyService:
+    return PrivacyService()
+
+
+def test_remove_overlapping_matches_matches_reference(service):
+    rng = random.Random(1234)
+    for _ in range(500):
+        matches = _random_matches(rng, rng.randint(1, 80), rng.randint(0, 25))
+        expected = _reference_remove_overlapping(matches)
+        assert service._remove_overlapping_matches(matches) == expected
+
+
+@pytest.mark.parametrize("mask_mode", MASK_MODES)
+def test_apply_masking_matches_reference(service, mask_mode):
+    rng = random.Random(mask_mode)
+    for _ in range(300):
+        text = "".join(rng.choice("abc @.-0123456789") for _ in range(rng.randint(1, 80)))
+        matches = _random_matches(rng, len(text), rng.randint(1, 10))
+        # Both the disjoint fast path and the overlapping splice path get exercised
+        for candidate in (matches, service._remove_overlapping_matches(matches)):
+            expected = _reference_apply_masking(service, text, candidate, mask_mode)
+            assert asyncio.run(service._apply_masking(text, candidate, mask_mode)) == expected
+
+
+def test_detect_and_mask_fallback(service):
+    text = "Contact jane.doe@example.com or 555-123-4567."
+    matches = asyncio.run(service._detect_pii_with_fallback(text))
+    masked = asyncio.run(service._apply_masking(text, matches, "redact"))
+    assert "jane.doe@example.com" not in masked
+    assert "555-123-4567" not in masked
+    assert masked == "Contact [REDACTED] or [REDACTED]."